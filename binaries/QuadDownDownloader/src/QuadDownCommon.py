@@ -0,0 +1,139 @@
+# ==============================================================================
+# QuadDown Downloader Common
+# ==============================================================================
+# Pieces shared by the Downloader and the GoFile Helper: the NDJSON progress
+# stream and the machine-wide bandwidth cap. PyInstaller bundles this module
+# into both binaries, since it sits next to their scripts.
+# The Torrent Handler is built from its own folder and keeps a copy of
+# ProgressStream; edit that copy together with this one.
+
+import os
+import sys
+import json
+import time
+import struct
+import logging
+import threading
+from typing import Dict, Tuple
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class ProgressStream:
+    """
+    Opt-in NDJSON progress events on stdout, one compact JSON object per line.
+    
+    While enabled, console logging and prints move to stderr so stdout only
+    carries events, and callers skip writing progress into game_info (phase
+    changes and completion are still written). If the reader goes away the
+    stream disables itself and callers fall back to the JSON file.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self._out = None
+        self._lock = threading.Lock()
+    
+    def enable(self):
+        self._out = sys.stdout
+        sys.stdout = sys.stderr
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream is self._out:
+                handler.setStream(sys.stderr)
+        self.enabled = True
+    
+    def emit(self, event: str, **fields) -> bool:
+        """Write one event; False if streaming is off or the reader is gone."""
+        if not self.enabled:
+            return False
+        line = json.dumps({"event": event, **fields}, separators=(',', ':'))
+        with self._lock:
+            try:
+                self._out.write(line + "\n")
+                self._out.flush()
+                return True
+            except (OSError, ValueError) as e:
+                self.enabled = False
+                logging.warning(f"[ProgressStream] Progress reader went away, falling back to game_info: {e}")
+                return False
+
+progress_stream = ProgressStream()
+
+
+class BandwidthLimiter:
+    """
+    Token-bucket download cap shared by every thread and every QuadDown
+    process on the machine.
+    
+    Implemented as GCRA: the only state is the time at which the capped link
+    next falls idle, one double kept in a small file next to the log and
+    updated under an OS file lock. Each chunk pushes that time forward by
+    its size / rate and sleeps until its slot, so any number of concurrent
+    downloads split the cap between them, and the cost per chunk is one
+    short locked read-modify-write.
+    """
+    
+    STATE_FILE = "bandwidth.state"
+    BURST_SECONDS = 0.25  # Idle credit a download may spend at once
+    MAX_BACKLOG = 10.0  # Reset reservations this far ahead (clock jumps, rate changes)
+    _instances: Dict[Tuple[float, str], "BandwidthLimiter"] = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, rate: float, path: str) -> "BandwidthLimiter":
+        """One limiter per rate and state file in this process."""
+        with cls._instances_lock:
+            key = (rate, path)
+            if key not in cls._instances:
+                cls._instances[key] = cls(rate, path)
+            return cls._instances[key]
+    
+    def __init__(self, rate: float, path: str):
+        self.rate = rate  # Bytes per second
+        self.path = path
+        self.waited = 0.0  # Seconds spent throttled, for logging
+        self._lock = threading.Lock()  # The file lock doesn't exclude threads sharing a descriptor
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+    
+    def chunk_size(self, maximum: int) -> int:
+        """Read size that keeps each reservation near 50 ms of the cap."""
+        return int(max(16 * 1024, min(maximum, self.rate / 20)))
+    
+    def consume(self, nbytes: int):
+        """Account for `nbytes` received, sleeping as long as the shared cap requires."""
+        now = time.time()
+        cost = nbytes / self.rate
+        with self._lock:
+            self._lock_state()
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                raw = os.read(self._fd, 8)
+                idle_at = struct.unpack('d', raw)[0] if len(raw) == 8 else 0.0
+                if idle_at - now > self.MAX_BACKLOG:
+                    idle_at = now
+                idle_at = max(idle_at, now) + cost
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, struct.pack('d', idle_at))
+            finally:
+                self._unlock_state()
+        wait = idle_at - now - self.BURST_SECONDS
+        if wait > 0:
+            self.waited += wait
+            time.sleep(wait)
+    
+    def _lock_state(self):
+        if sys.platform == "win32":
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+    
+    def _unlock_state(self):
+        if sys.platform == "win32":
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
@@ -23,18 +23,38 @@ import shutil
 import string
 import hashlib
 import logging
+import ctypes
+import errno
 import random
 import re
+import copy
+import glob
 import atexit
+import secrets
+import socket
+import socketserver
 import subprocess
+import threading
+import queue
 import zipfile
-from tempfile import NamedTemporaryFile
+import zlib
+import struct
+import http.client
+from tempfile import NamedTemporaryFile, mkdtemp
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from argparse import ArgumentParser
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List
+from urllib.parse import urlparse
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError
 from urllib3.util.retry import Retry
 
+if sys.platform == "win32":
+    import msvcrt
+
+from QuadDownCommon import progress_stream, BandwidthLimiter
+
 
 # Logging Setup
 
@@ -119,19 +139,31 @@ def read_size(size: int, decimal_places: int = 2) -> str:
         i += 1
     return f"{size_float:.{decimal_places}f} {units[i]}"
 
+def format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+
 def sanitize_folder_name(name: str) -> str:
     valid_chars = "-_.() %s%s" % (string.ascii_letters, string.digits)
     return ''.join(c for c in name if c in valid_chars)
 
 def safe_write_json(filepath: str, data: Dict[str, Any]):
     """Safely write JSON with atomic replace and retry logic."""
+    safe_write_text(filepath, json.dumps(data, indent=4))
+
+def safe_write_text(filepath: str, text: str):
+    """Safely write text with atomic replace and retry logic."""
     temp_dir = os.path.dirname(filepath)
     temp_file_path = None
     retry_attempts = 5
     
     try:
         with NamedTemporaryFile('w', delete=False, dir=temp_dir, suffix='.tmp') as temp_file:
-            json.dump(data, temp_file, indent=4)
+            temp_file.write(text)
             temp_file_path = temp_file.name
         
         for attempt in range(retry_attempts):
@@ -142,7 +174,7 @@ def safe_write_json(filepath: str, data: Dict[str, Any]):
                 wait_time = 0.5 * (2 ** attempt) + random.uniform(0, 0.2)
                 time.sleep(wait_time)
                 if attempt == retry_attempts - 1:
-                    logging.error(f"safe_write_json: Could not write to {filepath}: {e}")
+                    logging.error(f"safe_write_text: Could not write to {filepath}: {e}")
     finally:
         if temp_file_path and os.path.exists(temp_file_path):
             try:
@@ -150,6 +182,236 @@ def safe_write_json(filepath: str, data: Dict[str, Any]):
             except Exception:
                 pass
 
+class StateWriter:
+    """
+    Background writer for a JSON state file such as game_info.
+    
+    Callers mutate the dict in place and call ``submit()``, which never
+    blocks. The writer thread serializes the latest state at most once per
+    ``interval`` and only touches the disk when the text actually changed,
+    so bursts of updates coalesce into one write and the PermissionError
+    backoff in safe_write_text never stalls a download thread. ``flush()``
+    writes synchronously for phase changes that must be on disk right away.
+    """
+    
+    def __init__(self, path: str, data: Dict[str, Any], interval: float = 0.5):
+        self.path = path
+        self.data = data
+        self.interval = interval
+        self.writes = 0
+        self.skipped = 0  # Submissions that serialized to unchanged content
+        self._last_text: Optional[str] = None
+        self._last_write = 0.0
+        self._dirty = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def submit(self):
+        """Mark the state as changed; it will be written within `interval`."""
+        with self._cond:
+            self._dirty = True
+            self._cond.notify()
+    
+    def flush(self):
+        """Write the current state now if it differs from what is on disk."""
+        with self._cond:
+            self._dirty = False
+        self._write()
+    
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self.flush()
+    
+    def _serialize(self) -> str:
+        # Other threads may add keys mid-dump; retry on a consistent snapshot
+        for _ in range(10):
+            try:
+                return json.dumps(self.data, indent=4)
+            except RuntimeError:
+                time.sleep(0.01)
+        return json.dumps(copy.deepcopy(self.data), indent=4)
+    
+    def _write(self):
+        with self._write_lock:
+            text = self._serialize()
+            if text == self._last_text:
+                self.skipped += 1
+                return
+            safe_write_text(self.path, text)
+            self._last_text = text
+            self._last_write = time.time()
+            self.writes += 1
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                delay = self._last_write + self.interval - time.time()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                self._dirty = False
+            try:
+                self._write()
+            except Exception as e:
+                logging.error(f"[StateWriter] Could not write {self.path}: {e}")
+
+
+FALLOC_FL_KEEP_SIZE = 0x01
+FALLOC_FL_PUNCH_HOLE = 0x02
+
+def _fallocate(fd: int, size: int, mode: int = 0, offset: int = 0) -> bool:
+    """Reserve (or with PUNCH_HOLE, free) blocks with the Linux fallocate syscall; False if the filesystem can't."""
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fallocate = getattr(libc, 'fallocate64', None) or libc.fallocate
+        fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+    except (OSError, AttributeError):
+        return False
+    if fallocate(fd, mode, offset, size) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err == errno.ENOSPC:
+        raise OSError(errno.ENOSPC, f"Not enough disk space to reserve {read_size(size)}")
+    return False  # EOPNOTSUPP on FUSE/NTFS-3g etc.
+
+def preallocate_file(path: str, size: int):
+    """
+    Create or grow `path` to `size` bytes, reserving the space up front where
+    the platform allows so a full disk fails now rather than near the end.
+    """
+    existing = os.path.getsize(path) if os.path.exists(path) else 0
+    free = shutil.disk_usage(os.path.dirname(os.path.abspath(path))).free
+    if size - existing > free:
+        raise OSError(errno.ENOSPC, f"Not enough disk space: need {read_size(size - existing)}, {read_size(free)} free")
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        if sys.platform.startswith('linux') and _fallocate(fd, size):
+            return
+        if existing < size:
+            # Windows extends NTFS files without zero-filling; elsewhere this may be sparse
+            os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+FSCTL_SET_SPARSE = 0x900C4
+FSCTL_SET_ZERO_DATA = 0x980C8
+
+def release_file_range(path: str, offset: int, length: int) -> bool:
+    """
+    Give the disk blocks behind [offset, offset+length) of `path` back to the
+    filesystem without changing the file's size; the range then reads as
+    zeros. False where the platform or filesystem can't.
+    """
+    if length <= 0:
+        return True
+    try:
+        fd = os.open(path, os.O_RDWR | getattr(os, 'O_BINARY', 0))
+    except OSError:
+        return False
+    try:
+        if sys.platform.startswith('linux'):
+            return _fallocate(fd, length, FALLOC_FL_PUNCH_HOLE | FALLOC_FL_KEEP_SIZE, offset)
+        if sys.platform == 'win32':
+            # NTFS frees zeroed ranges only in sparse files
+            from ctypes import wintypes
+            device_io = ctypes.windll.kernel32.DeviceIoControl
+            device_io.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD,
+                                  ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p]
+            handle = msvcrt.get_osfhandle(fd)
+            returned = wintypes.DWORD()
+            if not device_io(handle, FSCTL_SET_SPARSE, None, 0, None, 0, ctypes.byref(returned), None):
+                return False
+            zero_data = ctypes.create_string_buffer(struct.pack('<qq', offset, offset + length), 16)
+            return bool(device_io(handle, FSCTL_SET_ZERO_DATA, zero_data, 16, None, 0, ctypes.byref(returned), None))
+    except (OSError, AttributeError):
+        pass
+    finally:
+        os.close(fd)
+    return False
+
+DROP_CACHE_INTERVAL = 64 * 1024 * 1024  # Release cached file pages every 64 MB
+
+def drop_page_cache(fd: int, offset: int = 0, length: int = 0):
+    """
+    Tell the kernel the clean cached pages of `fd` in [offset, offset+length)
+    won't be needed again (length 0 means to the end of the file). Only
+    POSIX systems expose this; elsewhere it is a no-op.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+class CacheDroppingReader:
+    """
+    Read-only file wrapper that drops the pages behind the read position
+    every DROP_CACHE_INTERVAL bytes, for archives consumed front to back.
+    """
+    
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._since_drop = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._file.read(size)
+        self._since_drop += len(data)
+        if self._since_drop >= DROP_CACHE_INTERVAL:
+            # Keep the current window; zipfile may step back a little for headers
+            consumed = self._file.tell() - DROP_CACHE_INTERVAL
+            if consumed > 0:
+                drop_page_cache(self._file.fileno(), 0, consumed)
+            self._since_drop = 0
+        return data
+    
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._file.seek(offset, whence)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def close(self):
+        drop_page_cache(self._file.fileno())
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+def drop_archive_cache(archive_path: str):
+    """Drop cached pages of an archive and any sibling RAR volumes."""
+    volume = re.match(r'(.*)\.part\d+\.rar$', archive_path, re.IGNORECASE)
+    if volume:
+        paths = glob.glob(glob.escape(volume.group(1)) + '.part*.rar')
+    else:
+        paths = [archive_path] + glob.glob(glob.escape(os.path.splitext(archive_path)[0]) + '.r[0-9][0-9]')
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        except OSError:
+            continue
+        try:
+            drop_page_cache(fd)
+        finally:
+            os.close(fd)
+
 def get_settings_path() -> Optional[str]:
     """Get the path to QuadDown settings file."""
     if sys.platform == 'win32':
@@ -179,6 +441,93 @@ def load_settings() -> Dict[str, Any]:
             logging.error(f"Could not read settings: {e}")
     return {}
 
+def get_download_connections(settings: Dict[str, Any]) -> int:
+    """Number of parallel connections to use per file, from the download settings."""
+    if settings.get('singleStream', True):
+        return 1
+    try:
+        connections = int(settings.get('threadCount', 1))
+    except (TypeError, ValueError):
+        return 1
+    return max(1, min(connections, ChunkedDownloader.MAX_CONNECTIONS))
+
+def get_write_buffer_size(settings: Dict[str, Any]) -> int:
+    """Memory cap in bytes for data waiting to be written to disk."""
+    try:
+        megabytes = int(settings.get('downloadBufferMB', 64))
+    except (TypeError, ValueError):
+        megabytes = 64
+    return max(4, megabytes) * 1024 * 1024
+
+def get_zero_copy(settings: Dict[str, Any]) -> bool:
+    """Whether to receive into reusable buffers instead of per-chunk allocations."""
+    return bool(settings.get('downloadZeroCopy', True))
+
+def get_state_write_interval(settings: Dict[str, Any]) -> float:
+    """Minimum seconds between game_info writes."""
+    try:
+        milliseconds = int(settings.get('progressWriteIntervalMs', 500))
+    except (TypeError, ValueError):
+        milliseconds = 500
+    return max(100, milliseconds) / 1000
+
+def get_stall_settings(settings: Dict[str, Any]) -> Tuple[float, float]:
+    """(bytes/s floor, seconds) below which a connection counts as stalled; a 0 floor disables it."""
+    try:
+        floor = max(0.0, float(settings.get('stallRateFloorKBps', 32))) * 1024
+    except (TypeError, ValueError):
+        floor = 32 * 1024
+    try:
+        window = max(5.0, float(settings.get('stallWindowSeconds', 20)))
+    except (TypeError, ValueError):
+        window = 20.0
+    return floor, window
+
+def get_bandwidth_limiter(settings: Dict[str, Any]) -> Optional["BandwidthLimiter"]:
+    """The machine-wide limiter for the downloadLimit setting (KB/s), or None when unlimited."""
+    try:
+        limit = float(settings.get('downloadLimit', 0) or 0)
+    except (TypeError, ValueError):
+        return None
+    if limit <= 0:
+        return None
+    path = os.path.join(os.path.dirname(LOG_PATH), BandwidthLimiter.STATE_FILE)
+    return BandwidthLimiter.shared(limit * 1024, path)
+
+def get_stream_extract(settings: Dict[str, Any]) -> bool:
+    """Whether to extract ZIP archives while they are still downloading."""
+    return bool(settings.get('streamExtract', False))
+
+def get_keep_archive(settings: Dict[str, Any]) -> bool:
+    """Whether to keep the downloaded archive once it has been extracted."""
+    return bool(settings.get('keepArchive', False))
+
+def get_extraction_threads(settings: Dict[str, Any]) -> int:
+    """Threads extracting ZIP members at once; 0 (the default) picks one per core, up to 8."""
+    try:
+        threads = int(settings.get('extractionThreads', 0))
+    except (TypeError, ValueError):
+        threads = 0
+    if threads <= 0:
+        threads = min(8, os.cpu_count() or 1)
+    return max(1, min(threads, 32))
+
+def get_archive_concurrency(settings: Dict[str, Any]) -> int:
+    """Archives extracted at the same time; they share the extractionThreads budget."""
+    try:
+        concurrency = int(settings.get('archiveConcurrency', 2))
+    except (TypeError, ValueError):
+        concurrency = 2
+    return max(1, min(concurrency, 8))
+
+def get_zip_prevalidate(settings: Dict[str, Any]) -> bool:
+    """Whether to test every ZIP member's CRC in a separate pass before extracting."""
+    return bool(settings.get('zipPrevalidate', False))
+
+def get_page_cache_friendly(settings: Dict[str, Any]) -> bool:
+    """Whether to release cached pages of downloaded and extracted archives as they're done with."""
+    return bool(settings.get('pageCacheFriendly', False))
+
 def handleerror(game_info: Dict, game_info_path: str, error: Any):
     """Handle download errors by updating game info."""
     game_info['online'] = ""
@@ -194,13 +543,23 @@ def handleerror(game_info: Dict, game_info_path: str, error: Any):
     else:
         logging.error(f"[handleerror] downloadingData missing. Exception: {error}")
     safe_write_json(game_info_path, game_info)
+    progress_stream.emit("error", message=str(error))
+
+def handlestopped(game_info: Dict, game_info_path: str):
+    """Record a download the user cancelled the way the app marks one it stopped."""
+    game_info['downloadingData'] = {"stopped": True}
+    safe_write_json(game_info_path, game_info)
+    progress_stream.emit("phase", phase="stopped")
 
 
 # Robust HTTP Session with Connection Pooling
 
 
-def create_robust_session() -> requests.Session:
-    """Create a requests session with retry logic and connection pooling."""
+def create_robust_session(pool_maxsize: int = 10, retries: bool = True) -> requests.Session:
+    """
+    Create a requests session with connection pooling. With retries=False,
+    urllib3 makes a single attempt and the caller's RetryBudget decides.
+    """
     session = requests.Session()
     
     # Configure retry strategy
@@ -209,13 +568,13 @@ def create_robust_session() -> requests.Session:
         backoff_factor=1,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["HEAD", "GET", "OPTIONS"]
-    )
+    ) if retries else Retry(total=0, read=False, redirect=False)
     
     # Mount adapters with connection pooling
     adapter = HTTPAdapter(
         max_retries=retry_strategy,
         pool_connections=10,
-        pool_maxsize=10
+        pool_maxsize=max(pool_maxsize, 10)
     )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
@@ -234,31 +593,847 @@ def create_robust_session() -> requests.Session:
 # Chunked Downloader Core
 
 
+class DownloadSegment:
+    """A byte range [start, end) of the destination file fetched over one connection."""
+    
+    def __init__(self, index: int, start: int, end: int):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.offset = start  # Next byte to request
+        self.written = start  # Bytes before this are flushed to the .part file
+        self.active = False  # A connection is currently fetching this range
+        self.retired = False  # Its connection was stopped and the rest requeued
+        self.rate = 0.0  # Smoothed bytes/s, sampled by the scheduler
+        self.mirror: Optional["DownloadMirror"] = None  # Where the current connection fetches from
+        self._sample_offset = start
+    
+    @property
+    def remaining(self) -> int:
+        return max(0, self.end - self.offset)
+    
+    @property
+    def done(self) -> bool:
+        return self.offset >= self.end
+    
+    def mark_written(self, count: int):
+        self.written += count
+
+
+class RangeNotSupportedError(Exception):
+    """Raised when a server answers a ranged GET with the full body."""
+
+
+class DownloadMirror:
+    """One URL serving the archive, with the health used to share ranges between mirrors."""
+    
+    MAX_FAILURES = 3  # Consecutive errors before a mirror is dropped for this download
+    
+    def __init__(self, url: str):
+        self.url = url
+        self.host = urlparse(url).netloc
+        self.active = 0  # Connections currently fetching from it
+        self.rate = 0.0  # Smoothed bytes/s per connection, sampled by the scheduler
+        self.failures = 0
+        self.received = 0
+        self.dropped = False
+        self.benched_until = 0.0  # Too slow; not picked again before this time
+    
+    def usable(self, now: float) -> bool:
+        return not self.dropped and now >= self.benched_until
+
+
+class DownloadJournal:
+    """
+    Sidecar record of the byte ranges of a .part file that are safely on disk.
+    
+    Data is fsynced before the ranges that cover it are written, and the journal
+    itself is replaced atomically, so after a hard kill every recorded range can
+    be trusted and only the gaps between them are fetched again.
+    """
+    
+    SUFFIX = ".journal"
+    VERSION = 1
+    
+    def __init__(self, path: str, total_size: int):
+        self.path = path
+        self.total_size = total_size
+        self.completed: List[Tuple[int, int]] = []
+    
+    @staticmethod
+    def merge(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(r for r in ranges if r[1] > r[0]):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+    
+    def load(self, part_path: str) -> bool:
+        """Load completed ranges; False if the journal is missing or doesn't match the .part file."""
+        if not os.path.exists(self.path) or not os.path.exists(part_path):
+            return False
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') != self.VERSION or data.get('totalSize') != self.total_size:
+                logging.warning(f"[DownloadJournal] Journal does not match remote file, discarding")
+                return False
+            if os.path.getsize(part_path) != self.total_size:
+                logging.warning(f"[DownloadJournal] Partial file size changed, discarding journal")
+                return False
+            self.completed = self.merge([
+                (max(0, int(start)), min(self.total_size, int(end)))
+                for start, end in data.get('completed', [])
+            ])
+            logging.info(f"[DownloadJournal] Resuming with {read_size(self.completed_bytes())} verified in {len(self.completed)} ranges")
+            return True
+        except Exception as e:
+            logging.warning(f"[DownloadJournal] Could not read journal {self.path}: {e}")
+            return False
+    
+    @classmethod
+    def recorded_size(cls, path: str) -> Optional[int]:
+        """Remote size a journal was written for, without validating it."""
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == cls.VERSION and isinstance(data.get('totalSize'), int):
+                return data['totalSize']
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    def reset(self, completed: Optional[List[Tuple[int, int]]] = None):
+        self.completed = self.merge(completed or [])
+    
+    def completed_bytes(self) -> int:
+        return sum(end - start for start, end in self.completed)
+    
+    def missing_ranges(self) -> List[Tuple[int, int]]:
+        gaps = []
+        cursor = 0
+        for start, end in self.completed:
+            if start > cursor:
+                gaps.append((cursor, start))
+            cursor = max(cursor, end)
+        if cursor < self.total_size:
+            gaps.append((cursor, self.total_size))
+        return gaps
+    
+    def save(self, segments: List[DownloadSegment]):
+        """Fsync the .part data, then record every range written so far."""
+        ranges = self.completed + [(seg.start, seg.written) for seg in segments]
+        part_path = self.path[:-len(self.SUFFIX)]
+        if os.path.exists(part_path):
+            with open(part_path, 'rb+') as f:
+                os.fsync(f.fileno())
+        self.completed = self.merge(ranges)
+        safe_write_json(self.path, {
+            "version": self.VERSION,
+            "totalSize": self.total_size,
+            "completed": [list(r) for r in self.completed]
+        })
+    
+    def remove(self):
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except Exception as e:
+            logging.warning(f"[DownloadJournal] Could not remove journal: {e}")
+
+
+class BufferPool:
+    """
+    Fixed set of reusable receive buffers.
+    
+    Buffers are allocated lazily up to ``count`` and then recycled, so a whole
+    download costs a handful of allocations instead of one per chunk. When every
+    buffer is in flight ``acquire()`` blocks, which bounds receive memory.
+    """
+    
+    def __init__(self, buffer_size: int, count: int):
+        self.buffer_size = buffer_size
+        self.count = max(1, count)
+        self.allocations = 0
+        self._free: List[bytearray] = []
+        self._cond = threading.Condition()
+    
+    def acquire(self) -> bytearray:
+        with self._cond:
+            while not self._free and self.allocations >= self.count:
+                self._cond.wait()
+            if self._free:
+                return self._free.pop()
+            self.allocations += 1
+        return bytearray(self.buffer_size)
+    
+    def release(self, buf: Optional[bytearray]):
+        if buf is None:
+            return
+        with self._cond:
+            self._free.append(buf)
+            self._cond.notify()
+
+
+class ReceiveStats:
+    """Allocation and CPU counters for comparing receive paths."""
+    
+    def __init__(self, mode: str):
+        self.mode = mode
+        self.chunks = 0
+        self.allocations = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._cpu_start = time.process_time()
+    
+    def record(self, length: int, allocated: bool):
+        with self._lock:
+            self.chunks += 1
+            self.bytes += length
+            if allocated:
+                self.allocations += 1
+    
+    def as_dict(self, pool: Optional[BufferPool] = None) -> Dict[str, Any]:
+        cpu = time.process_time() - self._cpu_start
+        gigabytes = self.bytes / 1024**3
+        return {
+            "mode": self.mode,
+            "chunks": self.chunks,
+            "allocations": self.allocations + (pool.allocations if pool else 0),
+            "cpuSeconds": round(cpu, 2),
+            "cpuSecondsPerGB": round(cpu / gigabytes, 2) if gigabytes > 0 else 0
+        }
+
+
+class StreamHasher:
+    """
+    Hash of a file's bytes in order, computed while the download runs.
+    
+    Chunks that arrive exactly at the hashed frontier are hashed from memory
+    as they pass through; anything else (a resumed prefix, or ranges other
+    connections finished ahead of the frontier) is read back from disk by
+    ``catch_up`` once it is contiguous with what has been hashed.
+    """
+    
+    ALGORITHM = 'sha256'
+    READ_SIZE = 1024 * 1024
+    
+    def __init__(self):
+        self._hash = hashlib.new(self.ALGORITHM)
+        self.offset = 0  # Bytes [0, offset) have been hashed
+        self.read_back = 0  # Bytes that had to be read from disk
+        self._lock = threading.Lock()
+    
+    def reset(self):
+        with self._lock:
+            self._hash = hashlib.new(self.ALGORITHM)
+            self.offset = 0
+    
+    def update_at(self, offset: int, data) -> bool:
+        """Hash `data` if it starts at the frontier; False if it has to be read back later."""
+        with self._lock:
+            if offset != self.offset:
+                return False
+            self._hash.update(data)
+            self.offset += len(data)
+            return True
+    
+    def catch_up(self, path: str, end: int):
+        """Read and hash the file from the frontier up to `end`."""
+        if self.offset >= end:
+            return
+        with open(path, 'rb') as f:
+            while True:
+                with self._lock:
+                    start = self.offset
+                if start >= end:
+                    return
+                # Disk reads happen unlocked so update_at never waits on them
+                f.seek(start)
+                data = f.read(min(self.READ_SIZE, end - start))
+                if not data:
+                    return
+                with self._lock:
+                    # A connection may have hashed past `start` from memory meanwhile,
+                    # or a reset may have moved the frontier back; re-read from it
+                    skip = self.offset - start
+                    if 0 <= skip < len(data):
+                        tail = memoryview(data)[skip:]
+                        self._hash.update(tail)
+                        self.offset += len(tail)
+                        self.read_back += len(tail)
+    
+    def hexdigest(self) -> str:
+        with self._lock:
+            return self._hash.hexdigest()
+
+
+class ConnectionBudget:
+    """
+    Cap on open download connections shared by every job in the process.
+    
+    A download that has no connection at all may always open one, so a busy
+    budget slows jobs down but never starves them.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.in_use = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, force: bool = False) -> bool:
+        with self._lock:
+            if self.in_use >= self.limit and not force:
+                return False
+            self.in_use += 1
+            return True
+    
+    def release(self):
+        with self._lock:
+            self.in_use -= 1
+
+
+class WatchedStream:
+    """One response body under the stall watchdog."""
+    
+    def __init__(self, response: requests.Response, label: str):
+        self.response = response
+        self.label = label
+        self.received = 0
+        self.samples: List[Tuple[float, int]] = [(time.time(), 0)]
+        self.stalled = False  # The watchdog cut this connection
+
+
+class StallWatchdog:
+    """
+    Cuts connections whose rolling throughput stays under a floor for a
+    whole window, so a trickling or silently stalled socket reconnects in
+    seconds instead of sitting out the 5-minute read timeout.
+    
+    The socket is shut down rather than closed, which wakes a reader
+    blocked in recv on every platform; the reader then sees the stream
+    break and reconnects from its current offset.
+    """
+    
+    CHECK_INTERVAL = 1.0
+    
+    def __init__(self, floor, window: float, on_stall=None):
+        self.floor = floor  # Callable returning the current bytes/s floor
+        self.window = window
+        self.on_stall = on_stall
+        self._streams: List[WatchedStream] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+    
+    def watch(self, response: requests.Response, label: str) -> WatchedStream:
+        stream = WatchedStream(response, label)
+        with self._lock:
+            self._streams.append(stream)
+        return stream
+    
+    def unwatch(self, stream: WatchedStream):
+        with self._lock:
+            if stream in self._streams:
+                self._streams.remove(stream)
+    
+    def _run(self):
+        while not self._stop.wait(self.CHECK_INTERVAL):
+            now = time.time()
+            floor = self.floor()
+            with self._lock:
+                streams = list(self._streams)
+            for stream in streams:
+                stream.samples.append((now, stream.received))
+                # Keep one sample at or before the window start to measure against
+                while len(stream.samples) > 2 and stream.samples[1][0] <= now - self.window:
+                    stream.samples.pop(0)
+                since, received_then = stream.samples[0]
+                if floor <= 0 or stream.stalled or now - since < self.window:
+                    continue
+                rate = (stream.received - received_then) / (now - since)
+                if rate < floor:
+                    stream.stalled = True
+                    logging.warning(f"[StallWatchdog] {stream.label} at {read_size(rate)}/s for {now - since:.0f}s (floor {read_size(floor)}/s), reconnecting")
+                    self._interrupt(stream.response)
+                    if self.on_stall:
+                        self.on_stall(stream, rate)
+    
+    @staticmethod
+    def _interrupt(response: requests.Response):
+        """Wake the reader blocked on this response's socket."""
+        sock = getattr(getattr(response.raw, '_connection', None), 'sock', None)
+        try:
+            if sock is not None:
+                sock.shutdown(socket.SHUT_RDWR)
+            else:
+                response.close()
+        except OSError:
+            pass
+
+
+class RetryBudget:
+    """
+    The single retry policy for one download, shared by all its connections.
+    
+    Failures are classified first. Connection-level ones (refused, reset,
+    timed out, body cut short) reconnect after a short back-off, since a new
+    socket is all they need; urllib3 has already discarded the broken one
+    and checks idle pooled connections before reuse, so the pool stays warm.
+    HTTP errors back off longer or follow Retry-After, and client errors
+    that can't succeed on retry give up at once. The budget counts failures
+    since the download last received data, so scattered hiccups over a long
+    download never add up, but a dead host gives up after MAX_ATTEMPTS
+    failures or MAX_ELAPSED seconds without a byte.
+    """
+    
+    MAX_ATTEMPTS = 30
+    MAX_ELAPSED = 10 * 60
+    CONNECTION_BACKOFF = (0.5, 15.0)  # First delay and cap, doubling per consecutive failure
+    HTTP_BACKOFF = (2.0, 60.0)
+    RETRY_AFTER_MAX = 120.0
+    FATAL_STATUS = {400, 401, 403, 404, 405, 410, 451}
+    CONNECTION_ERRORS = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError,
+                         ProtocolError, http.client.HTTPException, OSError)
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.failures = 0  # Since data last arrived
+        self.first_failure = 0.0
+        self.counts = {"connection": 0, "http": 0, "other": 0}
+    
+    @classmethod
+    def classify(cls, error: BaseException) -> str:
+        if isinstance(error, requests.HTTPError):
+            return "http"
+        if isinstance(error, cls.CONNECTION_ERRORS):
+            return "connection"
+        return "other"
+    
+    @classmethod
+    def is_fatal(cls, error: BaseException) -> bool:
+        """An HTTP status that won't change on retry."""
+        response = getattr(error, 'response', None)
+        return isinstance(error, requests.HTTPError) and response is not None and response.status_code in cls.FATAL_STATUS
+    
+    def progress(self):
+        """Data arrived; the budget starts over."""
+        if self.failures:
+            with self._lock:
+                self.failures = 0
+    
+    def failure(self, error: BaseException, consecutive: int) -> Optional[float]:
+        """Seconds to wait before retrying after `error`, or None to give up."""
+        kind = self.classify(error)
+        now = time.time()
+        with self._lock:
+            self.counts[kind] += 1
+            if self.failures == 0:
+                self.first_failure = now
+            self.failures += 1
+            if self.is_fatal(error) or self.failures > self.MAX_ATTEMPTS or now - self.first_failure > self.MAX_ELAPSED:
+                return None
+        base, cap = self.CONNECTION_BACKOFF if kind == "connection" else self.HTTP_BACKOFF
+        delay = min(cap, base * 2 ** max(0, consecutive - 1))
+        response = getattr(error, 'response', None)
+        if response is not None and response.status_code in (429, 503):
+            retry_after = response.headers.get('Retry-After', '')
+            if retry_after.isdigit():
+                delay = max(delay, min(float(retry_after), self.RETRY_AFTER_MAX))
+        # Jitter so connections that failed together don't retry in lockstep
+        return delay * random.uniform(0.8, 1.2)
+
+
+class DiskWriteError(Exception):
+    """Raised on the network side when the write-behind thread failed to write."""
+
+
+class WriteBehindWriter:
+    """
+    Bounded write-behind queue drained by a dedicated disk thread.
+    
+    Network threads hand over received chunks and keep reading while the disk
+    catches up. When more than ``max_pending`` bytes are queued, ``write()``
+    blocks until the disk frees room. Chunks go straight to the file
+    descriptor with positional writes (``os.pwrite`` where available), so
+    there is no user-space buffer to flush and ``on_written`` callbacks fire
+    as soon as the OS has the data; durability is left to journal fsyncs.
+    
+    With ``drop_cache`` the thread syncs the file every DROP_CACHE_INTERVAL
+    bytes and drops its pages, so large downloads don't evict the page cache.
+    """
+    
+    OPEN_FLAGS = {
+        'r+b': os.O_RDWR,
+        'wb': os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        'ab': os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+    }
+    
+    def __init__(self, path: str, mode: str, max_pending: int, drop_cache: bool = False):
+        self.path = path
+        self.drop_cache = drop_cache
+        self._since_drop = 0
+        self.max_pending = max(max_pending, ChunkedDownloader.STREAM_CHUNK_SIZE)
+        self.pending_bytes = 0
+        self.stalls = 0  # Times a network thread had to wait for the disk
+        self._fd = os.open(path, self.OPEN_FLAGS[mode] | getattr(os, 'O_BINARY', 0), 0o644)
+        self._queue: List[Tuple[Optional[int], Any, Any, Optional[bytearray], Optional[BufferPool]]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, offset: Optional[int], data, on_written=None, buffer: Optional[bytearray] = None,
+              pool: Optional[BufferPool] = None):
+        """
+        Queue data for `offset` (None appends); blocks while the queue is over its cap.
+        A pooled `buffer` backing `data` is returned to `pool` once it has been written.
+        """
+        with self._cond:
+            if self.pending_bytes and self.pending_bytes + len(data) > self.max_pending:
+                self.stalls += 1
+                while self.pending_bytes and self.pending_bytes + len(data) > self.max_pending and not self._error:
+                    self._cond.wait()
+            if self._error:
+                raise DiskWriteError(str(self._error))
+            self._queue.append((offset, data, on_written, buffer, pool))
+            self.pending_bytes += len(data)
+            self._cond.notify_all()
+    
+    def drain(self):
+        """Wait until everything queued so far has been handed to the file."""
+        with self._cond:
+            while self.pending_bytes and not self._error:
+                self._cond.wait()
+            if self._error:
+                raise DiskWriteError(str(self._error))
+    
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        if self.drop_cache and self._since_drop and not self._error:
+            getattr(os, 'fdatasync', os.fsync)(self._fd)
+            drop_page_cache(self._fd)
+        os.close(self._fd)
+        if self._error:
+            raise DiskWriteError(str(self._error))
+    
+    def _write_at(self, offset: Optional[int], data):
+        """Write all of `data` at `offset` (or the current position when None)."""
+        view = memoryview(data)
+        while view:
+            if offset is None:
+                n = os.write(self._fd, view)
+            elif hasattr(os, 'pwrite'):
+                n = os.pwrite(self._fd, view, offset)
+                offset += n
+            else:
+                os.lseek(self._fd, offset, os.SEEK_SET)
+                n = os.write(self._fd, view)
+                offset += n
+            view = view[n:]
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                batch, self._queue = self._queue, []
+                if not batch and self._closed:
+                    return
+            try:
+                written = 0
+                for offset, data, on_written, buffer, pool in batch:
+                    self._write_at(offset, data)
+                    written += len(data)
+                    if pool:
+                        pool.release(buffer)
+                    if on_written:
+                        on_written(len(data))
+                with self._cond:
+                    self.pending_bytes -= written
+                    self._cond.notify_all()
+                if self.drop_cache:
+                    self._since_drop += written
+                    if self._since_drop >= DROP_CACHE_INTERVAL:
+                        # Dirty pages can't be dropped, so write them back first
+                        getattr(os, 'fdatasync', os.fsync)(self._fd)
+                        drop_page_cache(self._fd)
+                        self._since_drop = 0
+            except Exception as e:
+                logging.error(f"[WriteBehindWriter] Write to {self.path} failed: {e}")
+                with self._cond:
+                    self._error = e
+                    for _, _, _, buffer, pool in self._queue:
+                        if pool:
+                            pool.release(buffer)
+                    self._queue = []
+                    self.pending_bytes = 0
+                    self._cond.notify_all()
+                return
+
+
+class MirrorHistory:
+    """
+    Per-host throughput, time-to-first-byte and range support remembered
+    between runs, so picking among known mirrors or resuming from a known
+    host doesn't need a fresh probe. Stored as JSON next to the log; each
+    update re-reads the file so concurrent downloads don't erase each
+    other's hosts.
+    """
+    
+    FILE = "mirrorstats.json"
+    MAX_AGE = 24 * 3600  # Re-probe hosts not measured within a day
+    CAPABILITY_MAX_AGE = 7 * 24 * 3600  # Range support changes far less often than speed
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def default(cls) -> "MirrorHistory":
+        return cls(os.path.join(os.path.dirname(LOG_PATH), cls.FILE))
+    
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def get(self, host: str) -> Optional[Dict[str, float]]:
+        """The host's record if it is recent enough to trust."""
+        entry = self._load().get(host)
+        if not entry or 'rate' not in entry or time.time() - entry.get('updated', 0) > self.MAX_AGE:
+            return None
+        return entry
+    
+    def record(self, host: str, rate: float, ttfb: Optional[float] = None):
+        """Blend a new measurement into the host's record."""
+        with self._lock:
+            hosts = self._load()
+            entry = hosts.setdefault(host, {})
+            if 'rate' in entry:
+                entry['rate'] = 0.5 * entry['rate'] + 0.5 * rate
+                if ttfb is not None:
+                    entry['ttfb'] = 0.5 * entry.get('ttfb', ttfb) + 0.5 * ttfb
+                entry['samples'] = entry.get('samples', 0) + 1
+            else:
+                entry.update({"rate": rate, "ttfb": ttfb if ttfb is not None else 0.0, "samples": 1})
+            entry['updated'] = time.time()
+            self._save(hosts)
+    
+    def supports_ranges(self, host: str) -> Optional[bool]:
+        """Whether the host served ranges when last checked, or None if unknown or stale."""
+        entry = self._load().get(host) or {}
+        if time.time() - entry.get('rangesChecked', 0) > self.CAPABILITY_MAX_AGE:
+            return None
+        return entry.get('ranges')
+    
+    def record_ranges(self, host: str, supported: bool):
+        with self._lock:
+            hosts = self._load()
+            entry = hosts.setdefault(host, {})
+            if entry.get('ranges') == supported and time.time() - entry.get('rangesChecked', 0) < 3600:
+                return  # Fresh enough; skip the rewrite
+            entry['ranges'] = supported
+            entry['rangesChecked'] = time.time()
+            self._save(hosts)
+    
+    def _save(self, hosts: Dict[str, Dict[str, Any]]):
+        try:
+            safe_write_json(self.path, hosts)
+        except OSError as e:
+            logging.warning(f"[MirrorHistory] Could not save {self.path}: {e}")
+
+
 class ChunkedDownloader:
     """
     Robust chunked downloader that handles large files with proper resume support.
     Uses smaller chunk sizes and validates each chunk before proceeding.
+    When the server supports ranges and more than one connection is configured,
+    the file is split into byte ranges that download in parallel into a
+    preallocated ``.part`` file.
     """
     
     STREAM_CHUNK_SIZE = 1024 * 1024  # 1MB read chunks for streaming
     PROGRESS_UPDATE_INTERVAL = 0.5  # Update progress every 0.5 seconds
-    MAX_RETRIES = 10  # Max retries for the entire download
-    RETRY_DELAY_BASE = 2
-    RETRY_DELAY_MAX = 60
+    MIRROR_RETRY_BENCH = 2.0  # Seconds a failing mirror sits out per consecutive failure
+    MAX_CONNECTIONS = 32  # Upper bound for parallel connections per file
+    MIN_SEGMENT_SIZE = 16 * 1024 * 1024  # Don't split files into ranges smaller than 16MB
+    DEFAULT_WRITE_BUFFER = 64 * 1024 * 1024  # Received data allowed to wait for the disk
+    PART_SUFFIX = ".part"
+    JOURNAL_INTERVAL = 2.0  # Checkpoint completed ranges every 2 seconds
+    SCHEDULER_INTERVAL = 1.0  # Sample per-segment throughput every second
+    ADAPT_INTERVAL = 5.0  # Reconsider the connection count every 5 seconds
+    ADAPT_MIN_GAIN = 0.05  # Keep an added connection only if it raised throughput by 5%
+    ADAPT_REPROBE_INTERVAL = 60.0  # Forget a learned connection ceiling after a minute
+    MIN_STEAL_SIZE = 2 * STREAM_CHUNK_SIZE  # Ranges smaller than this are not worth splitting
+    DEFAULT_STALL_FLOOR = 32 * 1024  # Bytes/s a connection must beat...
+    DEFAULT_STALL_WINDOW = 20.0  # ...over this many seconds
+    MIRROR_SLOW_RATIO = 0.25  # Bench a mirror whose per-connection rate is under 25% of the best
+    MIRROR_BENCH_TIME = 60.0  # ...for a minute, then let it compete again
     
-    def __init__(self, url: str, dest_path: str, game_info: Dict, game_info_path: str):
+    def __init__(self, url: str, dest_path: str, game_info: Dict, game_info_path: str,
+                 connections: int = 1, write_buffer: int = DEFAULT_WRITE_BUFFER,
+                 zero_copy: bool = True, drop_cache: bool = False,
+                 state: Optional[StateWriter] = None, session: Optional[requests.Session] = None,
+                 budget: Optional[ConnectionBudget] = None, limiter: Optional[BandwidthLimiter] = None,
+                 mirrors: Optional[List[str]] = None, stall_floor: float = DEFAULT_STALL_FLOOR,
+                 stall_window: float = DEFAULT_STALL_WINDOW):
         self.url = url
+        # Other URLs for the same file; ranged downloads pull from all of them at once
+        self.mirrors = [DownloadMirror(url)] + [DownloadMirror(m) for m in dict.fromkeys(mirrors or []) if m != url]
         self.dest_path = dest_path
+        self.part_path = dest_path + self.PART_SUFFIX
         self.game_info = game_info
         self.game_info_path = game_info_path
-        self.session = create_robust_session()
+        # Standalone use gets its own writer; RobustDownloader shares one across phases
+        self._owns_state = state is None
+        self.state = state or StateWriter(game_info_path, game_info)
+        self.connections = max(1, min(connections, self.MAX_CONNECTIONS))
+        self.write_buffer = write_buffer
+        self._writer: Optional[WriteBehindWriter] = None
+        self.zero_copy = zero_copy
+        self.drop_cache = drop_cache
+        # Enough buffers to fill the write-behind queue plus one being received per connection
+        self._buffers = BufferPool(self.STREAM_CHUNK_SIZE, write_buffer // self.STREAM_CHUNK_SIZE + 2 * self.MAX_CONNECTIONS)
+        self.receive_stats = ReceiveStats("readinto" if zero_copy else "iter_content")
+        self.hasher = StreamHasher()
+        self.hash_archive = True  # Off when released ranges of the archive can no longer be read back
+        self._hash_stop = threading.Event()
+        # Readers following the download (streaming extraction) see the written prefix
+        self._file_lock = threading.Lock()  # Held while the file is renamed or read from outside
+        self._stream_written = 0  # Single stream: bytes the writer has handed to the file
+        self.released = 0  # Bytes at the front whose disk space was given back
+        self.generation = 0  # Bumped whenever partial data is thrown away
+        # A daemon shares one pool and connection budget across all of its jobs
+        self._owns_session = session is None
+        self.session = session or create_robust_session(pool_maxsize=self.connections, retries=False)
+        self.retry = RetryBudget()
+        self.budget = budget
+        self.limiter = limiter
+        self.stall_floor = stall_floor
+        self.watchdog = StallWatchdog(self._stall_floor, stall_window, self._record_stall)
         self.total_size: Optional[int] = None
         self.supports_range = False
+        self.history = MirrorHistory.default()
+        self._primed: Optional[Tuple[int, requests.Response]] = None  # First GET, kept open for its body
         self.downloaded_bytes = 0
         self.session_downloaded_bytes = 0  # Track bytes downloaded in current session only
         self.start_time = time.time()
         self.last_progress_update = 0
+        self._progress_lock = threading.Lock()  # Guards byte counters shared by connections
+        self._progress_write_lock = threading.Lock()  # Only one connection writes progress at a time
+        self._abort = threading.Event()
+        self.journal: Optional[DownloadJournal] = None
+        self._segments: List[DownloadSegment] = []
+        self._journal_lock = threading.Lock()
+        self._last_journal_save = 0
+        self._segments_lock = threading.Lock()  # Guards segment splits and the connection count
+        self._scheduler_wake = threading.Event()  # Set when a connection finishes
+        self._active_workers = 0
         
+    def _open_first_range(self, start: int) -> bool:
+        """
+        Start with the real data request and learn what a probe would from it:
+        a 206 carries the size in Content-Range and proves range support, a
+        200 means the server ignores ranges. The open response is kept for
+        whichever connection fetches `start` first. False if the answer was
+        inconclusive and the full probe should run.
+        """
+        try:
+            response = self.session.get(self.url, headers={'Range': f'bytes={start}-'}, stream=True, timeout=(30, 300))
+        except Exception as e:
+            logging.warning(f"[ChunkedDownloader] First request failed: {e}")
+            return False
+        total = self._content_range_total(response)
+        if response.status_code == 416 and total is not None:
+            response.close()  # Nothing left past `start`; the existing file is complete
+            self.total_size, self.supports_range = total, True
+        elif response.status_code == 206 and total is not None:
+            self.total_size, self.supports_range = total, True
+            self._primed = (start, response)
+        elif response.status_code == 200:
+            length = response.headers.get('Content-Length', '')
+            self.total_size = int(length) if length.isdigit() else None
+            self.supports_range = False
+            self._primed = (0, response)  # The whole body, whatever was asked for
+        else:
+            response.close()
+            return False
+        logging.info(f"[ChunkedDownloader] First GET: size={read_size(self.total_size) if self.total_size else 'unknown'}, range_support={self.supports_range}")
+        return True
+    
+    def _take_primed(self, url: str, offset: int) -> Optional[requests.Response]:
+        """
+        The first GET's open response, if it starts where this request would.
+        If the request for its offset goes to a mirror instead, nothing else
+        can use it, so it is closed rather than left holding a connection.
+        """
+        with self._segments_lock:
+            if not self._primed or self._primed[0] != offset:
+                return None
+            primed, self._primed = self._primed, None
+        if url == self.url:
+            return primed[1]
+        primed[1].close()
+        return None
+    
+    def _discard_unused_primed(self, offsets: List[int]):
+        """Close the first GET's response when no planned request starts at its offset."""
+        with self._segments_lock:
+            unused = self._primed[0] if self._primed and self._primed[0] not in offsets else None
+        if unused is not None:
+            logging.info(f"[ChunkedDownloader] No segment starts at {unused}; closing the first response")
+            self._discard_primed()
+    
+    def _discard_primed(self):
+        with self._segments_lock:
+            primed, self._primed = self._primed, None
+        if primed:
+            primed[1].close()
+    
+    def _detect_server(self, existing_size: int):
+        """Learn size and range support with as few round trips as possible."""
+        host = urlparse(self.url).netloc
+        journal_size = None
+        if existing_size == 0 and os.path.exists(self.part_path):
+            journal_size = DownloadJournal.recorded_size(self.part_path + DownloadJournal.SUFFIX)
+        if journal_size and self.history.supports_ranges(host):
+            # Resuming from a host known to serve ranges: the journal already has the size,
+            # and every segment's Content-Range is still checked against it
+            self.total_size, self.supports_range = journal_size, True
+            logging.info(f"[ChunkedDownloader] Resuming {read_size(journal_size)} from {host} without probing")
+            return
+        if not self._open_first_range(existing_size):
+            self._probe_server()
+        if self.total_size:
+            self.history.record_ranges(host, self.supports_range)
+    
     def _probe_server(self) -> bool:
         """Probe server for file size and range support."""
         try:
@@ -314,18 +1489,202 @@ class ChunkedDownloader:
             logging.warning(f"[ChunkedDownloader] Server probe failed: {e}")
             return False
     
+    def _probe_mirror(self, mirror: DownloadMirror):
+        """Check with a one-byte ranged GET that a mirror serves the same size with ranges."""
+        try:
+            with self.session.get(mirror.url, headers={"Range": "bytes=0-0"}, stream=True, timeout=15) as response:
+                total = self._content_range_total(response)
+                if response.status_code >= 400:
+                    mirror.dropped = True
+                    logging.warning(f"[ChunkedDownloader] Mirror {mirror.host} answered HTTP {response.status_code}, skipping it")
+                elif response.status_code != 206 or total is None:
+                    mirror.dropped = True
+                    logging.warning(f"[ChunkedDownloader] Mirror {mirror.host} doesn't support ranges (HTTP {response.status_code}), skipping it")
+                elif total != self.total_size:
+                    mirror.dropped = True
+                    logging.warning(f"[ChunkedDownloader] Mirror {mirror.host} reports {read_size(total)}, expected {read_size(self.total_size)}, skipping it")
+        except Exception as e:
+            mirror.dropped = True
+            logging.warning(f"[ChunkedDownloader] Mirror {mirror.host} probe failed: {e}")
+    
+    def _probe_mirrors(self):
+        """Keep only mirrors that agree on the size; all are probed in parallel."""
+        extra = self.mirrors[1:]
+        if not self._use_segmented():
+            logging.info(f"[ChunkedDownloader] Primary host can't serve ranges, ignoring {len(extra)} mirror(s)")
+            self.mirrors = self.mirrors[:1]
+            return
+        threads = [threading.Thread(target=self._probe_mirror, args=(m,), daemon=True) for m in extra]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.mirrors = [self.mirrors[0]] + [m for m in extra if not m.dropped]
+        # At least one connection per mirror, or the extra hosts would never be used
+        self.connections = max(self.connections, min(len(self.mirrors), self.MAX_CONNECTIONS))
+        logging.info(f"[ChunkedDownloader] Multi-source: {len(self.mirrors)} of {len(extra) + 1} hosts serve this file ({', '.join(m.host for m in self.mirrors)})")
+    
+    @staticmethod
+    def _content_range_total(response: requests.Response) -> Optional[int]:
+        """Total size from a Content-Range header, if it names one."""
+        total = response.headers.get('Content-Range', '').rpartition('/')[2]
+        return int(total) if total.isdigit() else None
+    
+    def _acquire_mirror(self) -> DownloadMirror:
+        """Pick the mirror with the most throughput to spare per connection."""
+        now = time.time()
+        with self._segments_lock:
+            candidates = [m for m in self.mirrors if m.usable(now)]
+            if not candidates:
+                # Everything left is benched; the least recently benched is the best bet
+                candidates = [min((m for m in self.mirrors if not m.dropped), key=lambda m: m.benched_until)]
+            known = [m.rate for m in candidates if m.rate > 0]
+            # Unmeasured mirrors are assumed average so they get a connection to prove themselves
+            default_rate = sum(known) / len(known) if known else 1.0
+            mirror = max(candidates, key=lambda m: (m.rate or default_rate) / (m.active + 1))
+            mirror.active += 1
+            return mirror
+    
+    def _release_mirror(self, mirror: DownloadMirror):
+        with self._segments_lock:
+            mirror.active -= 1
+    
+    def _mirror_failed(self, mirror: DownloadMirror, reason: Any) -> bool:
+        """Count a failure against a mirror; True if another mirror can take over right away."""
+        now = time.time()
+        with self._segments_lock:
+            mirror.failures += 1
+            others = [m for m in self.mirrors if m is not mirror and not m.dropped]
+            if not others:
+                return False
+            if (mirror.failures >= DownloadMirror.MAX_FAILURES or isinstance(reason, RangeNotSupportedError)
+                    or RetryBudget.is_fatal(reason)):
+                mirror.dropped = True
+                logging.warning(f"[ChunkedDownloader] Dropping mirror {mirror.host}: {reason}")
+            else:
+                # Keep new connections off it while it recovers
+                mirror.benched_until = max(mirror.benched_until, now + self.MIRROR_RETRY_BENCH * mirror.failures)
+            return any(m.usable(now) for m in others)
+    
+    def _sample_mirrors(self, now: float, rebalance: bool):
+        """Fold per-segment rates into per-mirror rates and bench mirrors far behind the best."""
+        if len(self.mirrors) < 2:
+            return
+        with self._segments_lock:
+            per_mirror: Dict[DownloadMirror, List[float]] = {}
+            for seg in self._segments:
+                if seg.active and seg.mirror is not None and seg.rate > 0:
+                    per_mirror.setdefault(seg.mirror, []).append(seg.rate)
+            for mirror, rates in per_mirror.items():
+                sample = sum(rates) / len(rates)
+                mirror.rate = sample if mirror.rate == 0 else 0.7 * mirror.rate + 0.3 * sample
+            usable = [m for m in self.mirrors if m.usable(now) and m.rate > 0]
+            if not rebalance or len(usable) < 2:
+                return
+            best = max(m.rate for m in usable)
+            for mirror in usable:
+                if mirror.rate < best * self.MIRROR_SLOW_RATIO:
+                    # Its connections move their ranges to other mirrors on their next read
+                    mirror.benched_until = now + self.MIRROR_BENCH_TIME
+                    logging.info(f"[ChunkedDownloader] Benching slow mirror {mirror.host} ({read_size(mirror.rate)}/s vs {read_size(best)}/s per connection)")
+                    mirror.rate = 0.0
+    
+    def seed_mirror_rates(self, rates: Dict[str, float]):
+        """Start the mirror picker from known per-connection rates instead of a blank slate."""
+        for mirror in self.mirrors:
+            mirror.rate = rates.get(mirror.url, 0.0)
+    
     def _get_existing_size(self) -> int:
         """Get size of existing partial download."""
         if os.path.exists(self.dest_path):
             return os.path.getsize(self.dest_path)
         return 0
     
+    def _discard_partial(self):
+        """Partial data was thrown away; readers of the old prefix must start over."""
+        self.released = 0
+        self.hash_archive = True
+        self.generation += 1
+    
+    def _mark_stream_written(self, count: int):
+        self._stream_written += count
+    
+    def completed_prefix(self) -> int:
+        """Length of the front of the file that is already written to disk."""
+        if self.journal:
+            return self._contiguous_prefix()
+        return self._stream_written
+    
+    def read_prefix(self, offset: int, size: int) -> bytes:
+        """Up to `size` bytes at `offset` from the written prefix; empty if none are there yet."""
+        with self._file_lock:
+            size = min(size, self.completed_prefix() - offset)
+            if size <= 0:
+                return b''
+            path = self.part_path if os.path.exists(self.part_path) else self.dest_path
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                return f.read(size)
+    
+    def releasable(self, end: int) -> int:
+        """How much of the first `end` bytes can be released; the hasher may still need to read them."""
+        if self.hash_archive:
+            end = min(end, self.hasher.offset)
+        return min(end, self.completed_prefix())
+    
+    def release_prefix(self, end: int) -> bool:
+        """Give back the disk space of bytes [released, end) once a reader is done with them."""
+        with self._file_lock:
+            if end <= self.released:
+                return True
+            path = self.part_path if os.path.exists(self.part_path) else self.dest_path
+            if not release_file_range(path, self.released, end - self.released):
+                return False
+            self.released = end
+            return True
+    
+    def _stall_floor(self) -> float:
+        """The configured floor, lowered when the bandwidth cap leaves each connection less."""
+        if not self.limiter:
+            return self.stall_floor
+        return min(self.stall_floor, self.limiter.rate / max(1, self._active_workers) / 4)
+    
+    def _record_stall(self, stream: WatchedStream, rate: float):
+        """Keep stall diagnostics in downloadingData."""
+        data = self.game_info.setdefault('downloadingData', {})
+        data['stalls'] = data.get('stalls', 0) + 1
+        data['lastStall'] = {"connection": stream.label, "rate": round(rate), "time": time.strftime('%Y-%m-%dT%H:%M:%S')}
+        self.state.submit()
+    
+    def _record_reconnect(self):
+        data = self.game_info.setdefault('downloadingData', {})
+        data['reconnects'] = data.get('reconnects', 0) + 1
+        self.state.submit()
+    
+    def _add_downloaded(self, count: int):
+        """Account for bytes written by any connection and refresh progress."""
+        with self._progress_lock:
+            self.downloaded_bytes += count
+            self.session_downloaded_bytes += count
+        self.retry.progress()
+        self._update_progress()
+    
     def _update_progress(self, force: bool = False):
         """Update progress in game info file."""
         now = time.time()
         if not force and (now - self.last_progress_update) < self.PROGRESS_UPDATE_INTERVAL:
             return
-        
+        if not self._progress_write_lock.acquire(blocking=force):
+            return  # Another connection is already writing progress
+        try:
+            self._write_progress(now)
+            if force:
+                self.state.flush()
+        finally:
+            self._progress_write_lock.release()
+    
+    def _write_progress(self, now: float):
+        """Update progress fields in game info and queue them for writing (write lock held)."""
         self.last_progress_update = now
         elapsed = now - self.start_time
         
@@ -355,31 +1714,83 @@ class ChunkedDownloader:
         if self.total_size is None or self.total_size == 0:
             eta_str = f"Downloaded: {read_size(self.downloaded_bytes)}"
         else:
-            eta_int = int(eta)
-            if eta_int < 60:
-                eta_str = f"{eta_int}s"
-            elif eta_int < 3600:
-                eta_str = f"{eta_int // 60}m {eta_int % 60}s"
-            else:
-                eta_str = f"{eta_int // 3600}h {(eta_int % 3600) // 60}m"
+            eta_str = format_eta(eta)
         
         self.game_info["downloadingData"]["progressCompleted"] = f"{progress:.2f}"
         self.game_info["downloadingData"]["progressDownloadSpeeds"] = speed_str
         self.game_info["downloadingData"]["timeUntilComplete"] = eta_str
         self.game_info["downloadingData"]["downloading"] = True
-        safe_write_json(self.game_info_path, self.game_info)
+        if self._active_workers:
+            self.game_info["downloadingData"]["connections"] = self._active_workers
+        if self._writer:
+            # A queue that stays near capacity means the disk is the bottleneck
+            self.game_info["downloadingData"]["writeQueue"] = {
+                "pendingBytes": self._writer.pending_bytes,
+                "capacityBytes": self._writer.max_pending,
+                "stalls": self._writer.stalls
+            }
+        self.game_info["downloadingData"]["receiveStats"] = self.receive_stats.as_dict(self._buffers)
+        streamed = progress_stream.emit(
+            "progress", phase="downloading", bytesDone=self.downloaded_bytes, totalBytes=self.total_size,
+            percent=round(progress, 2), rate=round(speed), eta=int(eta))
+        if not streamed:
+            self.state.submit()
     
-    def _stream_download(self, start_byte: int, file_handle) -> bool:
+    def _iter_body(self, response: requests.Response):
         """
-        Stream download from start_byte, writing directly to file.
+        Yield (chunk, buffer) pairs for the response body.
+        
+        With zero-copy enabled and an unencoded body, data is read straight from
+        the socket into pooled buffers with ``readinto``; ``chunk`` is a memoryview
+        and ``buffer`` must be handed back to the pool once written. Otherwise this
+        falls back to ``iter_content`` and ``buffer`` is None.
+        """
+        fp = getattr(response.raw, '_fp', None)
+        encoding = response.headers.get('Content-Encoding', 'identity').lower()
+        # Under a bandwidth cap, read in slices small enough to pace smoothly
+        slice_size = self.limiter.chunk_size(self.STREAM_CHUNK_SIZE) if self.limiter else self.STREAM_CHUNK_SIZE
+        if not self.zero_copy or encoding not in ('', 'identity') or not hasattr(fp, 'readinto'):
+            for data in response.iter_content(chunk_size=slice_size):
+                if data:
+                    self.receive_stats.record(len(data), allocated=True)
+                    if self.limiter:
+                        self.limiter.consume(len(data))
+                    yield data, None
+            return
+        
+        while True:
+            buf = self._buffers.acquire()
+            try:
+                n = fp.readinto(memoryview(buf)[:slice_size])
+            except BaseException:
+                self._buffers.release(buf)
+                raise
+            if not n:
+                self._buffers.release(buf)
+                break
+            self.receive_stats.record(n, allocated=False)
+            if self.limiter:
+                self.limiter.consume(n)
+            yield memoryview(buf)[:n], buf
+        
+        # The body was consumed behind urllib3's back; hand the connection back to the pool
+        if fp.isclosed():
+            response.raw.release_conn()
+    
+    def _stream_download(self, start_byte: int, writer: WriteBehindWriter) -> bool:
+        """
+        Stream download from start_byte, appending through the write-behind queue.
         Returns True if completed successfully, False if interrupted.
         """
         headers = {}
         if start_byte > 0 and self.supports_range:
             headers['Range'] = f'bytes={start_byte}-'
+        self._stream_watch = None
+        self._stream_error: Optional[BaseException] = None
         
         try:
-            response = self.session.get(
+            self._discard_unused_primed([start_byte])
+            response = self._take_primed(self.url, start_byte) or self.session.get(
                 self.url,
                 headers=headers,
                 stream=True,
@@ -391,6 +1802,7 @@ class ChunkedDownloader:
                 return True
             
             response.raise_for_status()
+            self._stream_watch = self.watchdog.watch(response, "stream")
             
             # Try to get total size from Content-Range or Content-Length
             if self.total_size is None:
@@ -407,36 +1819,425 @@ class ChunkedDownloader:
                     logging.info(f"[ChunkedDownloader] Calculated total size: {read_size(self.total_size)}")
             
             # Stream the content
-            for data in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
-                if data:
-                    file_handle.write(data)
-                    file_handle.flush()  # Ensure data is written to disk
-                    self.downloaded_bytes += len(data)
-                    self.session_downloaded_bytes += len(data)
-                    self._update_progress()
+            for data, buf in self._iter_body(response):
+                if self._abort.is_set():
+                    self._buffers.release(buf)
+                    return False
+                self.hasher.update_at(self.downloaded_bytes, data)
+                writer.write(None, data, self._mark_stream_written, buffer=buf, pool=self._buffers)
+                self._add_downloaded(len(data))
+                self._stream_watch.received += len(data)
             
             return True
             
+        except DiskWriteError:
+            raise
         except Exception as e:
-            logging.warning(f"[ChunkedDownloader] Stream interrupted at {read_size(self.downloaded_bytes)}: {e}")
+            self._stream_error = e
+            logging.warning(f"[ChunkedDownloader] Stream interrupted at {read_size(self.downloaded_bytes)} ({RetryBudget.classify(e)}): {e}")
             return False
+        finally:
+            if self._stream_watch:
+                self.watchdog.unwatch(self._stream_watch)
+    
+    def _plan_segments(self, gaps: List[Tuple[int, int]]) -> List[DownloadSegment]:
+        """Split the missing byte ranges into segments sized for the connection count."""
+        remaining = sum(end - start for start, end in gaps)
+        target = max(self.MIN_SEGMENT_SIZE, -(-remaining // self.connections))
+        segments = []
+        for gap_start, gap_end in gaps:
+            pieces = max(1, round((gap_end - gap_start) / target))
+            step = (gap_end - gap_start) // pieces
+            for i in range(pieces):
+                seg_start = gap_start + i * step
+                seg_end = gap_end if i == pieces - 1 else seg_start + step
+                segments.append(DownloadSegment(len(segments), seg_start, seg_end))
+        return segments
+    
+    def _use_segmented(self) -> bool:
+        """Ranged downloads go through the journaled .part file, even on one connection."""
+        return self.supports_range and bool(self.total_size)
+    
+    def _download_segment(self, segment: DownloadSegment):
+        """Fetch one byte range, retrying from its current offset."""
+        retry_count = 0  # Consecutive failures on this connection
+        attempts = 0
+        while not segment.done and not self._abort.is_set():
+            if attempts:
+                self._record_reconnect()
+            attempts += 1
+            headers = {'Range': f'bytes={segment.offset}-{segment.end - 1}'}
+            mirror = self._acquire_mirror()
+            segment.mirror = mirror
+            watched = None
+            try:
+                response = (self._take_primed(mirror.url, segment.offset)
+                            or self.session.get(mirror.url, headers=headers, stream=True, timeout=(30, 300)))
+                with response:
+                    if response.status_code == 200:
+                        raise RangeNotSupportedError(f"{mirror.host} ignored Range for segment {segment.index}")
+                    response.raise_for_status()
+                    if self._content_range_total(response) not in (None, self.total_size):
+                        raise RangeNotSupportedError(f"{mirror.host} now serves a different file size")
+                    watched = self.watchdog.watch(response, f"segment {segment.index} on {mirror.host}")
+                    
+                    for data, buf in self._iter_body(response):
+                        if self._abort.is_set():
+                            self._buffers.release(buf)
+                            return
+                        # The segment end may shrink while we read; never write past it
+                        data = data[:segment.remaining]
+                        self.hasher.update_at(segment.offset, data)
+                        self._writer.write(segment.offset, data, segment.mark_written, buffer=buf, pool=self._buffers)
+                        segment.offset += len(data)
+                        self._add_downloaded(len(data))
+                        mirror.received += len(data)
+                        mirror.failures = 0
+                        watched.received += len(data)
+                        self._checkpoint_journal()
+                        if segment.done or self._retire_if_surplus(segment):
+                            break
+                        if not mirror.usable(time.time()):
+                            break  # Benched or dropped; reconnect the rest of the range elsewhere
+                if watched.stalled:
+                    self._mirror_failed(mirror, "stalled")
+                else:
+                    retry_count = 0
+            except DiskWriteError:
+                raise
+            except Exception as e:
+                if watched and watched.stalled:
+                    self._mirror_failed(mirror, "stalled")
+                    continue  # Cut by the watchdog; reconnect right away
+                failover = self._mirror_failed(mirror, e)
+                if isinstance(e, RangeNotSupportedError) and not failover:
+                    raise
+                retry_count += 1
+                delay = self.retry.failure(e, retry_count)
+                if delay is None and not failover:
+                    raise
+                kind = RetryBudget.classify(e)
+                if failover:
+                    logging.warning(f"[ChunkedDownloader] Segment {segment.index} interrupted at {read_size(segment.offset)} on {mirror.host} ({kind}): {e}; retrying on another mirror")
+                    continue
+                logging.warning(f"[ChunkedDownloader] Segment {segment.index} interrupted at {read_size(segment.offset)} ({kind}): {e}; retry in {delay:.1f}s")
+                self._abort.wait(delay)
+            finally:
+                if watched:
+                    self.watchdog.unwatch(watched)
+                self._release_mirror(mirror)
+    
+    def _checkpoint_journal(self, force: bool = False):
+        """Persist completed ranges, throttled to JOURNAL_INTERVAL."""
+        now = time.time()
+        if not force and (now - self._last_journal_save) < self.JOURNAL_INTERVAL:
+            return
+        if not self._journal_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_journal_save = now
+            self.journal.save(self._segments)
+        except Exception as e:
+            logging.warning(f"[ChunkedDownloader] Could not save resume journal: {e}")
+        finally:
+            self._journal_lock.release()
+    
+    def cancel(self):
+        """Stop all connections; download() returns False once they have wound down."""
+        self._abort.set()
+    
+    def _contiguous_prefix(self) -> int:
+        """End of the range starting at byte 0 that is fully written to the .part file."""
+        ranges = self.journal.completed + [(seg.start, seg.written) for seg in list(self._segments)]
+        merged = DownloadJournal.merge(ranges)
+        return merged[0][1] if merged and merged[0][0] == 0 else 0
+    
+    def _hash_worker(self):
+        """Read back and hash ranges that finished ahead of the hashed frontier."""
+        while not self._hash_stop.wait(0.5):
+            if not self.hash_archive:
+                return
+            try:
+                self.hasher.catch_up(self.part_path, self._contiguous_prefix())
+            except OSError as e:
+                logging.warning(f"[ChunkedDownloader] Hash catch-up failed: {e}")
+                return
+    
+    def _record_hash(self):
+        """Finish hashing the completed file and store the digest in game_info."""
+        if not self.hash_archive:
+            return  # Part of the archive was released before it was hashed
+        size = os.path.getsize(self.dest_path)
+        name = os.path.basename(self.dest_path)
+        hashes = self.game_info.setdefault('archiveHashes', {})
+        known = hashes.get(name)
+        if self.hasher.offset == 0 and known and known.get('size') == size:
+            return  # Already hashed by an earlier run
+        if self.hasher.offset > size:
+            self.hasher.reset()
+        try:
+            self.hasher.catch_up(self.dest_path, size)
+        except OSError as e:
+            logging.warning(f"[ChunkedDownloader] Could not hash {name}: {e}")
+            return
+        hashes[name] = {"algorithm": StreamHasher.ALGORITHM, "digest": self.hasher.hexdigest(), "size": size}
+        self.state.submit()
+        logging.info(f"[ChunkedDownloader] {StreamHasher.ALGORITHM} {hashes[name]['digest']} ({read_size(self.hasher.read_back)} read back from disk)")
+    
+    def _add_segment(self, start: int, end: int) -> DownloadSegment:
+        segment = DownloadSegment(len(self._segments), start, end)
+        self._segments.append(segment)
+        return segment
+    
+    def _retire_if_surplus(self, segment: DownloadSegment) -> bool:
+        """Stop this connection if the scheduler lowered the target, requeueing what's left."""
+        with self._segments_lock:
+            if self._active_workers <= self._target_workers or segment.remaining < self.MIN_STEAL_SIZE:
+                return False
+            self._active_workers -= 1
+            self._pending.put(self._add_segment(segment.offset, segment.end))
+            segment.end = segment.offset
+            segment.retired = True
+        logging.info(f"[ChunkedDownloader] Retired a connection, {self._active_workers} active")
+        return True
+    
+    def _steal_segment(self) -> Optional[DownloadSegment]:
+        """Split the active segment with the longest expected finish time for an idle connection."""
+        with self._segments_lock:
+            active = [seg for seg in self._segments if seg.active and seg.remaining >= 2 * self.MIN_STEAL_SIZE]
+            if not active:
+                return None
+            victim = max(active, key=lambda seg: seg.remaining / max(seg.rate, 1.0))
+            rates = [seg.rate for seg in self._segments if seg.active and seg.rate > 0]
+            helper_rate = sum(rates) / len(rates) if rates else 0.0
+            share = victim.rate / (victim.rate + helper_rate) if victim.rate > 0 and helper_rate > 0 else 0.5
+            # The victim may be mid-write of up to one chunk past its offset, so split beyond that
+            keep = max(self.MIN_STEAL_SIZE, int(victim.remaining * share))
+            split_at = victim.offset + keep
+            if victim.end - split_at < self.MIN_STEAL_SIZE:
+                return None
+            stolen = self._add_segment(split_at, victim.end)
+            victim.end = split_at
+        logging.info(f"[ChunkedDownloader] Stole {read_size(stolen.remaining)} from segment {victim.index} ({read_size(victim.rate)}/s)")
+        return stolen
+    
+    def _has_work(self) -> bool:
+        """True while there is queued work or a range big enough to split."""
+        if not self._pending.empty():
+            return True
+        return any(seg.active and seg.remaining >= 2 * self.MIN_STEAL_SIZE for seg in self._segments)
+    
+    def _next_segment(self) -> Optional[DownloadSegment]:
+        try:
+            return self._pending.get_nowait()
+        except queue.Empty:
+            return self._steal_segment()
+    
+    def _segment_worker(self):
+        """One connection: fetch queued ranges, then help lagging ones, until nothing is left."""
+        retired = False
+        while not self._abort.is_set():
+            segment = self._next_segment()
+            if segment is None:
+                break
+            segment.active = True
+            try:
+                self._download_segment(segment)
+            except Exception as e:
+                self._errors.append(e)
+                self._abort.set()
+            finally:
+                segment.active = False
+                self._checkpoint_journal()
+            if segment.retired:
+                retired = True  # Already uncounted by _retire_if_surplus
+                break
+        if not retired:
+            with self._segments_lock:
+                self._active_workers -= 1
+        if self.budget:
+            self.budget.release()
+        self._scheduler_wake.set()
+    
+    def _spawn_workers(self):
+        """Start connections until the target count is reached."""
+        while True:
+            with self._segments_lock:
+                if self._active_workers >= self._target_workers or self._abort.is_set() or not self._has_work():
+                    return
+                if self.budget and not self.budget.acquire(force=self._active_workers == 0):
+                    return  # Other jobs hold the shared connections; retry on the next tick
+                self._active_workers += 1
+            t = threading.Thread(target=self._segment_worker, daemon=True)
+            self._workers.append(t)
+            t.start()
+    
+    def _adapt_connections(self, aggregate_rate: float):
+        """Hill-climb the connection count: keep an extra connection only if it paid off."""
+        previous_rate, previous_target = self._adapt_baseline
+        target = self._target_workers
+        now = time.time()
+        if now - self._adapt_ceiling_time >= self.ADAPT_REPROBE_INTERVAL:
+            self._adapt_ceiling = self._max_workers  # Conditions change; allow probing upward again
+        if previous_rate > 0 and target > previous_target and aggregate_rate < previous_rate * (1 + self.ADAPT_MIN_GAIN):
+            target = previous_target  # The last added connection didn't help
+            self._adapt_ceiling = target
+            self._adapt_ceiling_time = now
+        elif previous_rate > 0 and target == previous_target and aggregate_rate < previous_rate * (1 - 4 * self.ADAPT_MIN_GAIN):
+            target -= 1  # Throughput collapsed at this count; the host may be throttling concurrency
+        elif self.limiter and aggregate_rate >= self.limiter.rate * 0.9:
+            pass  # Already at the bandwidth cap; more connections would only queue on the limiter
+        elif target < self._adapt_ceiling and self._has_work():
+            target += 1  # Probe one more connection while there is work to share
+        target = max(self._min_workers, min(target, self._max_workers))
+        if target != self._target_workers:
+            logging.info(f"[ChunkedDownloader] Connections {self._target_workers} -> {target} at {read_size(aggregate_rate)}/s")
+        self._adapt_baseline = (aggregate_rate, self._target_workers)
+        self._target_workers = target
+    
+    def _run_scheduler(self):
+        """Sample throughput, adapt the connection count and wait for all connections to finish."""
+        last_sample = time.time()
+        last_adapt = last_sample
+        last_bytes = self.session_downloaded_bytes
+        while True:
+            self._spawn_workers()
+            self._scheduler_wake.wait(self.SCHEDULER_INTERVAL)
+            self._scheduler_wake.clear()
+            with self._segments_lock:
+                if self._active_workers <= 0:
+                    break
+            now = time.time()
+            elapsed = now - last_sample
+            if elapsed <= 0:
+                continue
+            with self._segments_lock:
+                for seg in self._segments:
+                    if seg.active:
+                        sample = (seg.offset - seg._sample_offset) / elapsed
+                        seg.rate = sample if seg.rate == 0 else 0.7 * seg.rate + 0.3 * sample
+                    seg._sample_offset = seg.offset
+            self._sample_mirrors(now, rebalance=now - last_adapt >= self.ADAPT_INTERVAL)
+            if now - last_adapt >= self.ADAPT_INTERVAL and not self._abort.is_set():
+                self._adapt_connections((self.session_downloaded_bytes - last_bytes) / (now - last_adapt))
+                last_bytes = self.session_downloaded_bytes
+                last_adapt = now
+            last_sample = now
+        for t in self._workers:
+            t.join()
+    
+    def _download_segmented(self) -> bool:
+        """Download the missing ranges of the preallocated .part file over parallel connections."""
+        preallocate_file(self.part_path, self.total_size)
+        
+        gaps = self.journal.missing_ranges()
+        self.downloaded_bytes = self.total_size - sum(end - start for start, end in gaps)
+        self._segments = self._plan_segments(gaps)
+        # On a resume the gaps rarely start where the first GET did
+        self._discard_unused_primed([seg.offset for seg in self._segments])
+        self._checkpoint_journal(force=True)
+        logging.info(f"[ChunkedDownloader] Segmented download: {len(self._segments)} ranges over {self.connections} connections, {read_size(self.downloaded_bytes)} already verified")
+        
+        self._pending = queue.Queue()
+        for seg in self._segments:
+            self._pending.put(seg)
+        self._errors = []
+        self._workers = []
+        self._active_workers = 0
+        self._target_workers = min(self.connections, len(self._segments))
+        # Adapt between half and double the configured count; one connection stays one
+        self._min_workers = max(1, self.connections // 2)
+        self._max_workers = self.connections if self.connections == 1 else min(self.MAX_CONNECTIONS, self.connections * 2)
+        self._adapt_ceiling = self._max_workers
+        self._adapt_ceiling_time = time.time()
+        self._adapt_baseline = (0.0, self._target_workers)
+        self._writer = WriteBehindWriter(self.part_path, 'r+b', self.write_buffer, self.drop_cache)
+        self._hash_stop.clear()
+        hash_thread = threading.Thread(target=self._hash_worker, daemon=True)
+        hash_thread.start()
+        try:
+            self._run_scheduler()
+        finally:
+            try:
+                self._writer.close()
+            except DiskWriteError as e:
+                self._errors.append(e)
+            self._hash_stop.set()
+            hash_thread.join()
+        
+        self._checkpoint_journal(force=True)
+        
+        errors = self._errors
+        if any(isinstance(e, RangeNotSupportedError) for e in errors):
+            raise RangeNotSupportedError(str(errors[0]))
+        if errors or not all(seg.done for seg in self._segments):
+            logging.error(f"[ChunkedDownloader] Segmented download failed: {errors[0] if errors else 'incomplete'}")
+            return False
+        
+        with self._file_lock:
+            os.replace(self.part_path, self.dest_path)
+        self.journal.remove()
+        self._update_progress(force=True)
+        logging.info(f"[ChunkedDownloader] Download complete: {read_size(self.total_size)}")
+        if len(self.mirrors) > 1:
+            logging.info(f"[ChunkedDownloader] Bytes per mirror: {', '.join(f'{m.host}={read_size(m.received)}' for m in self.mirrors)}")
+        self._record_hash()
+        return True
     
     def download(self) -> bool:
         """
         Download the file with streaming and automatic resume on failure.
         Returns True if successful, False otherwise.
         """
+        self.watchdog.start()
         try:
-            # Probe server for capabilities
-            self._probe_server()
-            
-            # Check for existing partial download
+            # Check for existing partial download, then learn size and range support
             existing_size = self._get_existing_size()
+            self._detect_server(existing_size)
+            if len(self.mirrors) > 1:
+                self._probe_mirrors()
             
             if self.total_size and existing_size >= self.total_size:
                 logging.info(f"[ChunkedDownloader] File already complete: {read_size(existing_size)}")
+                self._stream_written = existing_size
+                self._record_hash()
                 return True
             
+            if self._use_segmented():
+                self.journal = DownloadJournal(self.part_path + DownloadJournal.SUFFIX, self.total_size)
+                if existing_size > 0:
+                    # Continue a linear partial download by treating its prefix as done
+                    with self._file_lock:
+                        os.replace(self.dest_path, self.part_path)
+                    self.journal.reset([(0, existing_size)])
+                elif not self.journal.load(self.part_path):
+                    if os.path.exists(self.part_path):
+                        self._discard_partial()
+                    self.journal.reset()
+                self.start_time = time.time()
+                try:
+                    return self._download_segmented()
+                except RangeNotSupportedError as e:
+                    logging.warning(f"[ChunkedDownloader] {e}, falling back to single stream")
+                    self.supports_range = False
+                    self.total_size = None  # Relearned from the stream; it may have changed
+                    self.history.record_ranges(urlparse(self.url).netloc, False)
+                    self._discard_primed()
+                    self._abort.clear()
+                    self.journal.remove()
+                    self.journal = None
+                    if os.path.exists(self.part_path):
+                        os.remove(self.part_path)
+                    self._discard_partial()
+                    existing_size = 0
+            
+            if os.path.exists(self.part_path):
+                # Ranged progress from an earlier run can't be reused on a single stream
+                logging.warning("[ChunkedDownloader] Discarding ranged partial download")
+                os.remove(self.part_path)
+                DownloadJournal(self.part_path + DownloadJournal.SUFFIX, 0).remove()
+                self._discard_partial()
+
             if existing_size > 0 and self.supports_range:
                 logging.info(f"[ChunkedDownloader] Resuming from {read_size(existing_size)}")
                 self.downloaded_bytes = existing_size
@@ -444,19 +2245,45 @@ class ChunkedDownloader:
                 if existing_size > 0 and not self.supports_range:
                     logging.warning("[ChunkedDownloader] Server doesn't support range requests, starting fresh")
                     os.remove(self.dest_path)
+                    self._discard_partial()
                 self.downloaded_bytes = 0
             
+            # A known size without range support can't resume, so stream into a
+            # preallocated .part and only rename it into place once it's whole
+            preallocated = self.total_size is not None and not self.supports_range
+            
             self.start_time = time.time()
-            retry_count = 0
-            retry_delay = self.RETRY_DELAY_BASE
+            retry_count = 0  # Consecutive failures without new data
             
-            # Retry loop - keeps trying until success or max retries
-            while retry_count < self.MAX_RETRIES:
+            # Retry loop - keeps trying until success or the retry budget runs out
+            while True:
+                attempt_start = self.downloaded_bytes
                 # Open file for writing/appending
-                mode = 'ab' if self.downloaded_bytes > 0 else 'wb'
+                if preallocated:
+                    preallocate_file(self.part_path, self.total_size)
+                    target, mode = self.part_path, 'r+b'
+                else:
+                    target, mode = self.dest_path, 'ab' if self.downloaded_bytes > 0 else 'wb'
                 
-                with open(self.dest_path, mode) as f:
-                    success = self._stream_download(self.downloaded_bytes, f)
+                if self.hasher.offset > self.downloaded_bytes:
+                    self.hasher.reset()
+                # Hash a resumed prefix from disk so the stream can continue in memory
+                if self.hash_archive:
+                    self.hasher.catch_up(target, self.downloaded_bytes)
+                self._stream_written = self.downloaded_bytes
+                
+                self._writer = WriteBehindWriter(target, mode, self.write_buffer, self.drop_cache)
+                try:
+                    success = self._stream_download(self.downloaded_bytes, self._writer)
+                finally:
+                    self._writer.close()
+                
+                if success and preallocated:
+                    if self.downloaded_bytes < self.total_size:
+                        logging.error(f"[ChunkedDownloader] Stream ended early at {read_size(self.downloaded_bytes)} and server doesn't support resume")
+                        return False
+                    with self._file_lock:
+                        os.replace(self.part_path, self.dest_path)
                 
                 if success:
                     # Check if download is complete
@@ -470,53 +2297,613 @@ class ChunkedDownloader:
                     if self.total_size is None:
                         # No total size known - assume complete if stream finished
                         logging.info(f"[ChunkedDownloader] Download complete: {read_size(final_size)}")
+                        self._record_hash()
                         return True
                     elif final_size >= self.total_size - 1024:
                         # Download is complete (within 1KB tolerance)
                         # Clear retry status
                         if 'retryAttempt' in self.game_info.get('downloadingData', {}):
                             del self.game_info['downloadingData']['retryAttempt']
-                            safe_write_json(self.game_info_path, self.game_info)
+                            self.state.submit()
                         
                         # Final progress update
                         self._update_progress(force=True)
                         
                         logging.info(f"[ChunkedDownloader] Download complete: {read_size(final_size)}")
+                        self._record_hash()
                         return True
                     else:
                         # Partial download - continue
                         logging.info(f"[ChunkedDownloader] Partial: {read_size(final_size)}/{read_size(self.total_size)}, continuing...")
                         self.downloaded_bytes = final_size
+                        self._record_reconnect()
+                        continue
+                
+                if self._abort.is_set():
+                    logging.info("[ChunkedDownloader] Download cancelled")
+                    return False
+                
+                # Stream was interrupted - retry if we have range support
+                if not self.supports_range:
+                    logging.error("[ChunkedDownloader] Download interrupted and server doesn't support resume")
+                    return False
+                
+                retry_count = retry_count + 1 if self.downloaded_bytes == attempt_start else 1
+                self.downloaded_bytes = os.path.getsize(self.dest_path) if os.path.exists(self.dest_path) else 0
+                
+                # Update game info with retry status
+                self.game_info["downloadingData"]["retryAttempt"] = retry_count
+                self._record_reconnect()
+                
+                if self._stream_watch and self._stream_watch.stalled:
+                    logging.info(f"[ChunkedDownloader] Reconnecting after stall, resuming from {read_size(self.downloaded_bytes)}")
+                    continue
+                error = self._stream_error or ConnectionError("stream ended early")
+                delay = self.retry.failure(error, retry_count)
+                if delay is None:
+                    logging.error(f"[ChunkedDownloader] Giving up after {self.retry.failures} failures without progress: {error}")
+                    return False
+                # The pool is kept: urllib3 already dropped the broken connection
+                logging.info(f"[ChunkedDownloader] Retry {retry_count} ({RetryBudget.classify(error)}) in {delay:.1f}s, resuming from {read_size(self.downloaded_bytes)}")
+                self._abort.wait(delay)
+            
+        except Exception as e:
+            logging.error(f"[ChunkedDownloader] Download failed: {e}")
+            raise
+        finally:
+            self._discard_primed()
+            self.watchdog.stop()
+            logging.info(f"[ChunkedDownloader] Receive stats: {self.receive_stats.as_dict(self._buffers)}")
+            if any(self.retry.counts.values()):
+                logging.info(f"[ChunkedDownloader] Failures by kind: {self.retry.counts}")
+            if self.limiter:
+                logging.info(f"[ChunkedDownloader] Throttled {self.limiter.waited:.1f}s by the {read_size(self.limiter.rate)}/s limit")
+            if self._owns_session:
+                self.session.close()
+            if self._owns_state:
+                self.state.close()
+
+
+# ZIP Extraction
+
+
+def zip_member_path(dest_dir: str, name: str) -> Optional[str]:
+    """Where member `name` goes under dest_dir, dropping drive letters and '..' like zipfile does."""
+    parts = [p for p in name.replace('\\', '/').split('/') if p not in ('', '.', '..')]
+    if parts and os.name == 'nt':
+        if re.fullmatch(r'[A-Za-z]:', parts[0]):
+            parts = parts[1:]
+        parts = [re.sub(r'[:<>|"?*]', '_', p).rstrip(' .') or '_' for p in parts]
+    if not parts:
+        return None
+    path = os.path.join(dest_dir, *parts)
+    return path + os.sep if name.endswith('/') else path
+
+
+class ZipStreamError(Exception):
+    """Raised when a ZIP can't be decoded front to back from its local headers."""
+
+
+class _PrefixDiscarded(Exception):
+    """The downloader threw away the bytes a StreamingZipExtractor was reading."""
+
+
+class StreamingZipExtractor:
+    """
+    Extracts a ZIP archive from the front while it is still downloading.
+    
+    Local file headers are decoded as the downloaded prefix grows and each
+    member is inflated straight to its final path with its CRC checked, so
+    extraction finishes moments after the last byte arrives instead of
+    starting then. Every SAVE_INTERVAL bytes the offset after the last whole
+    member is checkpointed, and unless the archive is kept the disk space
+    behind it is released, so a large install needs little more than its
+    own size on disk.
+    
+    Members the stream can't handle (encryption, compression other than
+    store/deflate, stored members with trailing descriptors) stop it at a
+    member boundary; whatever is left is extracted from the finished archive
+    through its central directory.
+    
+    Progress is kept in a small JSON file beside the archive so an
+    interrupted download resumes extraction where it stopped.
+    """
+    
+    LOCAL_SIGNATURE = b'PK\x03\x04'
+    DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+    END_SIGNATURES = (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06')  # Central directory reached
+    LOCAL_HEADER = struct.Struct('<5H3L2H')  # After the signature
+    ZIP64_EXTRA = 0x0001
+    READ_SIZE = 1024 * 1024
+    OUTPUT_LIMIT = 4 * 1024 * 1024  # Most inflated bytes held per step
+    POLL_INTERVAL = 0.2
+    SAVE_INTERVAL = 64 * 1024 * 1024
+    STATE_SUFFIX = ".extract"
+    
+    def __init__(self, source: "ChunkedDownloader", dest_dir: str, member_filter, keep_archive: bool = True):
+        self.source = source
+        self.dest_dir = dest_dir
+        self.member_filter = member_filter
+        self.keep_archive = keep_archive
+        self.state_path = source.dest_path + self.STATE_SUFFIX
+        self.start_offset = self._load_state()  # Members before this were extracted by an earlier run
+        self.offset = self.start_offset  # Next local header
+        self.extracted: Dict[str, int] = {}  # Member name -> size, this run
+        self.failed: Dict[str, str] = {}  # Member name -> why its data didn't check out
+        self.bytes_written = 0
+        self.is_zip: Optional[bool] = None  # Unknown until the first bytes arrive
+        self.finished = False  # Every member up to the central directory is done
+        self.stopped: Optional[str] = None  # Why the stream gave up early
+        self._saved_offset = self.start_offset
+        self._generation = source.generation
+        self._buf = bytearray()
+        self._buf_pos = 0
+        self._pos = self.start_offset  # Archive offset of _buf[_buf_pos]
+        self._final = threading.Event()  # The download has ended; no more bytes will come
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _load_state(self) -> int:
+        """Resume offset saved by an earlier run, restoring how much of the archive it released."""
+        if not os.path.exists(self.state_path):
+            return 0
+        if not (os.path.exists(self.source.part_path) or os.path.exists(self.source.dest_path)):
+            self.remove_state()  # The archive it describes is gone
+            return 0
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            offset, released = int(state['resumeOffset']), int(state['released'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logging.warning(f"[StreamingZipExtractor] Ignoring unreadable {self.state_path}: {e}")
+            return 0
+        self.source.released = released
+        self.source.hash_archive = released == 0
+        logging.info(f"[StreamingZipExtractor] Resuming at {read_size(offset)} ({read_size(released)} of the archive already released)")
+        return offset
+    
+    def remove_state(self):
+        try:
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+        except OSError as e:
+            logging.warning(f"[StreamingZipExtractor] Could not remove {self.state_path}: {e}")
+    
+    def start(self) -> "StreamingZipExtractor":
+        self._thread.start()
+        return self
+    
+    def finish(self, complete: bool):
+        """Wait for the rest of a complete archive to be extracted, or stop where the stream is."""
+        if complete:
+            self._final.set()
+        else:
+            self._stop.set()
+        self._thread.join()
+        if self.offset > self._saved_offset:
+            self._checkpoint()
+    
+    def _run(self):
+        while True:
+            try:
+                self._extract()
+                return
+            except _PrefixDiscarded:
+                logging.info(f"[StreamingZipExtractor] Download restarted, extracting from the beginning")
+                self.offset = self.start_offset = self._saved_offset = 0
+                self._buf, self._buf_pos, self._pos = bytearray(), 0, 0
+            except (ZipStreamError, OSError) as e:
+                self.stopped = str(e)
+                logging.warning(f"[StreamingZipExtractor] Stopped at {read_size(self.offset)}: {e}; the rest is extracted after the download")
+                return
+    
+    def _take(self, size: int, exact: bool = True) -> Optional[bytes]:
+        """The next `size` bytes (any non-empty part when not exact), waiting for the download; None at its end."""
+        while True:
+            available = len(self._buf) - self._buf_pos
+            if available >= size or (available and not exact):
+                count = min(size, available)
+                data = bytes(self._buf[self._buf_pos:self._buf_pos + count])
+                self._buf_pos += count
+                self._pos += count
+                return data
+            if self._stop.is_set():
+                return None
+            if self.source.generation != self._generation:
+                self._generation = self.source.generation
+                raise _PrefixDiscarded()
+            del self._buf[:self._buf_pos]
+            self._buf_pos = 0
+            final = self._final.is_set()  # Checked before reading so the last bytes aren't missed
+            more = self.source.read_prefix(self._pos + len(self._buf), max(self.READ_SIZE, size - len(self._buf)))
+            if more:
+                self._buf += more
+            elif final:
+                return None
+            else:
+                self._stop.wait(self.POLL_INTERVAL)
+    
+    def _untake(self, count: int):
+        """Step back over bytes just taken that belong to what follows."""
+        self._buf_pos -= count
+        self._pos -= count
+    
+    def _extract(self):
+        while True:
+            signature = self._take(4)
+            if signature is None:
+                if self._final.is_set() and not self._stop.is_set():
+                    raise ZipStreamError("archive ended before its central directory")
+                return
+            if self.is_zip is None:
+                self.is_zip = signature == self.LOCAL_SIGNATURE or self.start_offset > 0
+                if not self.is_zip:
+                    self.stopped = "not a ZIP archive"
+                    return
+            if signature in self.END_SIGNATURES:
+                self.finished = True
+                logging.info(f"[StreamingZipExtractor] Extracted {len(self.extracted)} members ({read_size(self.bytes_written)}) while downloading")
+                return
+            if signature != self.LOCAL_SIGNATURE:
+                raise ZipStreamError(f"no local header at {read_size(self.offset)}")
+            if not self._extract_member():
+                return
+            self.offset = self._pos
+            if self.offset - self._saved_offset >= self.SAVE_INTERVAL:
+                self._checkpoint()
+    
+    def _extract_member(self) -> bool:
+        """Decode one member after its signature; False if the download ended inside it."""
+        header = self._take(self.LOCAL_HEADER.size)
+        if header is None:
+            return False
+        _, flags, method, _, _, crc, compressed, size, name_len, extra_len = self.LOCAL_HEADER.unpack(header)
+        raw_name = self._take(name_len)
+        extra = self._take(extra_len)
+        if raw_name is None or extra is None:
+            return False
+        # Named the way zipfile names central directory entries, so the two can be matched
+        name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437').split('\x00', 1)[0]
+        if os.sep != '/':
+            name = name.replace(os.sep, '/')
+        zip64 = False
+        if compressed == 0xFFFFFFFF or size == 0xFFFFFFFF:
+            size, compressed, zip64 = self._zip64_sizes(extra, size, compressed)
+        if flags & 0x1:
+            raise ZipStreamError(f"{name} is encrypted")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ZipStreamError(f"{name} uses compression method {method}")
+        descriptor = bool(flags & 0x8)
+        if descriptor and method == zipfile.ZIP_STORED:
+            raise ZipStreamError(f"{name} is stored without sizes")
+        
+        wanted = self.member_filter(name)
+        target = zip_member_path(self.dest_dir, name) if wanted else None
+        if target and name.endswith('/'):
+            os.makedirs(target, exist_ok=True)
+            target = None
+        out = None
+        if target:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            out = open(target, 'wb')
+        try:
+            result = self._copy_data(out, method, None if descriptor else compressed)
+            if result is None:
+                return False
+            actual_crc, written = result
+            if descriptor:
+                trailer = self._read_descriptor(zip64)
+                if trailer is None:
+                    return False
+                crc, size = trailer
+        finally:
+            if out:
+                out.close()
+        if actual_crc != crc or written != size:
+            # Sizes framed the member, so only its own data is bad; drop it and go on
+            logging.warning(f"[StreamingZipExtractor] {name} failed its CRC check, skipping it")
+            if target:
+                os.remove(target)
+            if wanted:
+                self.failed[name] = "Bad CRC-32"
+            return True
+        if wanted:
+            self.extracted[name] = size
+            self.bytes_written += size
+        return True
+    
+    def _zip64_sizes(self, extra: bytes, size: int, compressed: int) -> Tuple[int, int, bool]:
+        pos = 0
+        while pos + 4 <= len(extra):
+            tag, length = struct.unpack_from('<2H', extra, pos)
+            if tag == self.ZIP64_EXTRA:
+                values = list(struct.unpack_from(f'<{length // 8}Q', extra, pos + 4))
+                if size == 0xFFFFFFFF and values:
+                    size = values.pop(0)
+                if compressed == 0xFFFFFFFF and values:
+                    compressed = values.pop(0)
+                return size, compressed, True
+            pos += 4 + length
+        raise ZipStreamError("ZIP64 member without its extra field")
+    
+    def _copy_data(self, out, method: int, compressed: Optional[int]) -> Optional[Tuple[int, int]]:
+        """Inflate or copy member data into `out`; (crc, size), or None if the download ended first."""
+        inflater = zlib.decompressobj(-zlib.MAX_WBITS) if method == zipfile.ZIP_DEFLATED else None
+        remaining = compressed
+        crc = written = 0
+        while remaining is None or remaining > 0:
+            chunk = self._take(self.READ_SIZE if remaining is None else min(self.READ_SIZE, remaining), exact=False)
+            if chunk is None:
+                return None
+            if remaining is not None:
+                remaining -= len(chunk)
+            while chunk:
+                data = inflater.decompress(chunk, self.OUTPUT_LIMIT) if inflater else chunk
+                chunk = inflater.unconsumed_tail if inflater else b''
+                if data:
+                    crc = zlib.crc32(data, crc)
+                    written += len(data)
+                    if out:
+                        out.write(data)
+                if inflater and inflater.eof:
+                    break
+            if inflater and inflater.eof:
+                if remaining is None:
+                    self._untake(len(inflater.unused_data))
+                break
+        if inflater and (not inflater.eof or remaining):
+            raise ZipStreamError("deflate stream doesn't match the member size")
+        return crc, written
+    
+    def _read_descriptor(self, zip64: bool) -> Optional[Tuple[int, int]]:
+        """(crc, size) from the data descriptor after a member."""
+        first = self._take(4)
+        if first is None:
+            return None
+        if first == self.DESCRIPTOR_SIGNATURE:
+            first = self._take(4)
+            if first is None:
+                return None
+        sizes = self._take(16 if zip64 else 8)
+        if sizes is None:
+            return None
+        crc = struct.unpack('<L', first)[0]
+        _, size = struct.unpack('<2Q' if zip64 else '<2L', sizes)
+        return crc, size
+    
+    def _checkpoint(self):
+        """Record the resume point, then release the archive bytes behind it."""
+        released = self.source.released
+        if not self.keep_archive:
+            released = max(released, self.source.releasable(self.offset))
+        # The resume point has to be on disk before the bytes behind it are gone
+        safe_write_json(self.state_path, {"archive": os.path.basename(self.source.dest_path),
+                                          "resumeOffset": self.offset, "released": released})
+        if released > self.source.released and not self.source.release_prefix(released):
+            logging.info(f"[StreamingZipExtractor] Filesystem can't release archive space; keeping it")
+            self.keep_archive = True
+        self._saved_offset = self.offset
+
+
+class ParallelZipExtractor:
+    """
+    Extracts ZIP members on a pool of threads, each with its own handle on
+    the archive. zlib releases the GIL while inflating and file writes
+    release it too, so threads spread the work across cores without
+    process startup or pickling.
+    
+    Members are handed out largest first from one shared list
+    (longest-processing-time scheduling): the big .pak files start right
+    away on separate workers and the thousands of small files fill in
+    around them, so no worker is left holding several giants at the end.
+    
+    zipfile checks each member's CRC as its last byte is read, so data is
+    verified in the same pass that writes it. A member that fails is
+    deleted and listed in ``failed`` while the rest carry on; only errors
+    outside the archive data (a full disk, say) stop the extraction.
+    """
+    
+    COPY_CHUNK = 1024 * 1024
+    
+    def __init__(self, archive_path: str, dest_dir: str, workers: int, open_archive=None):
+        self.archive_path = archive_path
+        self.dest_dir = dest_dir
+        self.workers = max(1, workers)
+        self._open = open_archive or (lambda path: open(path, 'rb'))
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._errors: List[BaseException] = []
+        self.failed: Dict[str, str] = {}  # Member name -> why its data didn't check out
+        self._queue: List[zipfile.ZipInfo] = []
+        self._next = 0
+    
+    def extract(self, members: List[zipfile.ZipInfo], on_member=None, on_bytes=None):
+        """
+        Extract `members`. `on_member(info)` is called under a lock as each
+        file completes and `on_bytes(info, count)` as each chunk is written.
+        """
+        # Create every directory up front so workers never race to make the same one
+        for info in members:
+            path = zip_member_path(self.dest_dir, info.filename)
+            if path:
+                os.makedirs(path if info.is_dir() else os.path.dirname(path), exist_ok=True)
+        self._queue = sorted((m for m in members if not m.is_dir()),
+                             key=lambda m: m.compress_size + m.file_size, reverse=True)
+        self._next = 0
+        workers = min(self.workers, len(self._queue))
+        if workers <= 1:
+            self._work(on_member, on_bytes)
+        else:
+            threads = [threading.Thread(target=self._work, args=(on_member, on_bytes), daemon=True) for _ in range(workers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        if self._errors:
+            raise self._errors[0]
+    
+    def _work(self, on_member, on_bytes):
+        try:
+            with self._open(self.archive_path) as archive_file, zipfile.ZipFile(archive_file, 'r') as zip_ref:
+                while not self._failed.is_set():
+                    with self._lock:
+                        if self._next >= len(self._queue):
+                            return
+                        info = self._queue[self._next]
+                        self._next += 1
+                    try:
+                        self._copy(zip_ref, info, on_bytes)
+                    except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+                        self._discard(info, e)
                         continue
-                
-                # Stream was interrupted - retry if we have range support
-                if not self.supports_range:
-                    logging.error("[ChunkedDownloader] Download interrupted and server doesn't support resume")
-                    return False
-                
-                retry_count += 1
-                self.downloaded_bytes = os.path.getsize(self.dest_path) if os.path.exists(self.dest_path) else 0
-                
-                # Update game info with retry status
-                self.game_info["downloadingData"]["retryAttempt"] = retry_count
-                safe_write_json(self.game_info_path, self.game_info)
-                
-                logging.info(f"[ChunkedDownloader] Retry {retry_count}/{self.MAX_RETRIES} in {retry_delay}s, resuming from {read_size(self.downloaded_bytes)}")
-                time.sleep(retry_delay)
-                retry_delay = min(retry_delay * 1.5, self.RETRY_DELAY_MAX)
-                
-                # Recreate session
-                self.session.close()
-                self.session = create_robust_session()
-            
-            logging.error(f"[ChunkedDownloader] Max retries ({self.MAX_RETRIES}) exceeded")
-            return False
-            
+                    if on_member:
+                        with self._lock:
+                            on_member(info)
         except Exception as e:
-            logging.error(f"[ChunkedDownloader] Download failed: {e}")
-            raise
+            with self._lock:
+                self._errors.append(e)
+            self._failed.set()
+    
+    def _copy(self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, on_bytes):
+        """Write one member in chunks, so a single huge file still shows progress."""
+        path = zip_member_path(self.dest_dir, info.filename)
+        if not path:
+            return
+        with zip_ref.open(info) as source, open(path, 'wb') as target:
+            while True:
+                chunk = source.read(self.COPY_CHUNK)
+                if not chunk:
+                    break
+                target.write(chunk)
+                if on_bytes:
+                    with self._lock:
+                        on_bytes(info, len(chunk))
+    
+    def _discard(self, info: zipfile.ZipInfo, error: BaseException):
+        """Remove what was written of a member that failed its check."""
+        logging.warning(f"[ParallelZipExtractor] {info.filename} is corrupt, skipping it: {error}")
+        path = zip_member_path(self.dest_dir, info.filename)
+        try:
+            if path and os.path.isfile(path):
+                os.remove(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.failed[info.filename] = str(error)
+
+
+def benchmark_zip_extraction(archive_path: str, workers: int) -> Dict[str, Any]:
+    """
+    Time ZipFile.extractall against ParallelZipExtractor on the same archive,
+    each into a scratch folder beside it that is removed afterwards.
+    """
+    with open(archive_path, 'rb') as f:
+        while f.read(16 * 1024 * 1024):
+            pass  # Warm the page cache so the first run isn't the only one reading from disk
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        members = zip_ref.infolist()
+    size = sum(m.file_size for m in members)
+    results: Dict[str, Any] = {"archive": archive_path, "members": len(members), "bytes": size, "workers": workers}
+    runs = [("extractall", None), ("parallel", workers)]
+    for name, count in runs:
+        scratch = mkdtemp(prefix="qd-bench-", dir=os.path.dirname(os.path.abspath(archive_path)))
+        try:
+            start = time.perf_counter()
+            if count is None:
+                with zipfile.ZipFile(archive_path) as zip_ref:
+                    zip_ref.extractall(scratch)
+            else:
+                ParallelZipExtractor(archive_path, scratch, count).extract(members)
+            elapsed = time.perf_counter() - start
         finally:
-            self.session.close()
+            shutil.rmtree(scratch, ignore_errors=True)
+        results[name] = {"seconds": round(elapsed, 3), "rate": f"{read_size(size / elapsed if elapsed else 0)}/s"}
+    results["speedup"] = round(results["extractall"]["seconds"] / max(results["parallel"]["seconds"], 1e-9), 2)
+    return results
+
+
+# Archive Index
+
+
+class ArchiveEntry:
+    """One member of an archive as its listing describes it."""
+    __slots__ = ('name', 'size', 'crc', 'is_dir')
+
+    def __init__(self, name: str, size: int, crc: Optional[int], is_dir: bool):
+        self.name = name
+        self.size = size
+        self.crc = crc
+        self.is_dir = is_dir
+
+
+class ArchiveIndex:
+    """
+    The member list of one archive, read once from the ZIP central directory
+    or from `unrar lt`, and shared by everything that used to list or walk
+    for it: progress totals, junk filtering, nested archive discovery and
+    the filemap.
+
+    ZIP indexes keep their ZipInfo objects so extraction doesn't parse the
+    central directory a second time.
+    """
+
+    def __init__(self, path: str, entries: List[ArchiveEntry], zip_infos: Optional[List[zipfile.ZipInfo]] = None):
+        self.path = path
+        self.entries = entries
+        self.zip_infos = zip_infos
+
+    @classmethod
+    def read(cls, path: str) -> "ArchiveIndex":
+        """List `path`; raises OSError, BadZipFile or RuntimeError if it can't be listed."""
+        if os.path.splitext(path)[1].lower() == '.zip':
+            with zipfile.ZipFile(path, 'r') as zip_ref:
+                infos = zip_ref.infolist()
+            return cls(path, [ArchiveEntry(i.filename, i.file_size, i.CRC, i.is_dir()) for i in infos], infos)
+        unrar_bin = shutil.which('unrar') or shutil.which('unrar-free')
+        if not unrar_bin:
+            raise RuntimeError("System 'unrar' binary not found")
+        # Technical listing: one "Key: value" block per member, names kept whole
+        result = subprocess.run([unrar_bin, 'lt', '-p-', path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(f"unrar lt exited with code {result.returncode}: {result.stderr.decode(errors='replace').strip()}")
+        return cls(path, cls.parse_technical_listing(result.stdout.decode(errors='replace')))
+
+    @staticmethod
+    def parse_technical_listing(text: str) -> List[ArchiveEntry]:
+        """Entries from `unrar lt` output. Files split across volumes are listed once."""
+        entries: Dict[str, ArchiveEntry] = {}
+        block: Dict[str, str] = {}
+
+        def flush():
+            kind = block.get('type', '').lower()
+            if 'name' in block and kind in ('file', 'directory'):
+                try:
+                    size = int(block.get('size', '0'))
+                    crc = int(block['crc32'], 16) if block.get('crc32') else None
+                except ValueError:
+                    size, crc = 0, None
+                name = block['name'].replace('\\', '/')
+                entries[name] = ArchiveEntry(name, size, crc, kind == 'directory')
+            block.clear()
+
+        for line in text.splitlines():
+            key, sep, value = line.strip().partition(':')
+            if not sep:
+                continue
+            key = key.strip().lower()
+            if key == 'name':
+                flush()
+            block[key] = value.strip()
+        flush()
+        return list(entries.values())
+
+    def files(self, member_filter=None) -> List[ArchiveEntry]:
+        """File entries, optionally only those `member_filter(name)` accepts."""
+        return [e for e in self.entries if not e.is_dir and (member_filter is None or member_filter(e.name))]
+
+    def archives(self, archive_exts: set, member_filter=None) -> List[ArchiveEntry]:
+        """File entries that are themselves archives."""
+        return [e for e in self.files(member_filter) if os.path.splitext(e.name)[1].lower() in archive_exts]
 
 
 # Main Downloader Class
@@ -533,9 +2920,12 @@ class RobustDownloader:
         'fuckingfast.net',
         'fuckingfast.co'
     ]
+    PROBE_BYTES = 4 * 1024 * 1024  # Timed ranged read per candidate mirror
+    PROBE_TIMEOUT = 5.0
     
     def __init__(self, game: str, online: bool, dlc: bool, isVr: bool, 
-                 updateFlow: bool, version: str, size: str, download_dir: str, gameID: str = ""):
+                 updateFlow: bool, version: str, size: str, download_dir: str, gameID: str = "",
+                 session: Optional[requests.Session] = None, budget: Optional[ConnectionBudget] = None):
         self.game = game
         self.online = online
         self.dlc = dlc
@@ -548,6 +2938,27 @@ class RobustDownloader:
         os.makedirs(self.download_dir, exist_ok=True)
         self.game_info_path = os.path.join(self.download_dir, f"{sanitize_folder_name(game)}.QuadDown.json")
         self.withNotification = None
+        self.session = session
+        self.budget = budget
+        self.defer_post_download = False  # The daemon runs it once its queue drains
+        self._chunked: Optional[ChunkedDownloader] = None
+        self._cancelled = False
+        self.settings = load_settings()
+        self.connections = get_download_connections(self.settings)
+        self.write_buffer = get_write_buffer_size(self.settings)
+        self.zero_copy = get_zero_copy(self.settings)
+        self.page_cache_friendly = get_page_cache_friendly(self.settings)
+        self.limiter = get_bandwidth_limiter(self.settings)
+        self.stall_floor, self.stall_window = get_stall_settings(self.settings)
+        self.stream_extract = get_stream_extract(self.settings)
+        self.keep_archive = get_keep_archive(self.settings)
+        self.extraction_threads = get_extraction_threads(self.settings)
+        self.archive_concurrency = get_archive_concurrency(self.settings)
+        self.zip_prevalidate = get_zip_prevalidate(self.settings)
+        self._extract_errors: List[Dict[str, str]] = []  # Members that failed their CRC check
+        self._junk_cleanup_pending = False  # An unindexed archive left junk for a full sweep
+        self._stream_extractor: Optional[StreamingZipExtractor] = None
+        logging.info(f"[RobustDownloader] Settings: connections={self.connections}, write_buffer={read_size(self.write_buffer)}, zero_copy={self.zero_copy}, page_cache_friendly={self.page_cache_friendly}, limit={read_size(self.limiter.rate) + '/s' if self.limiter else 'none'}, stream_extract={self.stream_extract}, keep_archive={self.keep_archive}, extraction_threads={self.extraction_threads}, archive_concurrency={self.archive_concurrency}")
         
         # Initialize or update game info
         if updateFlow and os.path.exists(self.game_info_path):
@@ -588,7 +2999,9 @@ class RobustDownloader:
                     }
                 }
             }
-        safe_write_json(self.game_info_path, self.game_info)
+        self.state = StateWriter(self.game_info_path, self.game_info, get_state_write_interval(self.settings))
+        atexit.register(self.state.close)
+        self.state.flush()
     
     def _get_filename_from_url(self, url: str) -> str:
         """Extract filename from URL or Content-Disposition header."""
@@ -625,19 +3038,22 @@ class RobustDownloader:
         else:
             return 'unknown', sig.hex()
     
-    def download(self, url: str, withNotification: Optional[str] = None):
-        """Main download entry point."""
+    def download(self, url: str, withNotification: Optional[str] = None, mirrors: Optional[List[str]] = None):
+        """Main download entry point. Mirrors are other hosts for the same archive."""
         self.withNotification = withNotification
         
         try:
+            mirrors = self._resolve_mirrors(mirrors or [])
+            
             # Check for Buzzheavier URLs
             if any(domain in url for domain in self.VALID_BUZZHEAVIER_DOMAINS):
-                self._download_buzzheavier(url)
+                self._download_buzzheavier(url, mirrors)
                 return
             
             # Update state
             self.game_info["downloadingData"]["downloading"] = True
-            safe_write_json(self.game_info_path, self.game_info)
+            self.state.submit()
+            progress_stream.emit("phase", phase="downloading")
             
             # Get filename
             base_name = self._get_filename_from_url(url)
@@ -650,9 +3066,7 @@ class RobustDownloader:
             if withNotification:
                 _launch_notification(withNotification, "Download Started", f"Starting download for {self.game}")
             
-            # Create chunked downloader and start download
-            downloader = ChunkedDownloader(url, dest, self.game_info, self.game_info_path)
-            success = downloader.download()
+            success = self._chunked_download(url, dest, mirrors)
             
             if success:
                 logging.info(f"[RobustDownloader] Download completed successfully")
@@ -662,7 +3076,7 @@ class RobustDownloader:
                 self.game_info["downloadingData"]["progressCompleted"] = "100.00"
                 self.game_info["downloadingData"]["progressDownloadSpeeds"] = "0.00 KB/s"
                 self.game_info["downloadingData"]["timeUntilComplete"] = "0s"
-                safe_write_json(self.game_info_path, self.game_info)
+                self.state.submit()
                 
                 # Detect and fix file extension
                 dest = self._fix_file_extension(dest)
@@ -676,6 +3090,10 @@ class RobustDownloader:
                 raise Exception("Download failed after all retries")
                 
         except Exception as e:
+            if self._cancelled:
+                logging.info(f"[RobustDownloader] Download cancelled: {e}")
+                handlestopped(self.game_info, self.game_info_path)
+                return
             err_str = str(e)
             if any(x in err_str for x in ['SSL: WRONG_VERSION_NUMBER', 'ssl.SSLError', 'WinError 10054', 
                                            'forcibly closed', 'ConnectionResetError']):
@@ -688,9 +3106,20 @@ class RobustDownloader:
             if withNotification:
                 _launch_notification(withNotification, "Download Error", f"Error downloading {self.game}: {e}")
     
+    def cancel(self):
+        """Abort the transfer in progress; download() then records it as stopped."""
+        self._cancelled = True
+        if self._chunked:
+            self._chunked.cancel()
+    
     def _fix_file_extension(self, dest: str) -> str:
         """Fix file extension based on detected file type."""
-        filetype, hexsig = self.detect_file_type(dest)
+        if self._stream_extractor:
+            # The stream already decoded it as a ZIP, and its checkpoints may have
+            # released the head of the file, so the magic bytes can read as zeros
+            filetype = 'zip'
+        else:
+            filetype, hexsig = self.detect_file_type(dest)
         logging.info(f"[RobustDownloader] Detected file type: {filetype}")
         
         ext_map = {'zip': '.zip', 'rar': '.rar', '7z': '.7z', 'exe': '.exe'}
@@ -716,11 +3145,148 @@ class RobustDownloader:
         
         return dest
     
-    def _download_buzzheavier(self, url: str):
-        """Download from Buzzheavier with robust chunked download and resume support."""
-        from bs4 import BeautifulSoup
+    def _chunked_download(self, url: str, dest: str, mirrors: Optional[List[str]] = None) -> bool:
+        """Download one archive to dest, starting on the fastest of its mirrors."""
+        rates: Dict[str, float] = {}
+        if mirrors:
+            url, mirrors, rates = self._rank_mirrors(url, mirrors)
+        downloader = ChunkedDownloader(url, dest, self.game_info, self.game_info_path,
+                                       connections=self.connections, write_buffer=self.write_buffer,
+                                       zero_copy=self.zero_copy,
+                                       drop_cache=self.page_cache_friendly,
+                                       state=self.state, session=self.session, budget=self.budget,
+                                       limiter=self.limiter, mirrors=mirrors,
+                                       stall_floor=self.stall_floor, stall_window=self.stall_window)
+        downloader.seed_mirror_rates(rates)
+        self._chunked = downloader
+        if self._cancelled:
+            downloader.cancel()
+        extractor = self._start_stream_extract(downloader) if self.stream_extract else None
+        success = False
+        try:
+            success = downloader.download() and not self._cancelled
+        finally:
+            if extractor:
+                extractor.finish(success)
+                if success and extractor.is_zip:
+                    self._stream_extractor = extractor
+        if len(downloader.mirrors) > 1:
+            history = MirrorHistory.default()
+            for mirror in downloader.mirrors:
+                # Only rates measured over a real share of the download are worth keeping
+                if mirror.rate > 0 and mirror.received >= ChunkedDownloader.MIN_SEGMENT_SIZE:
+                    history.record(mirror.host, mirror.rate)
+        return success
+    
+    # unrar masks for the members _wanted_member turns away, so they are never written
+    UNRAR_EXCLUDES = ('*.url', '_CommonRedist', f'_CommonRedist{os.sep}*',
+                      f'*{os.sep}_CommonRedist', f'*{os.sep}_CommonRedist{os.sep}*')
+    
+    @staticmethod
+    def _wanted_member(name: str) -> bool:
+        """Archive members worth installing; shortcuts and redistributable installers are skipped."""
+        return not name.endswith('.url') and '_CommonRedist' not in name
+    
+    def _start_stream_extract(self, downloader: ChunkedDownloader) -> StreamingZipExtractor:
+        """Extract the archive into the game folder while it downloads."""
+        return StreamingZipExtractor(downloader, self.download_dir, self._wanted_member,
+                                     keep_archive=self.keep_archive).start()
+    
+    def _probe_mirror(self, url: str) -> Optional[Tuple[float, float]]:
+        """Time a short ranged read: (bytes/s, seconds to first byte), or None if it failed."""
+        start = time.time()
+        try:
+            with self.session.get(url, headers={"Range": f"bytes=0-{self.PROBE_BYTES - 1}"}, stream=True,
+                                  timeout=(5, self.PROBE_TIMEOUT)) as response:
+                if response.status_code not in (200, 206):
+                    return None
+                received = 0
+                first_byte = None
+                for data in response.iter_content(chunk_size=64 * 1024):
+                    if first_byte is None:
+                        first_byte = time.time()
+                    received += len(data)
+                    if received >= self.PROBE_BYTES or time.time() - start > self.PROBE_TIMEOUT:
+                        break
+                if first_byte is None:
+                    return None
+                elapsed = time.time() - first_byte
+                return received / max(elapsed, 0.001), first_byte - start
+        except Exception as e:
+            logging.warning(f"[RobustDownloader] Probe of {urlparse(url).netloc} failed: {e}")
+            return None
+    
+    def _rank_mirrors(self, url: str, mirrors: List[str]) -> Tuple[str, List[str], Dict[str, float]]:
+        """
+        Order the candidate URLs fastest first, probing hosts without recent
+        history in parallel. Returns the winner, the rest, and each URL's
+        per-connection rate for seeding the mirror picker.
+        """
+        candidates = list(dict.fromkeys([url] + mirrors))
+        history = MirrorHistory.default()
+        known = {c: history.get(urlparse(c).netloc) for c in candidates}
+        unknown = [c for c in candidates if known[c] is None]
+        measured: Dict[str, Optional[Tuple[float, float]]] = {}
+        if unknown and self.session is None:
+            # Probe on the session the transfer then uses, so the winner's connection is already open
+            self.session = create_robust_session(pool_maxsize=max(self.connections, len(unknown)), retries=False)
+        if unknown:
+            def probe(candidate):
+                measured[candidate] = self._probe_mirror(candidate)
+            threads = [threading.Thread(target=probe, args=(c,), daemon=True) for c in unknown]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
         
-        logging.info(f"[RobustDownloader] Buzzheavier download: {url}")
+        stats: Dict[str, Tuple[float, float]] = {}
+        for candidate in candidates:
+            if known[candidate]:
+                stats[candidate] = (known[candidate]['rate'], known[candidate].get('ttfb', 0.0))
+            elif measured.get(candidate):
+                stats[candidate] = measured[candidate]
+                history.record(urlparse(candidate).netloc, *measured[candidate])
+        
+        def expected_time(candidate: str) -> float:
+            # Seconds to fetch one segment: latency plus transfer, so both count
+            if candidate not in stats:
+                return float('inf')
+            rate, ttfb = stats[candidate]
+            return ttfb + ChunkedDownloader.MIN_SEGMENT_SIZE / max(rate, 1.0)
+        
+        ranked = sorted(candidates, key=expected_time)
+        for candidate in ranked:
+            host = urlparse(candidate).netloc
+            if candidate in stats:
+                rate, ttfb = stats[candidate]
+                source = "history" if known[candidate] else "probe"
+                logging.info(f"[RobustDownloader] Mirror {host}: {read_size(rate)}/s, first byte {ttfb * 1000:.0f} ms ({source})")
+            else:
+                logging.info(f"[RobustDownloader] Mirror {host}: unreachable")
+        if ranked[0] != url:
+            logging.info(f"[RobustDownloader] Starting on fastest mirror {urlparse(ranked[0]).netloc}")
+        # Hosts that failed the probe would only stall the download's own mirror checks
+        return ranked[0], [c for c in ranked[1:] if c in stats], {c: stats[c][0] for c in stats}
+    
+    def _resolve_mirrors(self, mirrors: List[str]) -> List[str]:
+        """Turn mirror page links into direct file URLs, dropping any that can't be resolved."""
+        resolved = []
+        for mirror in mirrors:
+            try:
+                if any(domain in mirror for domain in self.VALID_BUZZHEAVIER_DOMAINS):
+                    mirror = self._resolve_buzzheavier(mirror)[0]
+                elif 'pixeldrain.com/u/' in mirror:
+                    # Share pages have a ranged file endpoint under the same ID
+                    file_id = mirror.split('pixeldrain.com/u/')[1].split('?')[0].strip('/')
+                    mirror = f"https://pixeldrain.com/api/file/{file_id}?download"
+                resolved.append(mirror)
+            except Exception as e:
+                logging.warning(f"[RobustDownloader] Skipping mirror {mirror}: {e}")
+        return resolved
+    
+    def _resolve_buzzheavier(self, url: str) -> Tuple[str, str]:
+        """Direct download URL and file title behind a Buzzheavier page."""
+        from bs4 import BeautifulSoup
         
         # Get the actual download URL from Buzzheavier
         session = create_robust_session()
@@ -749,17 +3315,22 @@ class RobustDownloader:
         final_url = f'https://{domain}' + hx_redirect if hx_redirect.startswith('/dl/') else hx_redirect
         
         session.close()
+        return final_url, title
+    
+    def _download_buzzheavier(self, url: str, mirrors: Optional[List[str]] = None):
+        """Download from Buzzheavier with robust chunked download and resume support."""
+        logging.info(f"[RobustDownloader] Buzzheavier download: {url}")
+        final_url, title = self._resolve_buzzheavier(url)
         
         # Use the robust ChunkedDownloader for the actual file download
         dest_path = os.path.join(self.download_dir, title)
         
         # Update state
         self.game_info["downloadingData"]["downloading"] = True
-        safe_write_json(self.game_info_path, self.game_info)
+        self.state.submit()
+        progress_stream.emit("phase", phase="downloading")
         
-        # Create chunked downloader and start download
-        downloader = ChunkedDownloader(final_url, dest_path, self.game_info, self.game_info_path)
-        success = downloader.download()
+        success = self._chunked_download(final_url, dest_path, mirrors)
         
         if success:
             logging.info(f"[Buzzheavier] Downloaded as: {dest_path}")
@@ -769,7 +3340,7 @@ class RobustDownloader:
             self.game_info["downloadingData"]["progressCompleted"] = "100.00"
             self.game_info["downloadingData"]["progressDownloadSpeeds"] = "0.00 KB/s"
             self.game_info["downloadingData"]["timeUntilComplete"] = "0s"
-            safe_write_json(self.game_info_path, self.game_info)
+            self.state.submit()
             
             # Detect and fix file extension
             dest_path = self._fix_file_extension(dest_path)
@@ -790,18 +3361,25 @@ class RobustDownloader:
             "currentFile": "",
             "filesExtracted": 0,
             "totalFiles": 0,
+            "bytesExtracted": 0,
+            "totalBytes": 0,
             "percentComplete": "0.00",
-            "extractionSpeed": "0 files/s"
+            "extractionSpeed": "0 B/s",
+            "timeUntilComplete": ""
         }
-        safe_write_json(self.game_info_path, self.game_info)
+        self.state.submit()
+        progress_stream.emit("phase", phase="extracting")
         
         # Track extraction timing
+        self._extract_errors = []
         self._extraction_start_time = time.time()
         self._files_extracted_count = 0
+        self._bytes_extracted = 0
+        self._bytes_already_extracted = 0  # Written by the stream or an earlier run, not this pass
+        self._progress_lock = threading.RLock()  # Archives extracting side by side share the counters
         self._last_progress_update = 0  # Track last JSON write time
         
         watching_path = os.path.join(self.download_dir, "filemap.QuadDown.json")
-        watching_data = {}
         archive_exts = {'.rar', '.zip'}
         
         # Determine archives to process
@@ -817,127 +3395,39 @@ class RobustDownloader:
                     if ext in archive_exts:
                         archives_to_process.append(os.path.join(root, file))
         
-        # Count total files for progress tracking
+        # List each archive once; the index feeds totals, nesting and the filemap
+        indexes: Dict[str, Optional[ArchiveIndex]] = {}
         total_files_to_extract = 0
+        self._total_bytes_to_extract = 0
         for arch_path in archives_to_process:
-            try:
-                ext = os.path.splitext(arch_path)[1].lower()
-                if ext == '.zip':
-                    with zipfile.ZipFile(arch_path, 'r') as zip_ref:
-                        for zip_info in zip_ref.infolist():
-                            if not zip_info.filename.endswith('.url') and '_CommonRedist' not in zip_info.filename and not zip_info.is_dir():
-                                total_files_to_extract += 1
-                elif ext == '.rar':
-                    import shutil as _shutil
-                    _unrar = _shutil.which('unrar') or _shutil.which('unrar-free')
-                    if _unrar:
-                        _result = subprocess.run([_unrar, 'l', arch_path], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        for _line in _result.stdout.decode(errors='replace').splitlines():
-                            _parts = _line.split()
-                            if len(_parts) >= 5 and _parts[0] not in ('-', 'Name', '---'):
-                                _fname = _parts[-1]
-                                if not _fname.endswith('.url') and '_CommonRedist' not in _fname and not _fname.endswith('/'):
-                                    total_files_to_extract += 1
-            except Exception as e:
-                logging.warning(f"[RobustDownloader] Could not count files in {arch_path}: {e}")
+            indexes[arch_path] = self._archive_index(arch_path)
+            if indexes[arch_path]:
+                files = indexes[arch_path].files(self._wanted_member)
+                total_files_to_extract += len(files)
+                self._total_bytes_to_extract += sum(e.size for e in files)
         
-        logging.info(f"[RobustDownloader] Total files to extract: {total_files_to_extract}")
+        logging.info(f"[RobustDownloader] Total files to extract: {total_files_to_extract} ({read_size(self._total_bytes_to_extract)})")
         self._total_files_to_extract = total_files_to_extract
         self._update_extraction_progress("Preparing...", 0, total_files_to_extract, force=True)
         
-        processed_archives = set()
-        
-        while archives_to_process:
-            current_archive = archives_to_process.pop(0)
-            
-            if current_archive in processed_archives:
-                continue
-            
-            processed_archives.add(current_archive)
-            ext = os.path.splitext(current_archive)[1].lower()
-            logging.info(f"[RobustDownloader] Extracting: {current_archive}")
-            
-            try:
-                if ext == '.zip':
-                    self._extract_zip(current_archive, watching_data)
-                elif ext == '.rar':
-                    self._extract_rar(current_archive, watching_data)
-                
-                # Delete archive after extraction
-                try:
-                    os.remove(current_archive)
-                    logging.info(f"[RobustDownloader] Deleted archive: {current_archive}")
-                except Exception as e:
-                    logging.warning(f"[RobustDownloader] Could not delete archive: {e}")
-                
-            except Exception as e:
-                logging.error(f"[RobustDownloader] Extraction failed: {e}")
-                continue
-            
-            # Scan for new archives
-            for root, _, files in os.walk(self.download_dir):
-                for file in files:
-                    ext = os.path.splitext(file)[1].lower()
-                    if ext in archive_exts:
-                        new_archive = os.path.join(root, file)
-                        if new_archive not in processed_archives and new_archive not in archives_to_process:
-                            archives_to_process.append(new_archive)
-                            logging.info(f"[RobustDownloader] Found nested archive: {new_archive}")
-                            
-                            # Count files in nested archive and update total
-                            try:
-                                nested_file_count = 0
-                                if ext == '.zip':
-                                    with zipfile.ZipFile(new_archive, 'r') as zip_ref:
-                                        for zip_info in zip_ref.infolist():
-                                            if not zip_info.filename.endswith('.url') and '_CommonRedist' not in zip_info.filename and not zip_info.is_dir():
-                                                nested_file_count += 1
-                                elif ext == '.rar':
-                                    import shutil as _shutil
-                                    _unrar = _shutil.which('unrar') or _shutil.which('unrar-free')
-                                    if _unrar:
-                                        _result = subprocess.run([_unrar, 'l', new_archive], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                                        for _line in _result.stdout.decode(errors='replace').splitlines():
-                                            _parts = _line.split()
-                                            if len(_parts) >= 5 and _parts[0] not in ('-', 'Name', '---'):
-                                                _fname = _parts[-1]
-                                                if not _fname.endswith('.url') and '_CommonRedist' not in _fname and not _fname.endswith('/'):
-                                                    nested_file_count += 1
-                                
-                                if nested_file_count > 0:
-                                    self._total_files_to_extract += nested_file_count
-                                    logging.info(f"[RobustDownloader] Added {nested_file_count} files from nested archive (new total: {self._total_files_to_extract})")
-                            except Exception as e:
-                                logging.warning(f"[RobustDownloader] Could not count files in nested archive {new_archive}: {e}")
+        self._extract_archives(archives_to_process, indexes, archive_path, archive_exts)
         
         # Force final progress update before flattening
         self._update_extraction_progress("Finalizing...", self._files_extracted_count, self._total_files_to_extract, force=True)
         
         # Flatten nested directories
-        self._flatten_directories()
+        moves = self._flatten_directories()
         
         # Rebuild filemap
-        watching_data = {}
-        for dirpath, _, filenames in os.walk(self.download_dir):
-            rel_dir = os.path.relpath(dirpath, self.download_dir)
-            for fname in filenames:
-                if fname.endswith('.url') or '_CommonRedist' in dirpath:
-                    continue
-                if os.path.splitext(fname)[1].lower() in archive_exts:
-                    continue
-                rel_path = os.path.normpath(os.path.join(rel_dir, fname)) if rel_dir != '.' else fname
-                rel_path = rel_path.replace('\\', '/')
-                watching_data[rel_path] = {"size": os.path.getsize(os.path.join(dirpath, fname))}
+        watching_data = self._build_filemap(list(indexes.values()), moves, archive_exts)
         
         safe_write_json(watching_path, watching_data)
         
-        # Clean up .url files and _CommonRedist
-        self._cleanup_junk_files()
-        
         # Update state
         self.game_info["downloadingData"]["extracting"] = False
         self.game_info["downloadingData"]["verifying"] = True
-        safe_write_json(self.game_info_path, self.game_info)
+        self.state.submit()
+        progress_stream.emit("phase", phase="verifying")
         
         if self.withNotification:
             _launch_notification(self.withNotification, "Extraction Complete", f"Extraction complete for {self.game}")
@@ -945,9 +3435,201 @@ class RobustDownloader:
         # Verify
         self._verify_extracted_files(watching_path)
     
+    def _extract_archives(self, archives: List[str], indexes: Dict[str, Optional[ArchiveIndex]],
+                          archive_path: Optional[str], archive_exts: set):
+        """
+        Extract `archives` and any archives nested in them, several at once.
+        
+        Up to `archive_concurrency` archives run side by side, and between
+        them they share the `extraction_threads` writer budget, so running
+        more archives doesn't multiply the number of files written at once.
+        An archive only starts alongside others when its index shows none of
+        its files are also written by a running archive or one queued before
+        it; archives that overlap, or that couldn't be indexed, keep their
+        order. Nested archives join the queue as their parent finishes.
+        """
+        pending = list(dict.fromkeys(archives))
+        processed = set(pending)
+        outputs = {a: self._archive_outputs(indexes.get(a)) for a in pending}
+        running = {}  # Future -> archive
+        self._junk_cleanup_pending = False
+        
+        with ThreadPoolExecutor(max_workers=self.archive_concurrency) as pool:
+            while pending or running:
+                for current_archive in list(pending):
+                    if len(running) >= self.archive_concurrency:
+                        break
+                    ahead = [running[f] for f in running] + pending[:pending.index(current_archive)]
+                    if not all(self._archives_independent(outputs[current_archive], outputs[a]) for a in ahead):
+                        continue
+                    pending.remove(current_archive)
+                    # Split the writer budget between everything that could be running together
+                    threads = max(1, self.extraction_threads // min(self.archive_concurrency, len(running) + 1 + len(pending)))
+                    future = pool.submit(self._extract_archive, current_archive, indexes.get(current_archive),
+                                         archive_path, archive_exts, threads)
+                    running[future] = current_archive
+                
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    current_archive = running.pop(future)
+                    try:
+                        nested = future.result()
+                    except Exception as e:
+                        logging.error(f"[RobustDownloader] Extraction failed: {e}")
+                        continue
+                    
+                    for new_archive in nested:
+                        if new_archive in processed:
+                            continue
+                        processed.add(new_archive)
+                        pending.append(new_archive)
+                        logging.info(f"[RobustDownloader] Found nested archive: {new_archive}")
+                        
+                        indexes[new_archive] = self._archive_index(new_archive)
+                        outputs[new_archive] = self._archive_outputs(indexes[new_archive])
+                        nested_files = indexes[new_archive].files(self._wanted_member) if indexes[new_archive] else []
+                        if nested_files:
+                            with self._progress_lock:
+                                self._total_files_to_extract += len(nested_files)
+                                self._total_bytes_to_extract += sum(e.size for e in nested_files)
+                            logging.info(f"[RobustDownloader] Added {len(nested_files)} files from nested archive (new total: {self._total_files_to_extract})")
+        
+        if self._junk_cleanup_pending:
+            self._cleanup_junk_files()
+    
+    def _extract_archive(self, current_archive: str, index: Optional[ArchiveIndex], archive_path: Optional[str],
+                         archive_exts: set, threads: int) -> List[str]:
+        """Extract and delete one archive; returns the nested archives it wrote."""
+        ext = os.path.splitext(current_archive)[1].lower()
+        logging.info(f"[RobustDownloader] Extracting: {current_archive} ({threads} threads)")
+        
+        if ext == '.zip':
+            # The downloaded archive may already be (partly) extracted by the stream
+            streamed = self._stream_extractor if current_archive == archive_path else None
+            self._extract_zip(current_archive, index, streamed, threads)
+            if streamed:
+                streamed.remove_state()
+                self._stream_extractor = None
+        elif ext == '.rar':
+            self._extract_rar(current_archive, index)
+        
+        # Nested archives are whatever archive members this one just wrote
+        nested = self._nested_archives(index, archive_exts)
+        
+        # Delete archive after extraction
+        if self.keep_archive and current_archive == archive_path:
+            logging.info(f"[RobustDownloader] Keeping archive: {current_archive}")
+        else:
+            try:
+                os.remove(current_archive)
+                logging.info(f"[RobustDownloader] Deleted archive: {current_archive}")
+            except Exception as e:
+                logging.warning(f"[RobustDownloader] Could not delete archive: {e}")
+        return nested
+    
+    def _archive_outputs(self, index: Optional[ArchiveIndex]) -> Optional[set]:
+        """Paths an archive writes, normalised for comparison; None if unknown."""
+        if index is None:
+            return None
+        outputs = set()
+        for entry in index.files(self._wanted_member):
+            path = zip_member_path(self.download_dir, entry.name)
+            if path:
+                outputs.add(os.path.normcase(os.path.normpath(path)))
+        return outputs
+    
+    @staticmethod
+    def _archives_independent(outputs: Optional[set], other: Optional[set]) -> bool:
+        """Whether two archives can extract at the same time without writing the same file."""
+        return outputs is not None and other is not None and outputs.isdisjoint(other)
+    
+    def _archive_index(self, archive_path: str) -> Optional[ArchiveIndex]:
+        """Index `archive_path`, or None if it can't be listed."""
+        try:
+            index = ArchiveIndex.read(archive_path)
+        except (OSError, RuntimeError, zipfile.BadZipFile) as e:
+            logging.warning(f"[RobustDownloader] Could not list {archive_path}: {e}")
+            return None
+        logging.info(f"[RobustDownloader] Indexed {os.path.basename(archive_path)}: {len(index.entries)} entries")
+        return index
+    
+    def _nested_archives(self, index: Optional[ArchiveIndex], archive_exts: set) -> List[str]:
+        """
+        Archives that extracting an indexed archive produced, found from its
+        member list instead of rescanning the whole install. Falls back to a
+        scan only if the archive couldn't be listed.
+        """
+        if index is None:
+            logging.warning(f"[RobustDownloader] Scanning for nested archives")
+            return [os.path.join(root, f) for root, _, files in os.walk(self.download_dir)
+                    for f in files if os.path.splitext(f)[1].lower() in archive_exts]
+        nested = []
+        for entry in index.archives(archive_exts, self._wanted_member):
+            path = zip_member_path(self.download_dir, entry.name)
+            if path and os.path.isfile(path):
+                nested.append(path)
+        return nested
+    
+    def _build_filemap(self, indexes: List[Optional[ArchiveIndex]], moves: List[Tuple[str, str]], archive_exts: set) -> Dict[str, Dict]:
+        """
+        filemap.QuadDown.json contents from the archive indexes, with paths
+        carried through the moves _flatten_directories made. Walks the
+        install instead if any archive couldn't be listed.
+        """
+        if any(index is None for index in indexes):
+            logging.warning(f"[RobustDownloader] Building filemap from disk")
+            watching_data = {}
+            for dirpath, _, filenames in os.walk(self.download_dir):
+                rel_dir = os.path.relpath(dirpath, self.download_dir)
+                for fname in filenames:
+                    if fname.endswith('.url') or '_CommonRedist' in dirpath:
+                        continue
+                    if os.path.splitext(fname)[1].lower() in archive_exts:
+                        continue
+                    rel_path = os.path.normpath(os.path.join(rel_dir, fname)) if rel_dir != '.' else fname
+                    rel_path = rel_path.replace('\\', '/')
+                    watching_data[rel_path] = {"size": os.path.getsize(os.path.join(dirpath, fname))}
+            return watching_data
+        
+        watching_data = {}
+        if self.updateFlow:
+            # Files this update didn't ship are still part of the install
+            try:
+                with open(os.path.join(self.download_dir, "filemap.QuadDown.json"), 'r') as f:
+                    watching_data = json.load(f)
+            except (OSError, ValueError):
+                pass
+        corrupt = {e["file"] for e in self._extract_errors}  # Already reported; not on disk
+        for index in indexes:
+            for entry in index.files(self._wanted_member):
+                if entry.name in corrupt or os.path.splitext(entry.name)[1].lower() in archive_exts:
+                    continue
+                path = zip_member_path(self.download_dir, entry.name)
+                if not path:
+                    continue
+                rel_path = self._flattened_path(os.path.relpath(path, self.download_dir).replace('\\', '/'), moves)
+                if rel_path:
+                    watching_data[rel_path] = {"size": entry.size}
+        return watching_data
+    
+    @staticmethod
+    def _flattened_path(rel_path: str, moves: List[Tuple[str, str]]) -> Optional[str]:
+        """Where `rel_path` ended up after `moves`, or None if a moved item replaced it."""
+        for src, dst in moves:
+            if rel_path == src or rel_path.startswith(src + '/'):
+                rel_path = dst + rel_path[len(src):]
+            elif rel_path == dst or rel_path.startswith(dst + '/'):
+                return None
+        return rel_path
+    
     def _update_extraction_progress(self, current_file: str, files_extracted: int, total_files: int, force: bool = False):
         """Update extraction progress in the game info JSON.
         
+        Percentage, speed and ETA follow uncompressed bytes (self._bytes_extracted
+        against self._total_bytes_to_extract) so one huge file doesn't sit at 99%;
+        the file counters are reported alongside. Without a byte total (an
+        archive that couldn't be indexed) they fall back to files.
+        
         Args:
             current_file: Name of the file being extracted
             files_extracted: Number of files extracted so far
@@ -956,66 +3638,135 @@ class RobustDownloader:
         """
         current_time = time.time()
         elapsed = current_time - self._extraction_start_time
-        speed = files_extracted / elapsed if elapsed > 0 else 0
-        percent = (files_extracted / total_files * 100) if total_files > 0 else 0
+        total_bytes = max(self._total_bytes_to_extract, self._bytes_extracted)
+        if total_bytes > 0:
+            # Bytes the stream wrote during the download would inflate the rate
+            written = self._bytes_extracted - self._bytes_already_extracted
+            speed = written / elapsed if elapsed > 0 else 0
+            percent = self._bytes_extracted / total_bytes * 100
+            eta = (total_bytes - self._bytes_extracted) / speed if speed > 0 else 0
+            speed_str = f"{read_size(speed)}/s"
+        else:
+            speed = files_extracted / elapsed if elapsed > 0 else 0
+            percent = (files_extracted / total_files * 100) if total_files > 0 else 0
+            eta = (total_files - files_extracted) / speed if speed > 0 and total_files > files_extracted else 0
+            speed_str = f"{speed:.1f} files/s" if speed >= 1 else f"{speed:.2f} files/s"
         
         # Always update in-memory data
         self.game_info["downloadingData"]["extractionProgress"] = {
             "currentFile": current_file[:50] + "..." if len(current_file) > 50 else current_file,
             "filesExtracted": files_extracted,
             "totalFiles": total_files,
+            "bytesExtracted": self._bytes_extracted,
+            "totalBytes": total_bytes,
             "percentComplete": f"{percent:.2f}",
-            "extractionSpeed": f"{speed:.1f} files/s" if speed >= 1 else f"{speed:.2f} files/s"
+            "extractionSpeed": speed_str,
+            "timeUntilComplete": format_eta(eta) if speed > 0 else ""
         }
         
-        # Only write to disk every 1.5 seconds or when forced (completion/error)
-        if force or (current_time - self._last_progress_update) >= 2:
-            safe_write_json(self.game_info_path, self.game_info)
+        # Only write to disk every 2 seconds (stream every 0.5) or when forced (completion/error)
+        interval = 0.5 if progress_stream.enabled else 2
+        if force or (current_time - self._last_progress_update) >= interval:
+            streamed = progress_stream.emit(
+                "extract", phase="extracting", filesExtracted=files_extracted, totalFiles=total_files,
+                bytesExtracted=self._bytes_extracted, totalBytes=total_bytes,
+                percent=round(percent, 2), rate=round(speed, 2), eta=round(eta), currentFile=current_file)
+            if force or not streamed:
+                self.state.submit()
             self._last_progress_update = current_time
 
-    def _extract_zip(self, archive_path: str, watching_data: Dict):
-        """Extract a ZIP file."""
-        try:
-            with zipfile.ZipFile(archive_path, 'r') as test_zip:
-                test_zip.testzip()
-            logging.info(f"[RobustDownloader] ZIP validation passed")
-        except zipfile.BadZipFile as e:
-            logging.error(f"[RobustDownloader] Invalid ZIP: {e}")
-            raise
-        
-        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-            zip_contents = zip_ref.infolist()
-            logging.info(f"[RobustDownloader] ZIP contains {len(zip_contents)} files")
-            
-            # Filter members to extract (exclude .url and _CommonRedist)
-            members_to_extract = [
-                zip_info for zip_info in zip_contents
-                if not zip_info.filename.endswith('.url') and '_CommonRedist' not in zip_info.filename
-            ]
-            
-            logging.info(f"[RobustDownloader] Extracting {len(members_to_extract)} files (filtered from {len(zip_contents)})")
-            
-            # Use extractall() for dramatically faster extraction (10-100x faster than file-by-file)
+    def _open_archive(self, archive_path: str):
+        """Open an archive for reading, dropping consumed pages in page-cache-friendly mode."""
+        if self.page_cache_friendly:
+            return CacheDroppingReader(archive_path)
+        return open(archive_path, 'rb')
+    
+    def _extract_zip(self, archive_path: str, index: Optional[ArchiveIndex], streamed: Optional[StreamingZipExtractor] = None,
+                     threads: Optional[int] = None):
+        """Extract a ZIP file, skipping members a StreamingZipExtractor already wrote."""
+        if index is None:
+            raise zipfile.BadZipFile(f"Could not read the central directory of {archive_path}")
+        # Members are CRC-checked as they are written; the old separate pass is opt-in.
+        # Streamed archives skip it regardless, since released ranges can't be re-read
+        if self.zip_prevalidate and not streamed:
             try:
-                zip_ref.extractall(self.download_dir, members=members_to_extract)
-                logging.info(f"[RobustDownloader] Bulk extraction complete")
-            except Exception as e:
-                logging.error(f"[RobustDownloader] Bulk extraction failed: {e}")
+                with self._open_archive(archive_path) as archive_file, zipfile.ZipFile(archive_file, 'r') as test_zip:
+                    test_zip.testzip()
+                logging.info(f"[RobustDownloader] ZIP validation passed")
+            except zipfile.BadZipFile as e:
+                logging.error(f"[RobustDownloader] Invalid ZIP: {e}")
                 raise
-            
-            # Build watching data and update progress after extraction
-            for zip_info in members_to_extract:
-                extracted_path = os.path.join(self.download_dir, zip_info.filename)
-                key = os.path.relpath(extracted_path, self.download_dir)
-                watching_data[key] = {"size": zip_info.file_size}
-                # Update progress for non-directory entries
-                if not zip_info.is_dir():
-                    self._files_extracted_count += 1
-                    # Only update progress every 100 files to reduce I/O overhead
-                    if self._files_extracted_count % 100 == 0 or self._files_extracted_count == self._total_files_to_extract:
-                        self._update_extraction_progress(zip_info.filename, self._files_extracted_count, self._total_files_to_extract)
-    
-    def _extract_rar(self, archive_path: str, watching_data: Dict):
+        
+        zip_contents = index.zip_infos
+        logging.info(f"[RobustDownloader] ZIP contains {len(zip_contents)} files")
+        
+        # Filter members to extract (exclude .url and _CommonRedist)
+        members_to_extract = [zip_info for zip_info in zip_contents if self._wanted_member(zip_info.filename)]
+        
+        logging.info(f"[RobustDownloader] Extracting {len(members_to_extract)} files (filtered from {len(zip_contents)})")
+        remaining, lost = self._unstreamed_members(members_to_extract, streamed) if streamed else (members_to_extract, [])
+        # Files the stream already wrote count as extracted
+        skipped = set(id(m) for m in remaining) | set(id(m) for m in lost)
+        done = [m for m in members_to_extract if not m.is_dir() and id(m) not in skipped]
+        with self._progress_lock:
+            self._files_extracted_count += len(done)
+            self._bytes_extracted += sum(m.file_size for m in done)
+            self._bytes_already_extracted += sum(m.file_size for m in done)
+        
+        def extracted(zip_info: zipfile.ZipInfo):
+            with self._progress_lock:
+                self._files_extracted_count += 1
+                # Only update progress every 100 files to reduce I/O overhead
+                if self._files_extracted_count % 100 == 0 or self._files_extracted_count == self._total_files_to_extract:
+                    self._update_extraction_progress(zip_info.filename, self._files_extracted_count, self._total_files_to_extract)
+        
+        def wrote(zip_info: zipfile.ZipInfo, count: int):
+            with self._progress_lock:
+                self._bytes_extracted += count
+                # Keeps a single huge member moving; writes to disk are throttled in there
+                self._update_extraction_progress(zip_info.filename, self._files_extracted_count, self._total_files_to_extract)
+        
+        threads = threads or self.extraction_threads
+        extractor = ParallelZipExtractor(archive_path, self.download_dir, threads, self._open_archive)
+        try:
+            extractor.extract(remaining, on_member=extracted, on_bytes=wrote)
+            logging.info(f"[RobustDownloader] Bulk extraction complete ({threads} threads)")
+        except Exception as e:
+            logging.error(f"[RobustDownloader] Bulk extraction failed: {e}")
+            raise
+        if extractor.failed:
+            logging.error(f"[RobustDownloader] {len(extractor.failed)} members of {os.path.basename(archive_path)} failed their CRC check")
+            with self._progress_lock:
+                self._extract_errors.extend({"file": name, "error": f"Corrupt in archive: {error}"}
+                                            for name, error in extractor.failed.items())
+    
+    def _unstreamed_members(self, members: List[zipfile.ZipInfo], streamed: StreamingZipExtractor) -> Tuple[List[zipfile.ZipInfo], List[zipfile.ZipInfo]]:
+        """
+        Members the stream didn't get to, and the corrupt ones that are gone
+        for good. Raises if a member that was never written is no longer in
+        the archive.
+        """
+        remaining = []
+        lost = []
+        for info in members:
+            if info.filename in streamed.extracted:
+                continue
+            if info.filename in streamed.failed and info.header_offset < streamed.source.released:
+                with self._progress_lock:
+                    self._extract_errors.append({"file": info.filename, "error": f"Corrupt in archive: {streamed.failed[info.filename]}"})
+                lost.append(info)
+                continue
+            path = os.path.join(self.download_dir, info.filename)
+            if info.header_offset < streamed.start_offset and (
+                    os.path.isdir(path) if info.is_dir() else os.path.isfile(path) and os.path.getsize(path) == info.file_size):
+                continue  # Extracted by an earlier run
+            if info.header_offset < streamed.source.released:
+                raise zipfile.BadZipFile(f"{info.filename} is missing and its data was already released from the archive")
+            remaining.append(info)
+        logging.info(f"[RobustDownloader] {len(members) - len(remaining) - len(lost)} files were extracted during the download, {len(remaining)} left")
+        return remaining, lost
+    
+    def _extract_rar(self, archive_path: str, index: Optional[ArchiveIndex] = None):
         """Extract a RAR file using the system unrar binary."""
         import threading
         import shutil as _shutil
@@ -1025,61 +3776,112 @@ class RobustDownloader:
             raise RuntimeError("System 'unrar' binary not found. Install it with: sudo apt-get install unrar")
 
         logging.info(f"[RobustDownloader] Extracting RAR with system unrar: {archive_path}")
+        # Only RARLAB's unrar takes exclusion masks; unrar-free extracts everything
+        excludes = [] if 'free' in os.path.basename(os.path.realpath(unrar_bin)) else [f"-x{mask}" for mask in self.UNRAR_EXCLUDES]
 
-        # Count existing files before extraction for progress tracking
-        initial_file_count = 0
-        try:
-            for root, dirs, files_in_dir in os.walk(self.download_dir):
-                initial_file_count += len([f for f in files_in_dir if not f.endswith('.url') and not f.endswith('.rar') and not f.endswith('.zip')])
-        except Exception:
-            pass
+        # Sizes by output path, so each file unrar names advances the byte count
+        member_sizes = {}
+        if index:
+            for entry in index.files(self._wanted_member):
+                path = zip_member_path(self.download_dir, entry.name)
+                if path:
+                    member_sizes[os.path.normcase(os.path.normpath(path))] = entry.size
 
-        # Run unrar with Popen so we can read filenames line-by-line as they extract
+        # Run unrar with Popen so we can follow each file's progress as it extracts
         extraction_error = []
         files_extracted_count = [0]
         last_filename = [""]
 
         proc = subprocess.Popen(
-            [unrar_bin, "x", "-y", archive_path, self.download_dir + "/"],
+            [unrar_bin, "x", "-y", *excludes, archive_path, self.download_dir + "/"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
 
         def read_stdout():
+            # The member being written: [output path, size, bytes credited so far]
+            current = [None, 0, 0]
+            
+            def credit(done: int):
+                """Advance the byte count to `done` bytes of the current member."""
+                done = min(done, current[1])
+                if done > current[2]:
+                    with self._progress_lock:
+                        self._bytes_extracted += done - current[2]
+                        total = self._files_extracted_count + files_extracted_count[0]
+                        self._update_extraction_progress(last_filename[0], total, self._total_files_to_extract)
+                    current[2] = done
+            
+            def finish_member():
+                if current[0] is None:
+                    return
+                credit(current[1])
+                files_extracted_count[0] += 1
+                with self._progress_lock:
+                    total = self._files_extracted_count + files_extracted_count[0]
+                    self._update_extraction_progress(last_filename[0], total, self._total_files_to_extract)
+                current[0] = None
+            
+            def handle(segment: str):
+                # Strip ANSI escape sequences, then non-printable characters (box-drawing, etc.)
+                line = re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', segment)
+                line = re.sub(r'[^\x20-\x7E]', '', line).strip()
+                if line.startswith('Extracting') or line.startswith('extracting'):
+                    rest = line.split(None, 1)[-1] if len(line.split(None, 1)) > 1 else ''
+                    # Cut the in-place progress ("file   11% 12%") and OK off the name
+                    match = re.search(r'\s{2,}\d+\s*%.*$|\s+OK\s*$', rest)
+                    tail = rest[match.start():] if match else ''
+                    rest = rest[:match.start()].strip() if match else rest.strip()
+                    if rest.startswith('from '):
+                        return  # "Extracting from <volume>" opens each volume
+                    path = os.path.normcase(os.path.normpath(os.path.join(self.download_dir, rest)))
+                    if rest and path != current[0]:
+                        finish_member()
+                        if self._wanted_member(rest):
+                            current[:] = [path, member_sizes.get(path, 0), 0]
+                            last_filename[0] = os.path.basename(rest)
+                            with self._progress_lock:
+                                total = self._files_extracted_count + files_extracted_count[0]
+                                self._update_extraction_progress(last_filename[0], total, self._total_files_to_extract)
+                    line = tail
+                if current[0] is None:
+                    return
+                # unrar redraws "NN%" as the member is written and ends it with "OK"
+                percents = re.findall(r'(\d{1,3})%', line)
+                if percents:
+                    credit(current[1] * min(int(percents[-1]), 100) // 100)
+                if re.search(r'\bOK\s*$', line):
+                    finish_member()
+            
             try:
-                last_seen = [""]
-                for raw_line in proc.stdout:
-                    # unrar uses \r for in-place progress; split on \r and \n
-                    raw = raw_line.decode(errors='replace')
-                    for segment in re.split(r'[\r\n]', raw):
-                        line = segment.strip()
-                        # Strip ANSI escape sequences
-                        line = re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', line)
-                        # Strip non-printable characters (box-drawing, etc.)
-                        line = re.sub(r'[^\x20-\x7E]', '', line)
-                        if not (line.startswith('Extracting') or line.startswith('extracting')):
-                            continue
-                        # Remove trailing percentage/OK noise (unrar in-place progress)
-                        rest = line.split(None, 1)[-1] if len(line.split(None, 1)) > 1 else ''
-                        # Strip from first occurrence of padded percentage onward (handles "file   11% 12% 13%")
-                        rest = re.sub(r'\s{2,}\d+\s*%.*$', '', rest)
-                        rest = re.sub(r'\s+OK\s*$', '', rest)
-                        rest = rest.strip()
-                        fname = os.path.basename(rest)
-                        # Only count/update when the filename actually changes
-                        if fname and fname != last_seen[0] and not fname.endswith('.url') and '_CommonRedist' not in fname:
-                            last_seen[0] = fname
-                            files_extracted_count[0] += 1
-                            last_filename[0] = fname
-                            total = self._files_extracted_count + files_extracted_count[0]
-                            self._update_extraction_progress(fname, total, self._total_files_to_extract)
+                pending = ''
+                while True:
+                    # Raw reads: unrar only ends a member's line once the member is done
+                    chunk = os.read(proc.stdout.fileno(), 65536)
+                    if not chunk:
+                        break
+                    pending += chunk.decode(errors='replace')
+                    *segments, pending = re.split(r'[\r\n\x08]', pending)
+                    for segment in segments:
+                        handle(segment)
+                handle(pending)
+                finish_member()
             except Exception:
                 pass
 
         stdout_thread = threading.Thread(target=read_stdout, daemon=True)
         stdout_thread.start()
 
-        returncode = proc.wait()
+        while True:
+            try:
+                returncode = proc.wait(timeout=2)
+                break
+            except subprocess.TimeoutExpired:
+                # unrar reads volumes front to back, so pages it has passed are done with
+                if self.page_cache_friendly:
+                    drop_archive_cache(archive_path)
+        if self.page_cache_friendly:
+            drop_archive_cache(archive_path)
         stdout_thread.join(timeout=5)
 
         if returncode not in (0, 1):
@@ -1094,46 +3896,24 @@ class RobustDownloader:
 
         logging.info(f"[RobustDownloader] RAR extraction complete")
 
-        # Update extracted count from newly added files
-        final_file_count = 0
-        try:
-            for root, dirs, files_in_dir in os.walk(self.download_dir):
-                final_file_count += len([f for f in files_in_dir if not f.endswith('.url') and not f.endswith('.rar') and not f.endswith('.zip')])
-        except Exception:
-            pass
-        self._files_extracted_count += max(0, final_file_count - initial_file_count)
-
-        # Clean up unwanted files (.url and _CommonRedist)
-        for root, dirs, files_in_dir in os.walk(self.download_dir):
-            if '_CommonRedist' in root:
-                try:
-                    shutil.rmtree(root)
-                    logging.info(f"[RobustDownloader] Removed _CommonRedist: {root}")
-                except Exception as e:
-                    logging.warning(f"[RobustDownloader] Could not remove _CommonRedist: {e}")
-                continue
-
-            for fname in files_in_dir:
-                if fname.endswith('.url'):
-                    try:
-                        os.remove(os.path.join(root, fname))
-                    except Exception:
-                        pass
+        # unrar reported each file as it wrote it
+        with self._progress_lock:
+            self._files_extracted_count += files_extracted_count[0]
 
-        # Build watching data from extracted files
-        for dirpath, _, filenames in os.walk(self.download_dir):
-            for fname in filenames:
-                if fname.endswith('.url') or fname.endswith('.rar') or fname.endswith('.zip') or '_CommonRedist' in dirpath:
-                    continue
-                full_path = os.path.join(dirpath, fname)
-                key = os.path.relpath(full_path, self.download_dir).replace('\\', '/')
-                if key not in watching_data:
-                    watching_data[key] = {"size": os.path.getsize(full_path)}
+        if not excludes:
+            if index:
+                self._cleanup_junk_files(index)
+            else:
+                # Without a listing the whole folder would need sweeping; wait until no sibling archive is writing
+                self._junk_cleanup_pending = True
 
         self._update_extraction_progress("Complete", self._files_extracted_count, self._total_files_to_extract, force=True)
     
-    def _flatten_directories(self):
-        """Flatten nested directories that should be at root level."""
+    def _flatten_directories(self) -> List[Tuple[str, str]]:
+        """
+        Flatten nested directories that should be at root level. Returns the
+        (source, destination) moves made, as '/'-separated relative paths.
+        """
         protected_files = {
             f"{sanitize_folder_name(self.game)}.QuadDown.json",
             "filemap.QuadDown.json",
@@ -1144,6 +3924,7 @@ class RobustDownloader:
         }
         
         nested_dirs_to_check = []
+        moves = []
         
         # Check for game-named directory
         game_named_dir = os.path.join(self.download_dir, sanitize_folder_name(self.game))
@@ -1190,7 +3971,8 @@ class RobustDownloader:
             root_files = [f for f in os.listdir(self.download_dir) 
                          if os.path.isfile(os.path.join(self.download_dir, f)) 
                          and f not in protected_files
-                         and not f.endswith('.QuadDown.json')]
+                         and not f.endswith('.QuadDown.json')
+                         and os.path.splitext(f)[1].lower() not in ('.zip', '.rar')]  # A kept archive
             
             if len(root_files) == 0:
                 subdir_contents = os.listdir(subdirs[0])
@@ -1227,6 +4009,8 @@ class RobustDownloader:
                     
                     try:
                         shutil.move(src, dst)
+                        moves.append((os.path.relpath(src, self.download_dir).replace('\\', '/'),
+                                      os.path.relpath(dst, self.download_dir).replace('\\', '/')))
                     except Exception as e:
                         logging.error(f"[RobustDownloader] Failed to move {src}: {e}")
                 
@@ -1238,9 +4022,43 @@ class RobustDownloader:
                         logging.info(f"[RobustDownloader] Deleted empty dir: {nested_dir}")
                 except Exception:
                     pass
+        
+        return moves
     
-    def _cleanup_junk_files(self):
-        """Remove .url files and _CommonRedist folders."""
+    def _cleanup_junk_files(self, index: Optional[ArchiveIndex] = None):
+        """
+        Remove .url files and _CommonRedist folders an extractor without
+        exclusions wrote. With an index, only that archive's unwanted members
+        are removed, so archives extracting alongside it are left alone.
+        """
+        if index:
+            dirs = set()
+            for entry in index.entries:
+                if self._wanted_member(entry.name):
+                    continue
+                parts = [p for p in entry.name.replace('\\', '/').split('/') if p]
+                path = zip_member_path(self.download_dir, entry.name)
+                if not path:
+                    continue
+                if entry.is_dir:
+                    dirs.add(path.rstrip(os.sep))
+                else:
+                    try:
+                        os.remove(path)
+                        logging.info(f"[RobustDownloader] Deleted junk member: {path}")
+                    except OSError:
+                        pass
+                # Folders from the _CommonRedist one down go too, once emptied
+                for i, part in enumerate(parts[:-1]):
+                    if '_CommonRedist' in part:
+                        dirs.update(zip_member_path(self.download_dir, '/'.join(parts[:j + 1])) for j in range(i, len(parts) - 1))
+                        break
+            for path in sorted(filter(None, dirs), key=len, reverse=True):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    pass  # Not empty: something other than this archive's junk is in it
+            return
         for root, dirs, files in os.walk(self.download_dir, topdown=False):
             for fname in files:
                 if fname.endswith('.url'):
@@ -1269,7 +4087,7 @@ class RobustDownloader:
                 watching_data = json.load(f)
             
             logging.info(f"[RobustDownloader] Verifying {len(watching_data)} files")
-            verify_errors = []
+            verify_errors = list(self._extract_errors)  # Members that never made it out of the archive
             verified_count = 0
             for file_path, file_info in watching_data.items():
                 if os.path.basename(file_path) == 'filemap.QuadDown.json':
@@ -1295,13 +4113,15 @@ class RobustDownloader:
             self.game_info["downloadingData"]["verifying"] = False
             if verify_errors:
                 self.game_info["downloadingData"]["verifyError"] = verify_errors
-            safe_write_json(self.game_info_path, self.game_info)
+            self.state.flush()
             
             if not verify_errors:
-                self._handle_post_download_behavior()
+                if not self.defer_post_download:
+                    self._handle_post_download_behavior()
                 if "downloadingData" in self.game_info:
                     del self.game_info["downloadingData"]
-                    safe_write_json(self.game_info_path, self.game_info)
+                    self.state.flush()
+            progress_stream.emit("done", verifyErrors=len(verify_errors))
         except Exception as e:
             logging.error(f"[RobustDownloader] Verification error: {e}")
             handleerror(self.game_info, self.game_info_path, e)
@@ -1337,6 +4157,202 @@ class RobustDownloader:
             logging.error(f"[RobustDownloader] Post-download behavior error: {e}")
 
 
+# Download Daemon
+
+
+class DownloadDaemon:
+    """
+    Long-running process that takes download jobs over a localhost socket.
+    
+    Jobs run concurrently (up to maxConcurrentDownloads) and share one HTTP
+    connection pool and a process-wide connection budget (maxTotalConnections),
+    instead of each download paying process startup and competing blindly.
+    
+    The port and an access token are written to daemon.json next to the log.
+    Clients send one JSON object per line and get one JSON line back:
+    
+        {"token": t, "cmd": "submit", "args": [<same arguments as main()>]} -> {"ok": true, "job": id}
+        {"token": t, "cmd": "status"} -> {"ok": true, "jobs": [...]}
+        {"token": t, "cmd": "watch"}  -> a status line every second until no job is
+                                         queued or running, or the daemon shuts down
+        {"token": t, "cmd": "cancel", "job": id}
+        {"token": t, "cmd": "shutdown"}
+    
+    Cancelling stops a queued job or the transfer of a running one, and the
+    game's JSON is marked stopped rather than failed; a job that is already
+    extracting finishes normally.
+    """
+    
+    INFO_FILE = "daemon.json"
+    STATUS_INTERVAL = 1.0
+    
+    def __init__(self, port: int = 0):
+        settings = load_settings()
+        try:
+            self.max_jobs = max(1, int(settings.get('maxConcurrentDownloads', 2)))
+            max_connections = int(settings.get('maxTotalConnections', ChunkedDownloader.MAX_CONNECTIONS))
+        except (TypeError, ValueError):
+            self.max_jobs, max_connections = 2, ChunkedDownloader.MAX_CONNECTIONS
+        self.budget = ConnectionBudget(max_connections)
+        self.session = create_robust_session(pool_maxsize=self.budget.limit, retries=False)
+        self.parser = build_arg_parser()
+        self.token = secrets.token_hex(16)
+        self.info_path = os.path.join(os.path.dirname(LOG_PATH), self.INFO_FILE)
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self._jobs_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._next_id = 1
+        self._shutdown = threading.Event()  # Set once the server is stopping; ends watch streams
+        self._server = socketserver.ThreadingTCPServer(('127.0.0.1', port), self._make_handler())
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+    
+    def serve_forever(self):
+        for _ in range(self.max_jobs):
+            threading.Thread(target=self._job_worker, daemon=True).start()
+        safe_write_json(self.info_path, {"port": self.port, "token": self.token, "pid": os.getpid()})
+        logging.info(f"[DownloadDaemon] Listening on 127.0.0.1:{self.port}, {self.max_jobs} concurrent jobs, {self.budget.limit} connections")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._shutdown.set()
+            self._server.server_close()
+            self.session.close()
+            try:
+                os.remove(self.info_path)
+            except OSError:
+                pass
+    
+    def submit(self, argv: List[str]) -> str:
+        try:
+            args = self.parser.parse_args([str(a) for a in argv])
+        except SystemExit:
+            raise ValueError("Invalid job arguments, expected the same arguments as the command line")
+        with self._jobs_lock:
+            job_id = str(self._next_id)
+            self._next_id += 1
+            self.jobs[job_id] = {"id": job_id, "game": args.game, "args": args, "state": "queued",
+                                 "error": None, "downloader": None}
+        self._queue.put(job_id)
+        logging.info(f"[DownloadDaemon] Queued job {job_id}: {args.game}")
+        return job_id
+    
+    def cancel(self, job_id: str) -> bool:
+        with self._jobs_lock:
+            job = self.jobs.get(job_id)
+            if not job or job["state"] not in ("queued", "running"):
+                return False
+            if job["state"] == "queued":
+                job["state"] = "cancelled"
+            else:
+                job["cancelled"] = True
+                if job["downloader"]:
+                    job["downloader"].cancel()
+        return True
+    
+    def status(self) -> List[Dict[str, Any]]:
+        report = []
+        with self._jobs_lock:
+            for job in self.jobs.values():
+                entry = {"id": job["id"], "game": job["game"], "state": job["state"], "error": job["error"]}
+                downloader = job["downloader"]
+                if job["state"] == "running" and downloader:
+                    data = downloader.game_info.get("downloadingData", {})
+                    entry["progress"] = {key: data.get(key) for key in (
+                        "downloading", "extracting", "verifying", "progressCompleted",
+                        "progressDownloadSpeeds", "timeUntilComplete", "extractionProgress")}
+                report.append(entry)
+        return report
+    
+    def _job_worker(self):
+        while True:
+            job_id = self._queue.get()
+            with self._jobs_lock:
+                job = self.jobs[job_id]
+                if job["state"] != "queued":
+                    continue
+                job["state"] = "running"
+            args = job["args"]
+            try:
+                downloader = RobustDownloader(
+                    args.game, args.online, args.dlc, args.isVr,
+                    args.updateFlow, args.version, args.size,
+                    args.download_dir, args.gameID,
+                    session=self.session, budget=self.budget
+                )
+                downloader.defer_post_download = True
+                with self._jobs_lock:
+                    job["downloader"] = downloader
+                    if job.get("cancelled"):
+                        downloader.cancel()
+                downloader.download(args.url, withNotification=args.withNotification, mirrors=args.mirrors)
+                downloader.state.close()
+                atexit.unregister(downloader.state.close)
+                data = downloader.game_info.get("downloadingData") or {}
+                if data.get("stopped"):
+                    state, error = "cancelled", None
+                elif data.get("error") or data.get("verifyError"):
+                    state, error = "failed", data.get("message") or "Verification failed"
+                else:
+                    state, error = "done", None
+            except Exception as e:
+                logging.error(f"[DownloadDaemon] Job {job_id} crashed: {e}", exc_info=True)
+                state, error = "failed", str(e)
+            with self._jobs_lock:
+                job["state"], job["error"], job["downloader"] = state, error, None
+                idle = self._queue.empty() and not any(j["state"] == "running" for j in self.jobs.values())
+            logging.info(f"[DownloadDaemon] Job {job_id} {state}")
+            if idle and state == "done":
+                downloader._handle_post_download_behavior()
+    
+    def _handle_request(self, request: Dict[str, Any], write_line) -> Optional[Dict[str, Any]]:
+        if not secrets.compare_digest(str(request.get("token", "")), self.token):
+            return {"ok": False, "error": "Invalid token"}
+        cmd = request.get("cmd")
+        if cmd == "submit":
+            return {"ok": True, "job": self.submit(request.get("args", []))}
+        if cmd == "status":
+            return {"ok": True, "jobs": self.status()}
+        if cmd == "cancel":
+            return {"ok": self.cancel(str(request.get("job")))}
+        if cmd == "watch":
+            # Stream until nothing is left to report; the final status is the reply
+            while True:
+                jobs = self.status()
+                if self._shutdown.is_set() or not any(j["state"] in ("queued", "running") for j in jobs):
+                    return {"ok": True, "jobs": jobs}
+                write_line({"ok": True, "jobs": jobs})
+                self._shutdown.wait(self.STATUS_INTERVAL)
+        if cmd == "shutdown":
+            self._shutdown.set()
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command: {cmd}"}
+    
+    def _make_handler(self):
+        daemon = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                def write_line(obj):
+                    self.wfile.write((json.dumps(obj) + "\n").encode())
+                    self.wfile.flush()
+                
+                for raw in self.rfile:
+                    try:
+                        reply = daemon._handle_request(json.loads(raw), write_line)
+                    except (OSError, ConnectionError):
+                        return
+                    except Exception as e:
+                        reply = {"ok": False, "error": str(e)}
+                    try:
+                        write_line(reply)
+                    except OSError:
+                        return
+        
+        return Handler
+
+
 # CLI Entrypoint
 
 
@@ -1350,7 +4366,7 @@ def parse_boolean(value):
     else:
         raise ValueError(f"Invalid boolean value: {value}")
 
-def main():
+def build_arg_parser() -> ArgumentParser:
     parser = ArgumentParser(description="QuadDown Downloader V2 - Robust Chunked Downloader")
     parser.add_argument("url", help="Download URL")
     parser.add_argument("game", help="Name of the game")
@@ -1363,7 +4379,36 @@ def main():
     parser.add_argument("download_dir", help="Directory to save the downloaded files")
     parser.add_argument("gameID", nargs="?", default="", help="Game ID from SteamRIP")
     parser.add_argument("--withNotification", help="Theme name for notifications", default=None)
+    parser.add_argument("--progressStream", action="store_true", help="Write NDJSON progress events to stdout")
+    parser.add_argument("--mirror", dest="mirrors", action="append", default=[], help="Another URL for the same file (repeatable)")
+    return parser
+
+def main():
+    if "--benchmark-extract" in sys.argv[1:]:
+        bench_parser = ArgumentParser(description="QuadDown Downloader V2 - ZIP extraction benchmark")
+        bench_parser.add_argument("--benchmark-extract", dest="archive", required=True, help="ZIP archive to extract")
+        bench_parser.add_argument("--threads", type=int, default=get_extraction_threads(load_settings()), help="Parallel extraction threads")
+        bench_args = bench_parser.parse_args()
+        print(json.dumps(benchmark_zip_extraction(bench_args.archive, bench_args.threads), indent=4))
+        return
+    
+    if "--daemon" in sys.argv[1:]:
+        daemon_parser = ArgumentParser(description="QuadDown Downloader V2 - download daemon")
+        daemon_parser.add_argument("--daemon", action="store_true", help="Serve download jobs over a localhost socket")
+        daemon_parser.add_argument("--port", type=int, default=0, help="Port to listen on (default: any free port)")
+        daemon_args = daemon_parser.parse_args()
+        try:
+            DownloadDaemon(daemon_args.port).serve_forever()
+        except Exception as e:
+            logging.error(f"[DownloadDaemon] Fatal error: {e}", exc_info=True)
+            launch_crash_reporter(1, str(e))
+            raise
+        return
+    
+    parser = build_arg_parser()
     args = parser.parse_args()
+    if args.progressStream:
+        progress_stream.enable()
     
     try:
         downloader = RobustDownloader(
@@ -1371,7 +4416,7 @@ def main():
             args.updateFlow, args.version, args.size, 
             args.download_dir, args.gameID
         )
-        downloader.download(args.url, withNotification=args.withNotification)
+        downloader.download(args.url, withNotification=args.withNotification, mirrors=args.mirrors)
     except Exception as e:
         logging.error(f"[QuadDownDownloaderV2] Fatal error: {e}", exc_info=True)
         launch_crash_reporter(1, str(e))
@@ -24,6 +24,7 @@ from tempfile import NamedTemporaryFile, gettempdir
 import requests
 import atexit
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from hashlib import sha256
 from argparse import ArgumentParser, ArgumentTypeError, ArgumentError
 import patoolib
@@ -32,6 +33,8 @@ import logging
 from datetime import datetime
 import zipfile
 
+from QuadDownCommon import progress_stream, BandwidthLimiter
+
 def get_QuadDown_log_path():
     if sys.platform == "win32":
         appdata = os.getenv("APPDATA")
@@ -180,8 +183,13 @@ def handleerror(game_info, game_info_path, e):
         "message": str(e)
     }
     safe_write_json(game_info_path, game_info)
+    progress_stream.emit("error", message=str(e))
 
 class GofileDownloader:
+    # unrar masks for the .url shortcuts and _CommonRedist installers we never install
+    UNRAR_EXCLUDES = ('*.url', '_CommonRedist', f'_CommonRedist{os.sep}*',
+                      f'*{os.sep}_CommonRedist', f'*{os.sep}_CommonRedist{os.sep}*')
+
     def __init__(self, game, online, dlc, isVr, updateFlow, version, size, download_dir, gameID="", max_workers=5):
         self._max_retries = 3
         self._download_timeout = 30 
@@ -208,6 +216,7 @@ class GofileDownloader:
         # Download speed limit (KB/s, 0 means unlimited)
         self._download_speed_limit = 0
         self._single_stream = True  # Default to single stream for stability
+        self._archive_concurrency = 2  # Archives extracted side by side
         try:
             settings_path = None
             if sys.platform == 'win32':
@@ -229,11 +238,22 @@ class GofileDownloader:
                     settings = json.load(f)
                     self._download_speed_limit = settings.get('downloadLimit', 0)  # KB/s
                     self._single_stream = settings.get('singleStream', True)
+                    self._archive_concurrency = self._read_archive_concurrency(settings)
                 logging.info(f"[QuadDownGofileHelper] Settings: speed_limit={self._download_speed_limit}, single_stream={self._single_stream}")
         except Exception as e:
             logging.warning(f"[QuadDownGofileHelper] Could not read settings: {e}")
             self._download_speed_limit = 0
             self._single_stream = True
+            self._archive_concurrency = 2
+        self._count_lock = Lock()
+        self._junk_cleanup_pending = False  # An extraction tool without exclusions wrote junk members
+        self._limiter = None
+        try:
+            if self._download_speed_limit and float(self._download_speed_limit) > 0:
+                self._limiter = BandwidthLimiter(float(self._download_speed_limit) * 1024,
+                                                 os.path.join(os.path.dirname(LOG_PATH), BandwidthLimiter.STATE_FILE))
+        except (TypeError, ValueError, OSError) as e:
+            logging.warning(f"[QuadDownGofileHelper] Download limit disabled: {e}")
         # If updateFlow is True, preserve the JSON file and set updating flag
         if updateFlow and os.path.exists(self.game_info_path):
             with open(self.game_info_path, 'r') as f:
@@ -325,6 +345,7 @@ class GofileDownloader:
 
         total_files = len(files_info)
         current_file = 0
+        progress_stream.emit("phase", phase="downloading")
         
         try:
             for item in files_info.values():
@@ -360,6 +381,7 @@ class GofileDownloader:
             self.game_info["size"] = read_size(self._total_size)
 
             safe_write_json(self.game_info_path, self.game_info)
+            progress_stream.emit("done")
             logging.info("[QuadDownGofileHelper] Process completed successfully")
             
             if withNotification:
@@ -499,11 +521,8 @@ class GofileDownloader:
                         file_key = f"{file_info['path']}/{file_info['filename']}"
                         self._current_file_progress[file_key] = part_size
 
-                        # Use small chunk size and strict limiter if limiting, otherwise large chunk size and no limiter
-                        if self._download_speed_limit and self._download_speed_limit > 0:
-                            chunk_size = 4096
-                        else:
-                            chunk_size = 32768
+                        # The shared limiter paces reads; slices shrink so low caps stay smooth
+                        chunk_size = self._limiter.chunk_size(32768) if self._limiter else 32768
                         start_time = time.time()
                         bytes_downloaded = 0
                         for chunk in response.iter_content(chunk_size=chunk_size):
@@ -514,19 +533,10 @@ class GofileDownloader:
                             downloaded += len(chunk)
                             bytes_since_last_update += len(chunk)
                             bytes_downloaded += len(chunk)
+                            if self._limiter:
+                                self._limiter.consume(len(chunk))
                             current_time = time.time()
                             
-                            # Only run limiter if limiting
-                            if self._download_speed_limit and self._download_speed_limit > 0:
-                                elapsed = current_time - start_time
-                                if elapsed > 0:
-                                    allowed_bytes = self._download_speed_limit * 1024 * elapsed
-                                    if bytes_downloaded > allowed_bytes:
-                                        sleep_time = (bytes_downloaded - allowed_bytes) / (self._download_speed_limit * 1024)
-                                        if sleep_time > 0:
-                                            time.sleep(sleep_time)
-                            # If no limit is set, run at full speed (do nothing)
-                            
                             # Update progress every 0.5 seconds
                             if current_time - last_update >= 0.5:
                                 # Update both file and total progress
@@ -667,7 +677,11 @@ class GofileDownloader:
             else:
                 print(f"\rDownloading {filename}: {progress:.1f}% {format_speed(rate)} ETA: {eta}", end="")
             
-            safe_write_json(self.game_info_path, self.game_info)
+            streamed = progress_stream.emit(
+                "progress", phase="downloading", bytesDone=self._total_downloaded, totalBytes=self._total_size,
+                percent=round(progress, 2), rate=round(rate), eta=int(max(eta_seconds, 0)), currentFile=filename)
+            if done or not streamed:
+                safe_write_json(self.game_info_path, self.game_info)
 
     def _update_extraction_progress(self, current_file: str, files_extracted: int, total_files: int, force: bool = False):
         """Update extraction progress in the game info JSON.
@@ -695,9 +709,121 @@ class GofileDownloader:
             
             # Only write to disk every 0.25 seconds or when forced (completion/error)
             if force or (current_time - self._last_progress_update) >= 0.25:
-                safe_write_json(self.game_info_path, self.game_info)
+                streamed = progress_stream.emit(
+                    "extract", phase="extracting", filesExtracted=files_extracted, totalFiles=total_files,
+                    percent=round(percent, 2), rate=round(speed, 2), currentFile=current_file)
+                if force or not streamed:
+                    safe_write_json(self.game_info_path, self.game_info)
                 self._last_progress_update = current_time
 
+    @staticmethod
+    def _read_archive_concurrency(settings):
+        """
+        Archives to extract at once. Each one has a single writer here, so the
+        extractionThreads budget (0 = one per core, up to 8) caps it as well.
+        """
+        try:
+            concurrency = int(settings.get('archiveConcurrency', 2))
+            budget = int(settings.get('extractionThreads', 0))
+        except (TypeError, ValueError):
+            return 2
+        if budget <= 0:
+            budget = min(8, os.cpu_count() or 1)
+        return max(1, min(concurrency, budget, 8))
+
+    def _count_extracted(self, count=1):
+        """Add to the shared extracted-file counter and return the new total."""
+        with self._count_lock:
+            self._files_extracted_count += count
+            return self._files_extracted_count
+
+    def _extract_archives(self, archives_to_process, total_files_to_extract, watching_data):
+        """
+        Extract the downloaded archives, up to self._archive_concurrency at a
+        time. An archive only runs alongside others when its member list
+        shares no files with a running archive or one ahead of it in the
+        list, so updates that overwrite the base game, and the volumes of a
+        split RAR, still go strictly in order. The first failure is raised
+        once running archives have finished.
+        """
+        pending = list(archives_to_process)
+        members = {archive_path: self._archive_members(archive_path) for archive_path, _ in pending}
+        running = {}
+        errors = []
+
+        def independent(archive_path, others):
+            mine = members[archive_path]
+            return mine is not None and all(members[o] is not None and mine.isdisjoint(members[o]) for o in others)
+
+        with ThreadPoolExecutor(max_workers=self._archive_concurrency) as pool:
+            while (pending and not errors) or running:
+                for item in list(pending):
+                    if errors or len(running) >= self._archive_concurrency:
+                        break
+                    ahead = list(running.values()) + [a for a, _ in pending[:pending.index(item)]]
+                    if ahead and not independent(item[0], ahead):
+                        continue
+                    pending.remove(item)
+                    running[pool.submit(self._extract_archive, item[0], item[1], total_files_to_extract, watching_data,
+                                        members[item[0]])] = item[0]
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    if future.exception():
+                        errors.append(future.exception())
+        if self._junk_cleanup_pending:
+            self._cleanup_junk_files()
+        if errors:
+            raise errors[0]
+
+    def _cleanup_junk_files(self):
+        """Remove .url files and _CommonRedist folders an extraction tool without exclusions wrote."""
+        self._junk_cleanup_pending = False
+        for root, dirs, files_in_dir in os.walk(self.download_dir):
+            if '_CommonRedist' in root:
+                try:
+                    shutil.rmtree(root)
+                except Exception:
+                    pass
+                continue
+            for fname in files_in_dir:
+                if fname.endswith('.url'):
+                    try:
+                        os.remove(os.path.join(root, fname))
+                    except Exception:
+                        pass
+
+    def _watch_members(self, members, watching_data):
+        """Record the extracted size of each wanted file among an archive's normalised member names."""
+        for name in members:
+            if name.endswith('.url') or name.endswith('.rar') or name.endswith('.zip') or '_CommonRedist' in name:
+                continue
+            full_path = os.path.join(self.download_dir, name)
+            try:
+                if os.path.isfile(full_path):
+                    watching_data[name.replace(os.sep, '/')] = {"size": os.path.getsize(full_path)}
+            except OSError:
+                pass
+
+    def _archive_members(self, archive_path):
+        """Normalised member names of an archive, or None if it can't be listed."""
+        try:
+            if archive_path.lower().endswith('.zip'):
+                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+                    names = zip_ref.namelist()
+            else:
+                unrar_bin = shutil.which('unrar') or shutil.which('unrar-free')
+                if not unrar_bin:
+                    return None
+                result = subprocess.run([unrar_bin, 'lb', '-p-', archive_path], capture_output=True, text=True)
+                if result.returncode != 0:
+                    return None
+                names = result.stdout.splitlines()
+        except (OSError, zipfile.BadZipFile) as e:
+            logging.warning(f"[QuadDownGofileHelper] Could not list {archive_path}: {e}")
+            return None
+        return {os.path.normcase(os.path.normpath(n.replace('\\', '/').strip('/'))) for n in names if n.strip()}
+
     def _check_extraction_tools(self):
         """Check if required extraction tools are available and try to install if missing."""
         if sys.platform != "win32":
@@ -770,6 +896,7 @@ class GofileDownloader:
             "extractionSpeed": "0 files/s"
         }
         safe_write_json(self.game_info_path, self.game_info)
+        progress_stream.emit("phase", phase="extracting")
         
         # Track extraction timing
         self._extraction_start_time = time.time()
@@ -835,258 +962,8 @@ class GofileDownloader:
         self._files_extracted_count = 0
         self._update_extraction_progress("Preparing...", 0, total_files_to_extract, force=True)
         
-        # Extract all archives with progress tracking
-        for archive_path, file in archives_to_process:
-            extract_dir = self.download_dir
-            logging.info(f"[QuadDownGofileHelper] Extracting {archive_path}")
-            
-            try:
-                # check os
-                if sys.platform == "win32":
-                    if file.endswith('.zip'):
-                        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                            # Filter members to extract (exclude .url and _CommonRedist)
-                            members_to_extract = [
-                                zip_info for zip_info in zip_ref.infolist()
-                                if not zip_info.filename.endswith('.url') and '_CommonRedist' not in zip_info.filename
-                            ]
-                            
-                            logging.info(f"[QuadDownGofileHelper] Extracting {len(members_to_extract)} files from ZIP")
-                            
-                            # Use extractall() for dramatically faster extraction (10-100x faster than file-by-file)
-                            try:
-                                zip_ref.extractall(extract_dir, members=members_to_extract)
-                                logging.info(f"[QuadDownGofileHelper] Bulk ZIP extraction complete")
-                            except Exception as e:
-                                logging.error(f"[QuadDownGofileHelper] Bulk ZIP extraction failed: {e}")
-                                raise
-                            
-                            # Build watching data and update progress after extraction
-                            for zip_info in members_to_extract:
-                                extracted_path = os.path.join(extract_dir, zip_info.filename)
-                                key = f"{os.path.relpath(extracted_path, self.download_dir)}"
-                                watching_data[key] = {"size": zip_info.file_size}
-                                # Update progress for non-directory entries
-                                if not zip_info.is_dir():
-                                    self._files_extracted_count += 1
-                                    # Only update progress every 100 files to reduce I/O overhead
-                                    if self._files_extracted_count % 100 == 0 or self._files_extracted_count == total_files_to_extract:
-                                        self._update_extraction_progress(zip_info.filename, self._files_extracted_count, total_files_to_extract)
-                    elif file.endswith('.rar'):
-                        from unrar import rarfile
-                        import threading
-                        
-                        # Use long path prefix for extraction to support paths > 260 chars
-                        long_extract_dir = long_path(extract_dir)
-                        with rarfile.RarFile(archive_path, 'r') as rar_ref:
-                            # Filter members to extract (exclude .url and _CommonRedist)
-                            rar_files = [info for info in rar_ref.infolist() 
-                                        if not info.filename.endswith('.url') and '_CommonRedist' not in info.filename]
-                            
-                            logging.info(f"[QuadDownGofileHelper] Extracting {len(rar_files)} files from RAR (fast mode)")
-                            
-                            # Count existing files before extraction to track only new files
-                            initial_file_count = 0
-                            try:
-                                for root, dirs, files_in_dir in os.walk(extract_dir):
-                                    initial_file_count += len([f for f in files_in_dir if not f.endswith('.url') and not f.endswith('.rar') and not f.endswith('.zip')])
-                            except Exception:
-                                pass
-                            
-                            # Use extractall() in thread for speed, monitor directory for progress
-                            extraction_complete = threading.Event()
-                            extraction_error = []
-                            
-                            def extract_thread():
-                                try:
-                                    # Try with long path first, fall back to regular path
-                                    try:
-                                        rar_ref.extractall(long_extract_dir)
-                                    except Exception:
-                                        rar_ref.extractall(extract_dir)
-                                except Exception as e:
-                                    extraction_error.append(e)
-                                finally:
-                                    extraction_complete.set()
-                            
-                            # Start extraction in background
-                            thread = threading.Thread(target=extract_thread, daemon=True)
-                            thread.start()
-                            
-                            # Monitor progress by counting extracted files
-                            last_count = 0
-                            while not extraction_complete.is_set():
-                                # Count files in extraction directory (subtract initial count)
-                                current_count = 0
-                                try:
-                                    for root, dirs, files_in_dir in os.walk(extract_dir):
-                                        current_count += len([f for f in files_in_dir if not f.endswith('.url') and not f.endswith('.rar') and not f.endswith('.zip')])
-                                except Exception:
-                                    pass
-                                
-                                # Calculate newly extracted files
-                                newly_extracted = max(0, current_count - initial_file_count)
-                                
-                                if newly_extracted > last_count:
-                                    files_extracted_this_archive = self._files_extracted_count + newly_extracted
-                                    self._update_extraction_progress(f"Extracting... ({newly_extracted} files)", files_extracted_this_archive, total_files_to_extract, force=True)
-                                    last_count = newly_extracted
-                                
-                                time.sleep(0.5)  # Check every 0.5 seconds
-                            
-                            # Wait for thread to complete
-                            thread.join(timeout=5)
-                            
-                            if extraction_error:
-                                logging.error(f"[QuadDownGofileHelper] RAR extraction failed: {extraction_error[0]}")
-                                raise extraction_error[0]
-                            
-                            logging.info(f"[QuadDownGofileHelper] RAR extraction complete")
-                            
-                            # Clean up unwanted files (.url and _CommonRedist)
-                            for root, dirs, files_in_dir in os.walk(extract_dir):
-                                if '_CommonRedist' in root:
-                                    try:
-                                        shutil.rmtree(root)
-                                        logging.info(f"[QuadDownGofileHelper] Removed _CommonRedist: {root}")
-                                    except Exception as e:
-                                        logging.warning(f"[QuadDownGofileHelper] Could not remove _CommonRedist: {e}")
-                                    continue
-                                
-                                for fname in files_in_dir:
-                                    if fname.endswith('.url'):
-                                        try:
-                                            os.remove(os.path.join(root, fname))
-                                        except Exception:
-                                            pass
-                            
-                            # Build watching data after extraction
-                            for rar_info in rar_files:
-                                extracted_path = os.path.join(extract_dir, rar_info.filename)
-                                if os.path.exists(long_path(extracted_path)) or os.path.exists(extracted_path):
-                                    key = f"{os.path.relpath(extracted_path, self.download_dir)}"
-                                    watching_data[key] = {"size": rar_info.file_size}
-                                
-                                is_dir = rar_info.filename.endswith('/') or rar_info.filename.endswith('\\')
-                                if not is_dir:
-                                    self._files_extracted_count += 1
-                            
-                            self._update_extraction_progress("Complete", self._files_extracted_count, total_files_to_extract, force=True)
-                else:
-                    # For non-Windows, use appropriate extraction tool
-                    try:
-                        import threading as _threading
-                        if file.endswith('.rar'):
-                            if sys.platform == "darwin":
-                                unar_bin = shutil.which('unar')
-                                if not unar_bin:
-                                    raise RuntimeError("unar not found. Install with: brew install unar")
-                                proc = subprocess.Popen(
-                                    ['unar', '-force-overwrite', '-o', extract_dir, archive_path],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                                )
-                                def _read_unar():
-                                    for raw in proc.stdout:
-                                        line = raw.decode(errors='replace').rstrip()
-                                        if line and not line.startswith(' '):
-                                            fname = os.path.basename(line.strip())
-                                            if fname and not fname.endswith('.url') and '_CommonRedist' not in fname:
-                                                self._files_extracted_count += 1
-                                                self._update_extraction_progress(fname, self._files_extracted_count, total_files_to_extract)
-                                t = _threading.Thread(target=_read_unar, daemon=True)
-                                t.start()
-                                rc = proc.wait()
-                                t.join(timeout=5)
-                                if rc not in (0, 1):
-                                    raise RuntimeError(f"unar exited with code {rc}: {proc.stderr.read().decode(errors='replace').strip()}")
-                            else:
-                                unrar_bin = shutil.which('unrar') or shutil.which('unrar-free')
-                                if not unrar_bin:
-                                    raise RuntimeError("No RAR extraction tool available. Install with: sudo apt-get install unrar")
-                                proc = subprocess.Popen(
-                                    [unrar_bin, 'x', '-y', archive_path, extract_dir + '/'],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE
-                                )
-                                def _read_unrar():
-                                    import re as _re
-                                    _last_seen = [""]
-                                    for raw in proc.stdout:
-                                        for segment in _re.split(r'[\r\n]', raw.decode(errors='replace')):
-                                            line = segment.strip()
-                                            line = _re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', line)
-                                            line = _re.sub(r'[^\x20-\x7E]', '', line)
-                                            if not (line.startswith('Extracting') or line.startswith('extracting')):
-                                                continue
-                                            rest = line.split(None, 1)[-1] if len(line.split(None, 1)) > 1 else ''
-                                            rest = _re.sub(r'\s{2,}\d+\s*%.*$', '', rest)
-                                            rest = _re.sub(r'\s+OK\s*$', '', rest)
-                                            rest = rest.strip()
-                                            fname = os.path.basename(rest)
-                                            if fname and fname != _last_seen[0] and not fname.endswith('.url') and '_CommonRedist' not in fname:
-                                                _last_seen[0] = fname
-                                                self._files_extracted_count += 1
-                                                self._update_extraction_progress(fname, self._files_extracted_count, total_files_to_extract)
-                                t = _threading.Thread(target=_read_unrar, daemon=True)
-                                t.start()
-                                rc = proc.wait()
-                                t.join(timeout=5)
-                                if rc not in (0, 1):
-                                    raise RuntimeError(f"unrar exited with code {rc}: {proc.stderr.read().decode(errors='replace').strip()}")
-                        elif file.endswith('.zip'):
-                            with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                                members_to_extract = [
-                                    zi for zi in zip_ref.infolist()
-                                    if not zi.filename.endswith('.url') and '_CommonRedist' not in zi.filename
-                                ]
-                                zip_ref.extractall(extract_dir, members=members_to_extract)
-                                for zi in members_to_extract:
-                                    if not zi.is_dir():
-                                        self._files_extracted_count += 1
-                                        key = os.path.relpath(os.path.join(extract_dir, zi.filename), self.download_dir)
-                                        watching_data[key] = {"size": zi.file_size}
-                                        if self._files_extracted_count % 100 == 0 or self._files_extracted_count == total_files_to_extract:
-                                            self._update_extraction_progress(zi.filename, self._files_extracted_count, total_files_to_extract)
-                        else:
-                            patoolib.extract_archive(archive_path, outdir=extract_dir)
-
-                        # Build watching data from extracted files (covers RAR case)
-                        for dirpath, _, filenames in os.walk(extract_dir):
-                            for fname in filenames:
-                                if fname.endswith('.url') or fname.endswith('.rar') or fname.endswith('.zip') or '_CommonRedist' in dirpath:
-                                    continue
-                                full_path = os.path.join(dirpath, fname)
-                                key = os.path.relpath(full_path, self.download_dir).replace('\\', '/')
-                                if key not in watching_data:
-                                    watching_data[key] = {"size": os.path.getsize(full_path)}
-
-                        # Clean up unwanted files
-                        for root, dirs, files_in_dir in os.walk(extract_dir):
-                            if '_CommonRedist' in root:
-                                try:
-                                    shutil.rmtree(root)
-                                except Exception:
-                                    pass
-                                continue
-                            for fname in files_in_dir:
-                                if fname.endswith('.url'):
-                                    try:
-                                        os.remove(os.path.join(root, fname))
-                                    except Exception:
-                                        pass
-
-                        self._update_extraction_progress("Complete", self._files_extracted_count, total_files_to_extract, force=True)
-                    except Exception as e:
-                        logging.error(f"Error during extraction on non-Windows system: {str(e)}")
-                        raise
-                # Delete archive after successful extraction
-                try:
-                    os.remove(archive_path)
-                    logging.info(f"[QuadDownGofileHelper] Deleted archive: {archive_path}")
-                except Exception as del_e:
-                    logging.warning(f"[QuadDownGofileHelper] Could not delete archive {archive_path}: {del_e}")
-            except Exception as e:
-                logging.error(f"[QuadDownGofileHelper] Error extracting {archive_path}: {str(e)}")
-                raise
+        # Extract the archives, independent ones side by side
+        self._extract_archives(archives_to_process, total_files_to_extract, watching_data)
 
         # Flatten nested directories - but be careful not to delete the game directory itself
         nested_dir = os.path.join(self.download_dir, sanitize_folder_name(self.game))
@@ -1170,16 +1047,6 @@ class GofileDownloader:
                         watching_data[rel_path] = {"size": os.path.getsize(full_path)}
             safe_write_json(watching_path, watching_data)
 
-        # Remove all .url files after extraction
-        for dirpath, _, filenames in os.walk(self.download_dir):
-            for fname in filenames:
-                if fname.endswith('.url'):
-                    file_path = os.path.join(dirpath, fname)
-                    try:
-                        os.remove(file_path)
-                        logging.info(f"[QuadDownGofileHelper] Deleted .url file: {file_path}")
-                    except Exception as e:
-                        logging.warning(f"[QuadDownGofileHelper] Could not delete .url file: {file_path}: {e}")
         # If not found, try to match by first word of game name
         if not moved and os.path.exists(self.download_dir):
             first_word = self.game.strip().split()[0].lower()
@@ -1246,10 +1113,244 @@ class GofileDownloader:
         self.game_info["downloadingData"]["extracting"] = False
         self.game_info["downloadingData"]["verifying"] = True
         safe_write_json(self.game_info_path, self.game_info)
+        progress_stream.emit("phase", phase="verifying")
 
         # Start verification
         self._verify_extracted_files(watching_path)
 
+    def _extract_archive(self, archive_path, file, total_files_to_extract, watching_data, members=None):
+        extract_dir = self.download_dir
+        logging.info(f"[QuadDownGofileHelper] Extracting {archive_path}")
+        
+        try:
+            # check os
+            if sys.platform == "win32":
+                if file.endswith('.zip'):
+                    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+                        # Filter members to extract (exclude .url and _CommonRedist)
+                        members_to_extract = [
+                            zip_info for zip_info in zip_ref.infolist()
+                            if not zip_info.filename.endswith('.url') and '_CommonRedist' not in zip_info.filename
+                        ]
+                        
+                        logging.info(f"[QuadDownGofileHelper] Extracting {len(members_to_extract)} files from ZIP")
+                        
+                        # Use extractall() for dramatically faster extraction (10-100x faster than file-by-file)
+                        try:
+                            zip_ref.extractall(extract_dir, members=members_to_extract)
+                            logging.info(f"[QuadDownGofileHelper] Bulk ZIP extraction complete")
+                        except Exception as e:
+                            logging.error(f"[QuadDownGofileHelper] Bulk ZIP extraction failed: {e}")
+                            raise
+                        
+                        # Build watching data and update progress after extraction
+                        for zip_info in members_to_extract:
+                            extracted_path = os.path.join(extract_dir, zip_info.filename)
+                            key = f"{os.path.relpath(extracted_path, self.download_dir)}"
+                            watching_data[key] = {"size": zip_info.file_size}
+                            # Update progress for non-directory entries
+                            if not zip_info.is_dir():
+                                extracted = self._count_extracted()
+                                # Only update progress every 100 files to reduce I/O overhead
+                                if extracted % 100 == 0 or extracted == total_files_to_extract:
+                                    self._update_extraction_progress(zip_info.filename, extracted, total_files_to_extract)
+                elif file.endswith('.rar'):
+                    from unrar import rarfile
+                    import threading
+                    
+                    # Use long path prefix for extraction to support paths > 260 chars
+                    long_extract_dir = long_path(extract_dir)
+                    with rarfile.RarFile(archive_path, 'r') as rar_ref:
+                        # Filter members to extract (exclude .url and _CommonRedist)
+                        rar_files = [info for info in rar_ref.infolist() 
+                                    if not info.filename.endswith('.url') and '_CommonRedist' not in info.filename]
+                        
+                        logging.info(f"[QuadDownGofileHelper] Extracting {len(rar_files)} files from RAR (fast mode)")
+                        
+                        # Files of this archive still to be written; other archives extracting
+                        # alongside share the folder, so progress checks these paths rather than it
+                        unfinished = {long_path(os.path.join(extract_dir, info.filename)): info.file_size
+                                      for info in rar_files
+                                      if not (info.filename.endswith('/') or info.filename.endswith('\\'))}
+                        
+                        # Use extractall() in thread for speed, monitor its files for progress
+                        extraction_complete = threading.Event()
+                        extraction_error = []
+                        
+                        def extract_thread():
+                            try:
+                                # Try with long path first, fall back to regular path
+                                try:
+                                    rar_ref.extractall(long_extract_dir, members=rar_files)
+                                except Exception:
+                                    rar_ref.extractall(extract_dir, members=rar_files)
+                            except Exception as e:
+                                extraction_error.append(e)
+                            finally:
+                                extraction_complete.set()
+                        
+                        # Start extraction in background
+                        thread = threading.Thread(target=extract_thread, daemon=True)
+                        thread.start()
+                        
+                        # Monitor progress by counting this archive's files that reached full size
+                        last_count = 0
+                        newly_extracted = 0
+                        while not extraction_complete.is_set():
+                            for path, size in list(unfinished.items()):
+                                try:
+                                    if os.path.getsize(path) == size:
+                                        del unfinished[path]
+                                        newly_extracted += 1
+                                except OSError:
+                                    pass  # Not written yet
+                            
+                            if newly_extracted > last_count:
+                                files_extracted_this_archive = self._files_extracted_count + newly_extracted
+                                self._update_extraction_progress(f"Extracting... ({newly_extracted} files)", files_extracted_this_archive, total_files_to_extract, force=True)
+                                last_count = newly_extracted
+                            
+                            time.sleep(0.5)  # Check every 0.5 seconds
+                        
+                        # Wait for thread to complete
+                        thread.join(timeout=5)
+                        
+                        if extraction_error:
+                            logging.error(f"[QuadDownGofileHelper] RAR extraction failed: {extraction_error[0]}")
+                            raise extraction_error[0]
+                        
+                        logging.info(f"[QuadDownGofileHelper] RAR extraction complete")
+                        
+                        # Build watching data after extraction
+                        for rar_info in rar_files:
+                            extracted_path = os.path.join(extract_dir, rar_info.filename)
+                            if os.path.exists(long_path(extracted_path)) or os.path.exists(extracted_path):
+                                key = f"{os.path.relpath(extracted_path, self.download_dir)}"
+                                watching_data[key] = {"size": rar_info.file_size}
+                            
+                            is_dir = rar_info.filename.endswith('/') or rar_info.filename.endswith('\\')
+                            if not is_dir:
+                                self._count_extracted()
+                        
+                        self._update_extraction_progress("Complete", self._files_extracted_count, total_files_to_extract, force=True)
+            else:
+                # For non-Windows, use appropriate extraction tool
+                try:
+                    import threading as _threading
+                    # Set when the tool can't skip junk members itself
+                    unfiltered = False
+                    if file.endswith('.rar'):
+                        if sys.platform == "darwin":
+                            unar_bin = shutil.which('unar')
+                            if not unar_bin:
+                                raise RuntimeError("unar not found. Install with: brew install unar")
+                            unfiltered = True
+                            proc = subprocess.Popen(
+                                ['unar', '-force-overwrite', '-o', extract_dir, archive_path],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                            )
+                            def _read_unar():
+                                for raw in proc.stdout:
+                                    line = raw.decode(errors='replace').rstrip()
+                                    if line and not line.startswith(' '):
+                                        fname = os.path.basename(line.strip())
+                                        if fname and not fname.endswith('.url') and '_CommonRedist' not in fname:
+                                            self._update_extraction_progress(fname, self._count_extracted(), total_files_to_extract)
+                            t = _threading.Thread(target=_read_unar, daemon=True)
+                            t.start()
+                            rc = proc.wait()
+                            t.join(timeout=5)
+                            if rc not in (0, 1):
+                                raise RuntimeError(f"unar exited with code {rc}: {proc.stderr.read().decode(errors='replace').strip()}")
+                        else:
+                            unrar_bin = shutil.which('unrar') or shutil.which('unrar-free')
+                            if not unrar_bin:
+                                raise RuntimeError("No RAR extraction tool available. Install with: sudo apt-get install unrar")
+                            # Only RARLAB's unrar takes exclusion masks; unrar-free extracts everything
+                            unfiltered = 'free' in os.path.basename(os.path.realpath(unrar_bin))
+                            excludes = [] if unfiltered else [f"-x{mask}" for mask in self.UNRAR_EXCLUDES]
+                            proc = subprocess.Popen(
+                                [unrar_bin, 'x', '-y', *excludes, archive_path, extract_dir + '/'],
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                            )
+                            def _read_unrar():
+                                import re as _re
+                                _last_seen = [""]
+                                for raw in proc.stdout:
+                                    for segment in _re.split(r'[\r\n]', raw.decode(errors='replace')):
+                                        line = segment.strip()
+                                        line = _re.sub(r'\x1b\[[0-9;]*[A-Za-z]', '', line)
+                                        line = _re.sub(r'[^\x20-\x7E]', '', line)
+                                        if not (line.startswith('Extracting') or line.startswith('extracting')):
+                                            continue
+                                        rest = line.split(None, 1)[-1] if len(line.split(None, 1)) > 1 else ''
+                                        rest = _re.sub(r'\s{2,}\d+\s*%.*$', '', rest)
+                                        rest = _re.sub(r'\s+OK\s*$', '', rest)
+                                        rest = rest.strip()
+                                        fname = os.path.basename(rest)
+                                        if fname and fname != _last_seen[0] and not fname.endswith('.url') and '_CommonRedist' not in fname:
+                                            _last_seen[0] = fname
+                                            self._update_extraction_progress(fname, self._count_extracted(), total_files_to_extract)
+                            t = _threading.Thread(target=_read_unrar, daemon=True)
+                            t.start()
+                            rc = proc.wait()
+                            t.join(timeout=5)
+                            if rc not in (0, 1):
+                                raise RuntimeError(f"unrar exited with code {rc}: {proc.stderr.read().decode(errors='replace').strip()}")
+                    elif file.endswith('.zip'):
+                        with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+                            members_to_extract = [
+                                zi for zi in zip_ref.infolist()
+                                if not zi.filename.endswith('.url') and '_CommonRedist' not in zi.filename
+                            ]
+                            zip_ref.extractall(extract_dir, members=members_to_extract)
+                            for zi in members_to_extract:
+                                if not zi.is_dir():
+                                    extracted = self._count_extracted()
+                                    key = os.path.relpath(os.path.join(extract_dir, zi.filename), self.download_dir)
+                                    watching_data[key] = {"size": zi.file_size}
+                                    if extracted % 100 == 0 or extracted == total_files_to_extract:
+                                        self._update_extraction_progress(zi.filename, extracted, total_files_to_extract)
+                    else:
+                        patoolib.extract_archive(archive_path, outdir=extract_dir)
+                        unfiltered = True
+
+                    # Build watching data for the RAR case from this archive's own members,
+                    # since archives extracting alongside write into the same folder
+                    if not file.endswith('.zip'):
+                        if members is None:
+                            members = self._archive_members(archive_path)
+                        if members is not None:
+                            self._watch_members(members, watching_data)
+                        else:
+                            # Unlistable archives never run alongside others, so the folder is this one's alone
+                            for dirpath, _, filenames in os.walk(extract_dir):
+                                for fname in filenames:
+                                    if fname.endswith('.url') or fname.endswith('.rar') or fname.endswith('.zip') or '_CommonRedist' in dirpath:
+                                        continue
+                                    full_path = os.path.join(dirpath, fname)
+                                    key = os.path.relpath(full_path, self.download_dir).replace('\\', '/')
+                                    if key not in watching_data:
+                                        watching_data[key] = {"size": os.path.getsize(full_path)}
+
+                    # Unwanted files the extraction tool couldn't skip are swept once no archive is writing
+                    if unfiltered:
+                        self._junk_cleanup_pending = True
+
+                    self._update_extraction_progress("Complete", self._files_extracted_count, total_files_to_extract, force=True)
+                except Exception as e:
+                    logging.error(f"Error during extraction on non-Windows system: {str(e)}")
+                    raise
+            # Delete archive after successful extraction
+            try:
+                os.remove(archive_path)
+                logging.info(f"[QuadDownGofileHelper] Deleted archive: {archive_path}")
+            except Exception as del_e:
+                logging.warning(f"[QuadDownGofileHelper] Could not delete archive {archive_path}: {del_e}")
+        except Exception as e:
+            logging.error(f"[QuadDownGofileHelper] Error extracting {archive_path}: {str(e)}")
+            raise
+
     def _verify_extracted_files(self, watching_path):
         verify_errors = []  # Initialize early to avoid reference errors
         verify_start_time = time.time()
@@ -1265,17 +1366,6 @@ class GofileDownloader:
             with open(watching_path, 'r') as f:
                 watching_data = json.load(f)
 
-            # Find and delete _CommonRedist directories
-            for root, dirs, files in os.walk(self.download_dir):
-                if "_CommonRedist" in dirs:
-                    common_redist_path = os.path.join(root, "_CommonRedist")
-                    logging.info(f"[QuadDownGofileHelper] Found _CommonRedist directory at {common_redist_path}, deleting...")
-                    try:
-                        import shutil
-                        shutil.rmtree(common_redist_path)
-                        logging.info(f"[QuadDownGofileHelper] Successfully deleted {common_redist_path}")
-                    except Exception as e:
-                        logging.error(f"[QuadDownGofileHelper] Error deleting _CommonRedist directory: {str(e)}")
 
             filtered_watching_data = {}
             for file_path, file_info in watching_data.items():
@@ -1439,6 +1529,7 @@ def main():
     parser.add_argument("gameID", nargs="?", default="", help="Game ID from SteamRIP")
     parser.add_argument("--password", help="Password for protected content", default=None)
     parser.add_argument("--withNotification", help="Theme name for notifications (e.g. light, dark, blue)", default=None)
+    parser.add_argument("--progressStream", action="store_true", help="Write NDJSON progress events to stdout")
 
     try:
         if len(sys.argv) == 1:  # No arguments provided
@@ -1449,6 +1540,8 @@ def main():
             sys.exit(1)
             
         args = parser.parse_args()
+        if args.progressStream:
+            progress_stream.enable()
         logging.info(f"Starting download process for game: {args.game}")
         logging.debug(f"Arguments: url={args.url}, online={args.online}, dlc={args.dlc}, "
                      f"isVr={args.isVr}, update={args.updateFlow}, version={args.version}, size={args.size}, "
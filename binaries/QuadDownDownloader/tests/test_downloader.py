@@ -0,0 +1,608 @@
+"""
+Tests for QuadDownDownloader, mostly against a local HTTP server with Range support.
+
+Run from binaries/QuadDownDownloader with: python -m unittest discover tests
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import socket
+import struct
+import subprocess
+import hashlib
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Settings and logs live under HOME; keep both out of the real profile
+HOME = tempfile.mkdtemp(prefix="qd-test-home-")
+os.environ["HOME"] = HOME
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import QuadDownDownloader as Q  # noqa: E402
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves files from server.root, honouring single byte ranges."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self._serve(False)
+
+    def do_GET(self):
+        self._serve(True)
+
+    def _serve(self, body: bool):
+        path = os.path.join(self.server.root, self.path.lstrip("/").split("?")[0])
+        if not os.path.isfile(path):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        size = os.path.getsize(path)
+        start, end, status = 0, size - 1, 200
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range") or "")
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+            if start >= size:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            status = 206
+        self.send_response(status)
+        self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if not body:
+            return
+        self.server.gets.append((self.path, start))
+        with open(path, "rb") as f:
+            f.seek(start)
+            left = end - start + 1
+            try:
+                while left > 0:
+                    chunk = f.read(min(256 * 1024, left))
+                    self.wfile.write(chunk)
+                    left -= len(chunk)
+                    time.sleep(self.server.chunk_delay)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+
+class ServerTestCase(unittest.TestCase):
+    """Starts a RangeHandler server over a scratch directory per test."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="qd-test-")
+        self.served = os.path.join(self.root, "served")
+        self.install = os.path.join(self.root, "install")
+        os.makedirs(self.served)
+        os.makedirs(self.install)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+        self.server.root = self.served
+        self.server.gets = []
+        self.server.chunk_delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self._stop)
+        self.write_settings({})
+
+    def _stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def url(self, name: str) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}/{name}"
+
+    def write_settings(self, settings: dict):
+        os.makedirs(os.path.join(HOME, ".QuadDown"), exist_ok=True)
+        with open(os.path.join(HOME, ".QuadDown", "QuadDownsettings.json"), "w") as f:
+            json.dump(settings, f)
+
+    def make_zip(self, name: str, files: dict) -> str:
+        path = os.path.join(self.served, name)
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for member, data in files.items():
+                zf.writestr(member, data)
+        return path
+
+
+MB = 1024 * 1024
+
+
+class DownloadJournalTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="qd-test-journal-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.part = os.path.join(self.root, "game.bin.part")
+
+    def test_merge_joins_overlapping_and_touching_ranges(self):
+        merged = Q.DownloadJournal.merge([(50, 60), (0, 10), (10, 20), (15, 30), (40, 40), (55, 58)])
+        self.assertEqual(merged, [(0, 30), (50, 60)])  # Empty ranges are dropped
+        self.assertEqual(Q.DownloadJournal.merge([]), [])
+
+    def test_missing_ranges_are_the_gaps(self):
+        journal = Q.DownloadJournal(self.part + ".journal", 100)
+        self.assertEqual(journal.missing_ranges(), [(0, 100)])
+        journal.reset([(10, 20), (20, 30), (60, 70)])
+        self.assertEqual(journal.missing_ranges(), [(0, 10), (30, 60), (70, 100)])
+        self.assertEqual(journal.completed_bytes(), 30)
+        journal.reset([(0, 100)])
+        self.assertEqual(journal.missing_ranges(), [])
+
+    def test_saved_ranges_survive_a_reload(self):
+        with open(self.part, "wb") as f:
+            f.write(bytes(100))
+        journal = Q.DownloadJournal(self.part + Q.DownloadJournal.SUFFIX, 100)
+        journal.reset([(0, 10)])
+        segment = Q.DownloadSegment(0, 40, 80)
+        segment.mark_written(15)  # Only bytes 40-55 reached the file
+        journal.save([segment])
+
+        reloaded = Q.DownloadJournal(journal.path, 100)
+        self.assertTrue(reloaded.load(self.part))
+        self.assertEqual(reloaded.missing_ranges(), [(10, 40), (55, 100)])
+        self.assertFalse(Q.DownloadJournal(journal.path, 200).load(self.part))  # Remote size changed
+
+
+# One process sharing the limiter: waits for a common start, then receives `count` chunks
+LIMITER_CHILD = """
+import sys, time, json
+sys.path.insert(0, sys.argv[1])
+import QuadDownDownloader as Q
+limiter = Q.BandwidthLimiter(float(sys.argv[3]), sys.argv[2])
+time.sleep(max(0.0, float(sys.argv[4]) - time.time()))
+for _ in range(int(sys.argv[5])):
+    limiter.consume(64 * 1024)
+print(json.dumps(time.time()))
+"""
+
+
+class BandwidthLimiterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="qd-test-limit-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+        self.state = os.path.join(self.root, Q.BandwidthLimiter.STATE_FILE)
+
+    def idle_at(self) -> float:
+        with open(self.state, "rb") as f:
+            return struct.unpack("d", f.read(8))[0]
+
+    def test_reservations_add_up_in_the_state_file(self):
+        limiter = Q.BandwidthLimiter(1 * MB, self.state)
+        self.addCleanup(os.close, limiter._fd)
+        start = time.time()
+        for _ in range(4):
+            limiter.consume(64 * 1024)  # A quarter second in all, inside the burst allowance
+        self.assertLess(time.time() - start, 0.1)
+        self.assertAlmostEqual(self.idle_at() - start, 0.25, delta=0.05)
+
+    def test_processes_split_one_cap(self):
+        src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+        rate, count = 512 * 1024, 8  # 512 KB each: about 0.75s alone, 1.75s sharing
+        start = time.time() + 3  # Leave time for both to import
+        children = [subprocess.Popen([sys.executable, "-c", LIMITER_CHILD, src, self.state, str(rate), str(start), str(count)],
+                                     stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, env=os.environ.copy())
+                    for _ in range(2)]
+        ends = [json.loads(child.communicate(timeout=60)[0].strip().splitlines()[-1]) for child in children]
+
+        self.assertGreater(max(ends) - start, 1.5)
+        # Every chunk from both processes pushed the same idle time forward
+        self.assertAlmostEqual(self.idle_at() - start, 2 * count * 64 * 1024 / rate, delta=0.3)
+
+
+class RetryBudgetTests(unittest.TestCase):
+
+    @staticmethod
+    def http_error(status: int, headers: dict = None) -> "Q.requests.HTTPError":
+        response = Q.requests.Response()
+        response.status_code = status
+        response.headers.update(headers or {})
+        return Q.requests.HTTPError(f"{status}", response=response)
+
+    def test_classify(self):
+        classify = Q.RetryBudget.classify
+        # HTTPError is an OSError too, so it must be told apart first
+        self.assertEqual(classify(self.http_error(503)), "http")
+        for error in (Q.requests.ConnectionError(), Q.requests.Timeout(), Q.requests.exceptions.ChunkedEncodingError(),
+                      Q.ProtocolError(), Q.http.client.IncompleteRead(b""), ConnectionResetError(), socket.timeout()):
+            self.assertEqual(classify(error), "connection", error)
+        self.assertEqual(classify(ValueError()), "other")
+
+    def test_failure_backs_off_by_kind_and_gives_up_on_fatal_status(self):
+        budget = Q.RetryBudget()
+        self.assertLessEqual(budget.failure(Q.requests.ConnectionError(), 1), 0.5 * 1.2)
+        self.assertGreaterEqual(budget.failure(self.http_error(503, {"Retry-After": "30"}), 1), 30 * 0.8)
+        self.assertIsNone(budget.failure(self.http_error(404), 1))
+        self.assertEqual(budget.counts, {"connection": 1, "http": 2, "other": 0})
+
+    def test_progress_resets_the_attempt_count(self):
+        budget = Q.RetryBudget()
+        for _ in range(Q.RetryBudget.MAX_ATTEMPTS):
+            self.assertIsNotNone(budget.failure(Q.requests.ConnectionError(), 1))
+        budget.progress()
+        self.assertIsNotNone(budget.failure(Q.requests.ConnectionError(), 1))
+        for _ in range(Q.RetryBudget.MAX_ATTEMPTS):
+            budget.failure(Q.requests.ConnectionError(), 1)
+        self.assertIsNone(budget.failure(Q.requests.ConnectionError(), 1))
+
+
+class SegmentTests(unittest.TestCase):
+
+    def make_downloader(self, connections: int) -> "Q.ChunkedDownloader":
+        root = tempfile.mkdtemp(prefix="qd-test-seg-")
+        self.addCleanup(shutil.rmtree, root, True)
+        downloader = Q.ChunkedDownloader("http://127.0.0.1:9/game.bin", os.path.join(root, "game.bin"),
+                                         {"downloadingData": {}}, os.path.join(root, "game.json"),
+                                         connections=connections)
+        self.addCleanup(downloader.state.close)
+        self.addCleanup(downloader.session.close)
+        return downloader
+
+    def assertCovers(self, segments, gaps):
+        """Segments tile the gaps exactly, in order, with no overlap."""
+        self.assertEqual([seg.index for seg in segments], list(range(len(segments))))
+        self.assertEqual(Q.DownloadJournal.merge([(seg.start, seg.end) for seg in segments]), gaps)
+        self.assertEqual(sum(seg.end - seg.start for seg in segments), sum(end - start for start, end in gaps))
+
+    def test_plan_splits_evenly_across_connections(self):
+        segments = self.make_downloader(4)._plan_segments([(0, 100 * MB)])
+        self.assertEqual(len(segments), 4)
+        self.assertEqual([seg.end - seg.start for seg in segments], [25 * MB] * 4)
+        self.assertCovers(segments, [(0, 100 * MB)])
+
+    def test_plan_never_goes_below_minimum_segment_size(self):
+        downloader = self.make_downloader(8)
+        self.assertEqual(len(downloader._plan_segments([(0, 20 * MB)])), 1)
+        gaps = [(0, 10 * MB), (50 * MB, 100 * MB + 3)]  # What a resumed journal leaves
+        segments = downloader._plan_segments(gaps)
+        self.assertEqual([seg.start for seg in segments if seg.start < 50 * MB], [0])  # The small gap stays whole
+        self.assertTrue(all(seg.end - seg.start >= Q.ChunkedDownloader.MIN_SEGMENT_SIZE for seg in segments[1:]))
+        self.assertCovers(segments, gaps)
+
+
+    def test_steal_splits_the_slowest_segment_on_a_shared_boundary(self):
+        downloader = self.make_downloader(4)
+        slow = downloader._add_segment(0, 64 * MB)
+        fast = downloader._add_segment(64 * MB, 128 * MB)
+        slow.offset, slow.rate, slow.active = 8 * MB, 1.0 * MB, True
+        fast.offset, fast.rate, fast.active = 120 * MB, 9.0 * MB, True
+
+        stolen = downloader._steal_segment()
+
+        self.assertEqual(stolen.start, slow.end)  # Nothing skipped or fetched twice
+        self.assertEqual(stolen.end, 64 * MB)
+        # The slow connection keeps what it can fetch while the helper does the rest at the average rate
+        self.assertAlmostEqual((slow.end - slow.offset) / (56 * MB), 1 / (1 + 5), delta=0.01)
+        self.assertGreaterEqual(slow.end - slow.offset, Q.ChunkedDownloader.MIN_STEAL_SIZE)
+        self.assertIs(downloader._segments[-1], stolen)
+
+    def test_steal_leaves_small_ranges_alone(self):
+        downloader = self.make_downloader(4)
+        segment = downloader._add_segment(0, 2 * Q.ChunkedDownloader.MIN_STEAL_SIZE - 1)
+        segment.active, segment.rate = True, 1.0
+        self.assertIsNone(downloader._steal_segment())
+        self.assertEqual(segment.end, 2 * Q.ChunkedDownloader.MIN_STEAL_SIZE - 1)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+class ArchiveIndexTests(unittest.TestCase):
+
+    def test_parse_technical_listing(self):
+        # Captured `unrar lt` output for a two-volume set; unrar isn't needed to run this
+        with open(os.path.join(FIXTURES, "unrar_lt.txt")) as f:
+            entries = Q.ArchiveIndex.parse_technical_listing(f.read())
+        listed = {e.name: (e.size, e.crc, e.is_dir) for e in entries}
+
+        self.assertEqual(listed, {
+            "Game/Game.exe": (5242880, 0x1A2B3C4D, False),
+            "Game/Data/level: one.pak": (3221225472, 0x00FF00FF, False),  # Split file listed once, ':' kept
+            "Game/_CommonRedist/vcredist_x64.exe": (14413312, 0xDEADBEEF, False),
+            "Game/Data": (0, None, True),
+            "Game/Game.url": (52, None, False),
+        })  # The CMT service header is not a member
+
+        index = Q.ArchiveIndex("Game.part1.rar", entries)
+        wanted = [e.name for e in index.files(Q.RobustDownloader._wanted_member)]
+        self.assertEqual(wanted, ["Game/Game.exe", "Game/Data/level: one.pak"])
+        self.assertEqual([e.name for e in index.archives({".rar", ".zip"})], [])
+
+
+class ParallelZipExtractorTests(unittest.TestCase):
+
+    def test_member_with_bad_crc_is_discarded_and_the_rest_extracted(self):
+        root = tempfile.mkdtemp(prefix="qd-test-pzip-")
+        self.addCleanup(shutil.rmtree, root, True)
+        archive = os.path.join(root, "game.zip")
+        files = {f"Game/file{i}.bin": os.urandom(64 * 1024) for i in range(6)}
+        bad = b"CORRUPT-ME" + os.urandom(3 * Q.ParallelZipExtractor.COPY_CHUNK)
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_STORED) as zf:
+            for name, data in files.items():
+                zf.writestr(name, data)
+            zf.writestr("Game/bad.pak", bad)
+        with open(archive, "r+b") as f:
+            raw = f.read()
+            f.seek(raw.index(b"CORRUPT-ME"))
+            f.write(b"c")  # Stored data no longer matches the CRC in the header
+        with zipfile.ZipFile(archive) as zf:
+            members = zf.infolist()
+
+        dest = os.path.join(root, "install")
+        finished = []
+        extractor = Q.ParallelZipExtractor(archive, dest, 3)
+        extractor.extract(members, on_member=lambda info: finished.append(info.filename))
+
+        self.assertEqual(list(extractor.failed), ["Game/bad.pak"])
+        self.assertIn("CRC", extractor.failed["Game/bad.pak"])
+        self.assertFalse(os.path.exists(os.path.join(dest, "Game", "bad.pak")))  # No partial file left behind
+        self.assertEqual(sorted(finished), sorted(files))
+        for name, data in files.items():
+            with open(os.path.join(dest, name), "rb") as f:
+                self.assertEqual(f.read(), data)
+
+
+class StreamHasherTests(unittest.TestCase):
+
+    def test_catch_up_does_not_hold_lock_while_reading(self):
+        data = os.urandom(3 * Q.StreamHasher.READ_SIZE + 123)
+        fd, path = tempfile.mkstemp(prefix="qd-test-hash-")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+
+        hasher = Q.StreamHasher()
+        real_open = open
+        lock_held = []
+
+        class WatchedFile:
+            def __init__(self, f):
+                self._f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def seek(self, pos):
+                self._f.seek(pos)
+
+            def read(self, size):
+                lock_held.append(hasher._lock.locked())
+                chunk = self._f.read(size)
+                # Another connection lands a chunk at the frontier between reads
+                if not hasher._lock.locked() and hasher.offset == Q.StreamHasher.READ_SIZE:
+                    hasher.update_at(hasher.offset, data[hasher.offset:hasher.offset + 1000])
+                return chunk
+
+        Q.open = lambda *a, **kw: WatchedFile(real_open(*a, **kw))
+        self.addCleanup(delattr, Q, "open")
+        hasher.catch_up(path, len(data))
+
+        self.assertEqual(hasher.offset, len(data))
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(data).hexdigest())
+        self.assertEqual(hasher.read_back, len(data) - 1000)
+        self.assertTrue(lock_held)
+        self.assertFalse(any(lock_held))
+
+
+class PrimedResponseTests(ServerTestCase):
+
+    class RecordingDownloader(Q.ChunkedDownloader):
+        """Notes whether the first GET's response is still open as each segment starts."""
+
+        def _download_segment(self, segment):
+            self.primed_at_start.append(self._primed)
+            return super()._download_segment(segment)
+
+    def test_journal_resume_closes_unused_first_response(self):
+        data = os.urandom(4 * 1024 * 1024)
+        with open(os.path.join(self.served, "game.bin"), "wb") as f:
+            f.write(data)
+        dest = os.path.join(self.install, "game.bin")
+        half = len(data) // 2
+        # An interrupted run: the first half is on disk and journaled
+        with open(dest + Q.ChunkedDownloader.PART_SUFFIX, "wb") as f:
+            f.write(data[:half] + bytes(len(data) - half))
+        journal = Q.DownloadJournal(dest + Q.ChunkedDownloader.PART_SUFFIX + Q.DownloadJournal.SUFFIX, len(data))
+        journal.reset([(0, half)])
+        journal.save([])
+
+        game_info = {"downloadingData": {}}
+        downloader = self.RecordingDownloader(self.url("game.bin"), dest, game_info,
+                                              os.path.join(self.install, "game.json"))
+        downloader.primed_at_start = []
+        self.assertTrue(downloader.download())
+
+        with open(dest, "rb") as f:
+            self.assertEqual(f.read(), data)
+        self.assertIn(("/game.bin", 0), self.server.gets)  # The first GET was made...
+        self.assertTrue(downloader.primed_at_start)
+        self.assertTrue(all(p is None for p in downloader.primed_at_start))  # ...and closed before any segment ran
+        self.assertNotIn(("/game.bin", 0), self.server.gets[1:])
+
+
+class MirrorRankTests(ServerTestCase):
+
+    def test_probes_use_the_downloader_session(self):
+        with open(os.path.join(self.served, "game.bin"), "wb") as f:
+            f.write(os.urandom(MB))
+        session = Q.create_robust_session(retries=False)
+        self.addCleanup(session.close)
+        probed = []
+        get = session.get
+        session.get = lambda url, **kwargs: probed.append(url) or get(url, **kwargs)
+        downloader = Q.RobustDownloader("Test Game", False, False, False, False, "1", "1 MB",
+                                        self.install, session=session)
+
+        mirrors = [self.url("game.bin"), self.url("game.bin?mirror")]
+        best, rest, rates = downloader._rank_mirrors(mirrors[0], mirrors[1:])
+
+        self.assertEqual(sorted(probed), sorted(mirrors))
+        self.assertEqual(sorted([best] + rest), sorted(mirrors))
+        self.assertIs(downloader.session, session)
+
+
+class StreamExtractTests(ServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        save_interval = Q.StreamingZipExtractor.SAVE_INTERVAL
+        Q.StreamingZipExtractor.SAVE_INTERVAL = 64 * 1024  # Release the archive head early
+        self.addCleanup(setattr, Q.StreamingZipExtractor, "SAVE_INTERVAL", save_interval)
+
+    def test_extensionless_zip_streamed_without_keeping_archive(self):
+        files = {f"Game/Data/file{i}.bin": os.urandom(32 * 1024) for i in range(40)}
+        self.make_zip("download", files)
+        self.write_settings({"streamExtract": True, "keepArchive": False})
+
+        downloader = Q.RobustDownloader("Test Game", False, False, False, False, "1", "1 MB", self.install)
+        downloader.download(self.url("download"))
+
+        game_dir = os.path.join(self.install, "Test Game")
+        for member, data in files.items():
+            with open(os.path.join(game_dir, member.split("/", 1)[1]), "rb") as f:
+                self.assertEqual(f.read(), data, member)
+        leftovers = [f for f in os.listdir(game_dir) if f.startswith("download")]
+        self.assertEqual(leftovers, [])  # Neither the archive nor its .extract state
+        with open(os.path.join(game_dir, "Test Game.QuadDown.json")) as f:
+            self.assertNotIn("downloadingData", json.load(f))
+
+
+
+class JunkCleanupTests(ServerTestCase):
+
+    def test_indexed_cleanup_leaves_sibling_archives_alone(self):
+        downloader = Q.RobustDownloader("Test Game", False, False, False, False, "1", "1 MB", self.install)
+        game_dir = downloader.download_dir
+        written = ["Game/readme.url", "Game/_CommonRedist/vcredist/vc.exe", "Game/game.exe",
+                   "DLC/shop.url", "DLC/_CommonRedist/dx/dx.exe"]
+        for name in written:
+            os.makedirs(os.path.dirname(os.path.join(game_dir, name)), exist_ok=True)
+            with open(os.path.join(game_dir, name), "wb") as f:
+                f.write(b"x")
+        # Only the Game/ members belong to this archive; DLC/ is a sibling still extracting
+        index = Q.ArchiveIndex("base.rar", [
+            Q.ArchiveEntry("Game/readme.url", 1, None, False),
+            Q.ArchiveEntry("Game/_CommonRedist/vcredist/vc.exe", 1, None, False),
+            Q.ArchiveEntry("Game/game.exe", 1, None, False),
+        ])
+
+        downloader._cleanup_junk_files(index)
+
+        remaining = sorted(os.path.relpath(os.path.join(root, f), game_dir).replace(os.sep, "/")
+                           for root, _, files in os.walk(game_dir) for f in files)
+        self.assertEqual(remaining, ["DLC/_CommonRedist/dx/dx.exe", "DLC/shop.url", "Game/game.exe",
+                                     "Test Game.QuadDown.json"])
+        self.assertFalse(os.path.exists(os.path.join(game_dir, "Game", "_CommonRedist")))
+
+
+# Stands in for RARLAB's unrar: prints the console output it gives when piped
+FAKE_UNRAR = """#!/usr/bin/env python3
+import sys, time
+archive, dest = sys.argv[-2], sys.argv[-1]
+out = sys.stdout
+out.write("\\nUNRAR 7.00 freeware\\n\\nExtracting from " + archive + "\\n\\n")
+out.write("Extracting  " + dest + "Game/big.pak" + " " * 30)
+for percent in (0, 25, 50, 75, 99):
+    out.write("%3d%%\\b\\b\\b\\b" % percent)
+    out.flush()
+    time.sleep(0.3)
+out.write("    \\b\\b\\b\\b  OK \\n")
+out.write("Extracting  " + dest + "Game/readme.txt" + " " * 27 + "  OK \\n")
+out.write("All OK\\n")
+"""
+
+
+@unittest.skipIf(sys.platform == "win32", "Runs a script as the unrar binary")
+class RarProgressTests(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="qd-test-rar-")
+        self.addCleanup(shutil.rmtree, self.root, True)
+        bin_dir = os.path.join(self.root, "bin")
+        os.makedirs(bin_dir)
+        with open(os.path.join(bin_dir, "unrar"), "w") as f:
+            f.write(FAKE_UNRAR)
+        os.chmod(os.path.join(bin_dir, "unrar"), 0o755)
+        path = os.environ["PATH"]
+        os.environ["PATH"] = bin_dir + os.pathsep + path
+        self.addCleanup(os.environ.__setitem__, "PATH", path)
+
+    def test_bytes_follow_each_members_progress(self):
+        downloader = Q.RobustDownloader("Test Game", False, False, False, False, "1", "1 MB", self.root)
+        index = Q.ArchiveIndex("game.rar", [Q.ArchiveEntry("Game/big.pak", 1000, None, False),
+                                            Q.ArchiveEntry("Game/readme.txt", 10, None, False)])
+        downloader._progress_lock = threading.RLock()
+        downloader._files_extracted_count = downloader._bytes_extracted = 0
+        downloader._total_files_to_extract = 2
+        seen = []
+        downloader._update_extraction_progress = lambda current_file, files_extracted, total_files, force=False: \
+            seen.append((downloader._bytes_extracted, files_extracted))
+        downloader._extract_rar(os.path.join(self.root, "game.rar"), index)
+
+        self.assertIn((250, 0), seen)  # Part of big.pak, before unrar called it OK
+        self.assertIn((750, 0), seen)
+        self.assertNotIn(1000, [b for b, files in seen if files == 0][:1])  # Not all of it up front
+        self.assertEqual(seen[-1], (1010, 2))
+        self.assertEqual(downloader._files_extracted_count, 2)
+
+class DaemonTests(ServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.daemon = Q.DownloadDaemon()
+        thread = threading.Thread(target=self.daemon.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 10)
+        self.addCleanup(self.daemon._handle_request, {"token": self.daemon.token, "cmd": "shutdown"}, None)
+
+    def request(self, cmd: str, **fields) -> list:
+        """Send one command and collect every line the daemon answers with."""
+        with socket.create_connection(("127.0.0.1", self.daemon.port), timeout=30) as sock:
+            sock.sendall((json.dumps({"token": self.daemon.token, "cmd": cmd, **fields}) + "\n").encode())
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile() as f:
+                return [json.loads(line) for line in f]
+
+    def test_watch_ends_when_no_jobs_are_active(self):
+        replies = self.request("watch")
+        self.assertEqual(replies, [{"ok": True, "jobs": []}])
+
+    def test_cancelled_job_is_recorded_as_stopped(self):
+        with open(os.path.join(self.served, "game.bin"), "wb") as f:
+            f.write(os.urandom(8 * 1024 * 1024))
+        self.server.chunk_delay = 0.2  # Keep the transfer running long enough to cancel it
+        job = self.request("submit", args=[self.url("game.bin"), "Test Game", "false", "false", "false",
+                                           "false", "1", "8 MB", self.install])[0]["job"]
+        deadline = time.time() + 30
+        while not self.server.gets and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self.request("cancel", job=job), [{"ok": True}])
+
+        replies = self.request("watch")  # Returns once the job has wound down
+        self.assertEqual([j["state"] for j in replies[-1]["jobs"]], ["cancelled"])
+        self.assertIsNone(replies[-1]["jobs"][0]["error"])
+        with open(os.path.join(self.install, "Test Game", "Test Game.QuadDown.json")) as f:
+            self.assertEqual(json.load(f)["downloadingData"], {"stopped": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -72,6 +72,48 @@ def safe_write_json(filepath, data):
         if temp_file_path and os.path.exists(temp_file_path):
             os.remove(temp_file_path)
 
+# Copy of ProgressStream from QuadDownDownloader/src/QuadDownCommon.py, kept
+# byte-identical; this binary is built from its own folder and can't import it
+class ProgressStream:
+    """
+    Opt-in NDJSON progress events on stdout, one compact JSON object per line.
+    
+    While enabled, console logging and prints move to stderr so stdout only
+    carries events, and callers skip writing progress into game_info (phase
+    changes and completion are still written). If the reader goes away the
+    stream disables itself and callers fall back to the JSON file.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self._out = None
+        self._lock = threading.Lock()
+    
+    def enable(self):
+        self._out = sys.stdout
+        sys.stdout = sys.stderr
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler) and handler.stream is self._out:
+                handler.setStream(sys.stderr)
+        self.enabled = True
+    
+    def emit(self, event: str, **fields) -> bool:
+        """Write one event; False if streaming is off or the reader is gone."""
+        if not self.enabled:
+            return False
+        line = json.dumps({"event": event, **fields}, separators=(',', ':'))
+        with self._lock:
+            try:
+                self._out.write(line + "\n")
+                self._out.flush()
+                return True
+            except (OSError, ValueError) as e:
+                self.enabled = False
+                logging.warning(f"[ProgressStream] Progress reader went away, falling back to game_info: {e}")
+                return False
+
+progress_stream = ProgressStream()
+
 def handleerror(game_info, game_info_path, e):
     game_info['online'] = ""
     game_info['dlc'] = ""
@@ -83,6 +125,7 @@ def handleerror(game_info, game_info_path, e):
         "message": str(e)
     }
     safe_write_json(game_info_path, game_info)
+    progress_stream.emit("error", message=str(e))
 
 def setup_logging():
     log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
@@ -218,6 +261,7 @@ class TorrentManager:
         try:
             # Create the JSON file right before adding the torrent
             safe_write_json(game_info_path, game_info)
+            progress_stream.emit("phase", phase="downloading")
             
             # Wait for qBittorrent connection if not ready
             if self.connect_thread and self.connect_thread.is_alive():
@@ -268,13 +312,18 @@ class TorrentManager:
                     "timeUntilComplete": f"{int(eta_seconds)}s"
                 })
                 
-                safe_write_json(game_info_path, game_info)
+                streamed = progress_stream.emit(
+                    "progress", phase="downloading", bytesDone=torrent.completed, totalBytes=torrent.size,
+                    percent=round(progress, 2), rate=torrent.dlspeed, eta=int(eta_seconds))
+                if not streamed:
+                    safe_write_json(game_info_path, game_info)
                 time.sleep(1)
             
             # Download complete, now find and run setup
             game_info["downloadingData"]["downloading"] = False
             game_info["downloadingData"]["extracting"] = True
             safe_write_json(game_info_path, game_info)
+            progress_stream.emit("phase", phase="extracting")
             logging.info(f"Download complete for {game}, starting extraction")
             if self.notification_theme:
                 _launch_notification(self.notification_theme, "Download Complete", f"Download complete for {game}, starting installation")
@@ -302,7 +351,8 @@ class TorrentManager:
             while process.poll() is None:
                 time.sleep(1)
                 game_info["downloadingData"]["extracting"] = True
-                safe_write_json(game_info_path, game_info)
+                if not progress_stream.emit("phase", phase="extracting"):
+                    safe_write_json(game_info_path, game_info)
 
             if process.returncode != 0:
                 raise Exception(f"Setup failed with code {process.returncode}")
@@ -312,6 +362,7 @@ class TorrentManager:
             del game_info["downloadingData"]
             game_info["executable"] = os.path.join(install_dir, f"{game}.exe")
             safe_write_json(game_info_path, game_info)
+            progress_stream.emit("done")
             logging.info(f"Installation complete for game: {game}")
             if self.notification_theme:
                 _launch_notification(self.notification_theme, "Installation Complete", f"Successfully installed {game}")
@@ -344,6 +395,7 @@ def main():
     parser.add_argument("size", help="Download size")
     parser.add_argument("dir", help="Download directory")
     parser.add_argument("--withNotification", help="Theme name for notifications (e.g. light, dark, blue)", default=None)
+    parser.add_argument("--progressStream", action="store_true", help="Write NDJSON progress events to stdout")
     
     try:
         if len(sys.argv) == 1:  # No arguments provided
@@ -354,6 +406,8 @@ def main():
             sys.exit(1)
             
         args = parser.parse_args()
+        if args.progressStream:
+            progress_stream.enable()
         logging.info(f"Starting torrent process for game: {args.game}")
         logging.debug(f"Arguments: magnet={args.magnet}, online={args.online}, dlc={args.dlc}, "
                      f"version={args.version}, size={args.size}, dir={args.dir}, "
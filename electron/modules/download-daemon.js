@@ -0,0 +1,241 @@
+/**
+ * Download Daemon Module
+ * Client for the downloader's --daemon mode, where one long-lived
+ * QuadDownDownloader process runs every direct download as a job
+ */
+
+const fs = require("fs");
+const os = require("os");
+const net = require("net");
+const path = require("path");
+const readline = require("readline");
+const { spawn } = require("child_process");
+
+const START_TIMEOUT_MS = 20000;
+const REQUEST_TIMEOUT_MS = 10000;
+const CANCEL_TIMEOUT_MS = 30000;
+// An idle daemon is stopped after this long, so it doesn't outlive its downloads
+const IDLE_SHUTDOWN_MS = 10 * 60 * 1000;
+
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+
+/**
+ * daemon.json is written next to downloadmanager.log by the Python side
+ * @returns {string} - Path to the daemon's port and token file
+ */
+function getDaemonInfoPath() {
+  const base = process.platform.startsWith("win")
+    ? process.env.APPDATA
+    : path.join(os.homedir(), ".config");
+  return path.join(base, "QuadDown by tagoWorks", "daemon.json");
+}
+
+class DownloadDaemonClient {
+  /**
+   * @param {string} infoPath - daemon.json to read the port and token from
+   */
+  constructor(infoPath = getDaemonInfoPath()) {
+    this.infoPath = infoPath;
+    this.jobs = new Map(); // Game -> job id, while the job is queued or running
+    this.watching = false;
+    this.starting = null;
+    this.idleTimer = null;
+  }
+
+  readInfo() {
+    try {
+      return JSON.parse(fs.readFileSync(this.infoPath, "utf8"));
+    } catch (error) {
+      return null;
+    }
+  }
+
+  /**
+   * Send one command and collect the daemon's reply lines
+   * @param {object} info - Port and token from daemon.json
+   * @param {object} payload - The command
+   * @param {function} [onLine] - Called with every line, for streaming commands
+   * @param {number} [timeout] - Idle timeout in ms, 0 for none
+   * @returns {Promise<object>} - The last line
+   */
+  send(info, payload, onLine = null, timeout = REQUEST_TIMEOUT_MS) {
+    return new Promise((resolve, reject) => {
+      const socket = net.createConnection({ host: "127.0.0.1", port: info.port });
+      let last = null;
+      if (timeout) {
+        socket.setTimeout(timeout, () =>
+          socket.destroy(new Error("Download daemon timed out"))
+        );
+      }
+      socket.on("error", reject);
+      socket.on("close", () =>
+        last ? resolve(last) : reject(new Error("Download daemon closed the connection"))
+      );
+      readline
+        .createInterface({ input: socket })
+        .on("error", reject)
+        .on("line", line => {
+          try {
+            last = JSON.parse(line);
+          } catch (error) {
+            return;
+          }
+          if (onLine) onLine(last);
+        });
+      socket.end(JSON.stringify({ ...payload, token: info.token }) + "\n");
+    });
+  }
+
+  async ping(info) {
+    try {
+      return (await this.send(info, { cmd: "status" })).ok === true;
+    } catch (error) {
+      return false;
+    }
+  }
+
+  /**
+   * Connect to the running daemon, starting one if there is none
+   * @param {string} command - Downloader executable, or the Python interpreter
+   * @param {string[]} prefix - Arguments before --daemon (the script, in development)
+   * @returns {Promise<object>} - Port and token
+   */
+  async ensureStarted(command, prefix = []) {
+    const info = this.readInfo();
+    if (info && (await this.ping(info))) return info;
+    if (!this.starting) {
+      this.starting = this.start(command, prefix).finally(() => {
+        this.starting = null;
+      });
+    }
+    return this.starting;
+  }
+
+  async start(command, prefix) {
+    // A daemon that died without cleaning up leaves its file behind
+    fs.rmSync(this.infoPath, { force: true });
+    const args = [...prefix, "--daemon"];
+    console.log(`[DownloadDaemon] Starting ${command} ${args.join(" ")}`);
+    const child = spawn(command, args, {
+      detached: true,
+      stdio: "ignore",
+      windowsHide: true,
+    });
+    let exited = null;
+    child.on("error", error => (exited = error));
+    child.on("exit", code => {
+      exited = new Error(`Download daemon exited with code ${code}`);
+    });
+    child.unref();
+
+    const deadline = Date.now() + START_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      await sleep(250);
+      if (exited) throw exited;
+      const info = this.readInfo();
+      if (info && (await this.ping(info))) return info;
+    }
+    throw new Error("Download daemon did not start in time");
+  }
+
+  /**
+   * Queue a download on the daemon
+   * @param {string} command - Downloader executable, or the Python interpreter
+   * @param {string[]} prefix - Arguments before --daemon (the script, in development)
+   * @param {Array} args - The same arguments the downloader takes on its command line
+   * @param {string} game - Key the job is cancelled by
+   * @returns {Promise<string>} - Job id
+   */
+  async submit(command, prefix, args, game) {
+    const info = await this.ensureStarted(command, prefix);
+    const reply = await this.send(info, { cmd: "submit", args: args.map(String) });
+    if (!reply.ok) throw new Error(reply.error || "Download daemon refused the job");
+    clearTimeout(this.idleTimer);
+    this.jobs.set(game, reply.job);
+    console.log(`[DownloadDaemon] Queued ${game} as job ${reply.job}`);
+    this.watch(info);
+    return reply.job;
+  }
+
+  /**
+   * Follow job states until the daemon has nothing left to run
+   */
+  watch(info) {
+    if (this.watching) return;
+    this.watching = true;
+    this.send(info, { cmd: "watch" }, status => this.update(status), 0)
+      .then(status => this.update(status))
+      .catch(error => console.error(`[DownloadDaemon] Watch ended: ${error.message}`))
+      .finally(() => {
+        this.watching = false;
+        if (this.jobs.size > 0) {
+          this.watch(info); // Something was queued as the last watch ended
+        } else {
+          this.scheduleIdleShutdown(info);
+        }
+      });
+  }
+
+  update(status) {
+    if (!status || !status.jobs) return;
+    const active = new Set(
+      status.jobs
+        .filter(job => job.state === "queued" || job.state === "running")
+        .map(job => job.id)
+    );
+    for (const [game, id] of this.jobs) {
+      if (!active.has(id)) {
+        const job = status.jobs.find(j => j.id === id);
+        console.log(`[DownloadDaemon] Job ${id} (${game}) ${job ? job.state : "gone"}`);
+        this.jobs.delete(game);
+      }
+    }
+  }
+
+  scheduleIdleShutdown(info) {
+    clearTimeout(this.idleTimer);
+    this.idleTimer = setTimeout(() => {
+      if (this.jobs.size === 0 && !this.watching) {
+        this.send(info, { cmd: "shutdown" }).catch(() => {});
+      }
+    }, IDLE_SHUTDOWN_MS);
+    if (this.idleTimer.unref) this.idleTimer.unref();
+  }
+
+  hasJob(game) {
+    return this.jobs.has(game);
+  }
+
+  /**
+   * Cancel a game's job and wait until the daemon has let go of its files
+   * @returns {Promise<boolean>} - False if the daemon had no job for it
+   */
+  async cancel(game) {
+    const id = this.jobs.get(game);
+    const info = this.readInfo();
+    if (!id || !info) return false;
+    const reply = await this.send(info, { cmd: "cancel", job: id });
+    const deadline = Date.now() + CANCEL_TIMEOUT_MS;
+    while (Date.now() < deadline) {
+      const status = await this.send(info, { cmd: "status" });
+      const job = status.jobs && status.jobs.find(j => j.id === id);
+      if (!job || (job.state !== "queued" && job.state !== "running")) break;
+      await sleep(250);
+    }
+    this.jobs.delete(game);
+    return reply.ok === true;
+  }
+}
+
+let client = null;
+
+function getDownloadDaemon() {
+  if (!client) client = new DownloadDaemonClient();
+  return client;
+}
+
+module.exports = {
+  DownloadDaemonClient,
+  getDownloadDaemon,
+  getDaemonInfoPath,
+};
@@ -8,6 +8,7 @@ const path = require("path");
 const axios = require("axios");
 const crypto = require("crypto");
 const { spawn } = require("child_process");
+const readline = require("readline");
 const { ipcMain, BrowserWindow, app } = require("electron");
 const { isDev, isWindows, TIMESTAMP_FILE, appDirectory, imageKey, getPythonPath } = require("./config");
 const {
@@ -17,12 +18,124 @@ const {
   updateTimestampFile,
 } = require("./utils");
 const { getSettingsManager } = require("./settings");
+const { getDownloadDaemon } = require("./download-daemon");
 
 const steamgrid = require("./steamgrid");
 
 const downloadProcesses = new Map();
 const goFileProcesses = new Map();
 const retryDownloadProcesses = new Map();
+// Latest NDJSON progress events per game, when the progressStream setting is on
+const liveProgress = new Map();
+
+/**
+ * Collect NDJSON progress events a downloader writes to stdout
+ */
+function attachProgressStream(downloadProcess, game) {
+  const lines = readline.createInterface({ input: downloadProcess.stdout });
+  lines.on("line", line => {
+    if (!line.startsWith("{")) return;
+    try {
+      const event = JSON.parse(line);
+      const live = liveProgress.get(game) || {};
+      if (event.phase) live.phase = event.phase;
+      live[event.event] = event;
+      liveProgress.set(game, live);
+    } catch (error) {
+      // Ignore partial or non-JSON lines
+    }
+  });
+  downloadProcess.on("exit", () => liveProgress.delete(game));
+}
+
+function formatRate(bytesPerSecond) {
+  const units = ["B/s", "KB/s", "MB/s", "GB/s"];
+  let value = bytesPerSecond || 0;
+  let unit = 0;
+  while (value >= 1024 && unit < units.length - 1) {
+    value /= 1024;
+    unit++;
+  }
+  return `${value.toFixed(2)} ${units[unit]}`;
+}
+
+function formatEta(seconds) {
+  if (seconds < 60) return `${seconds}s`;
+  if (seconds < 3600) return `${Math.floor(seconds / 60)}m ${seconds % 60}s`;
+  return `${Math.floor(seconds / 3600)}h ${Math.floor((seconds % 3600) / 60)}m`;
+}
+
+/**
+ * Overlay streamed progress on the downloadingData read from the game's JSON file
+ */
+function applyLiveProgress(game, downloadingData) {
+  const live = liveProgress.get(game);
+  if (!live) return downloadingData;
+  const merged = { ...downloadingData };
+  if (live.phase === "downloading" && live.progress) {
+    const { percent, rate, eta, totalBytes } = live.progress;
+    merged.progressCompleted = percent.toFixed(2);
+    merged.progressDownloadSpeeds = formatRate(rate);
+    if (totalBytes) merged.timeUntilComplete = formatEta(eta);
+  } else if (live.phase === "extracting" && live.extract) {
+    const { currentFile, filesExtracted, totalFiles, bytesExtracted, totalBytes, percent, rate, eta } =
+      live.extract;
+    // Rate and percent are byte-based whenever the downloader knows the byte total
+    merged.extractionProgress = {
+      currentFile:
+        currentFile.length > 50 ? `${currentFile.slice(0, 50)}...` : currentFile,
+      filesExtracted,
+      totalFiles,
+      bytesExtracted,
+      totalBytes,
+      percentComplete: percent.toFixed(2),
+      extractionSpeed: totalBytes
+        ? formatRate(rate)
+        : `${rate.toFixed(rate >= 1 ? 1 : 2)} files/s`,
+      timeUntilComplete: rate > 0 && eta != null ? formatEta(eta) : "",
+    };
+  }
+  return merged;
+}
+
+/**
+ * --mirror arguments for other hosts of the same archive (only the direct downloader uses them)
+ */
+function mirrorArgs(settings, link, mirrors) {
+  if (settings.gameSource === "fitgirl" || link.includes("gofile.io")) return [];
+  return (mirrors || [])
+    .filter(mirror => mirror && mirror !== link && !mirror.includes("gofile.io"))
+    .flatMap(mirror => ["--mirror", mirror]);
+}
+
+/**
+ * Queue a direct download on the downloader daemon when the downloadDaemon setting is on
+ * @returns {Promise<boolean>} - False if it should run as its own process instead
+ */
+async function submitToDaemon(settings, link, executablePath, spawnCommand, game) {
+  if (
+    !settings.downloadDaemon ||
+    settings.gameSource === "fitgirl" ||
+    link.includes("gofile.io")
+  ) {
+    return false;
+  }
+  // In development the interpreter is the executable and the script comes first
+  const prefix = isDev && !isWindows ? spawnCommand.slice(0, 1) : [];
+  // A job has no stdout of its own, so progress comes from the game's JSON file as usual
+  const args = spawnCommand
+    .slice(prefix.length)
+    .filter(arg => arg !== "--progressStream");
+  try {
+    await getDownloadDaemon().submit(executablePath, prefix, args, game);
+    return true;
+  } catch (error) {
+    console.error(
+      `[DownloadDaemon] Could not queue ${game}, spawning it instead: ${error.message}`
+    );
+    return false;
+  }
+}
 
 /**
  * Register download-related IPC handlers
@@ -79,7 +192,7 @@ function registerDownloadHandlers() {
 
               // Check if this game has active downloadingData
               if (gameData.downloadingData) {
-                const { downloadingData } = gameData;
+                const downloadingData = applyLiveProgress(dir, gameData.downloadingData);
                 const isActive =
                   downloadingData.downloading ||
                   downloadingData.extracting ||
@@ -137,7 +250,9 @@ function registerDownloadHandlers() {
                     eta:
                       downloadingData.extracting &&
                       downloadingData.extractionProgress?.currentFile
-                        ? `Extracting: ${downloadingData.extractionProgress.filesExtracted}/${downloadingData.extractionProgress.totalFiles} files`
+                        ? downloadingData.extractionProgress.timeUntilComplete
+                          ? `${downloadingData.extractionProgress.timeUntilComplete} (${downloadingData.extractionProgress.filesExtracted}/${downloadingData.extractionProgress.totalFiles} files)`
+                          : `Extracting: ${downloadingData.extractionProgress.filesExtracted}/${downloadingData.extractionProgress.totalFiles} files`
                         : downloadingData.timeUntilComplete || "Calculating...",
                     status: downloadingData.paused
                       ? "paused"
@@ -234,7 +349,8 @@ function registerDownloadHandlers() {
       imgID,
       size,
       additionalDirIndex,
-      gameID
+      gameID,
+      mirrors = []
     ) => {
       console.log(
         `Downloading file: ${link}, game: ${game}, online: ${online}, dlc: ${dlc}, isVr: ${isVr}, updateFlow: ${updateFlow}, version: ${version}, size: ${size}, additionalDirIndex: ${additionalDirIndex}, gameID: ${gameID}`
@@ -503,6 +619,10 @@ function registerDownloadHandlers() {
         if (settings.notifications) {
           spawnCommand = spawnCommand.concat(["--withNotification", settings.theme]);
         }
+        if (settings.progressStream) {
+          spawnCommand = spawnCommand.concat(["--progressStream"]);
+        }
+        spawnCommand = spawnCommand.concat(mirrorArgs(settings, link, mirrors));
 
         // Cache download data for resume functionality
         const cacheDir = path.join(app.getPath("userData"), "downloadCache");
@@ -517,6 +637,7 @@ function registerDownloadHandlers() {
           version: version,
           size: size,
           gameID: gameID,
+          mirrors: mirrors || [],
           timestamp: new Date().toISOString(),
         };
         await fs.promises.writeFile(cachedDataPath, JSON.stringify(cacheData, null, 2));
@@ -547,11 +668,20 @@ function registerDownloadHandlers() {
           return;
         }
 
+        if (
+          await submitToDaemon(settings, link, executablePath, spawnCommand, sanitizedGame)
+        ) {
+          return;
+        }
+
         const downloadProcess = spawn(executablePath, spawnCommand, {
           detached: true,
-          stdio: "ignore",
+          stdio: settings.progressStream ? ["ignore", "pipe", "ignore"] : "ignore",
           windowsHide: false,
         });
+        if (settings.progressStream) {
+          attachProgressStream(downloadProcess, sanitizedGame);
+        }
 
         downloadProcess.on("error", err => {
           console.error(`Failed to start download process: ${err}`);
@@ -618,6 +748,17 @@ function registerDownloadHandlers() {
         }
       }
 
+      // A daemon job is cancelled in place; the daemon itself keeps running other jobs
+      const daemon = getDownloadDaemon();
+      if (daemon.hasJob(sanitizedGame)) {
+        try {
+          await daemon.cancel(sanitizedGame);
+          console.log(`Cancelled daemon job for: ${sanitizedGame}`);
+        } catch (daemonError) {
+          console.error(`Error cancelling daemon job: ${daemonError}`);
+        }
+      }
+
       // Step 2: Kill all downloader processes
       let killedProcesses = 0;
 
@@ -1034,6 +1175,7 @@ function registerDownloadHandlers() {
       );
 
       let downloadLink = null;
+      let mirrors = [];
       let online = gameInfo.online || "false";
       let dlc = gameInfo.dlc || "false";
       let isVr = gameInfo.isVr || "false";
@@ -1045,6 +1187,7 @@ function registerDownloadHandlers() {
         try {
           const cachedData = JSON.parse(fs.readFileSync(cachedDataPath, "utf8"));
           downloadLink = cachedData.link;
+          mirrors = cachedData.mirrors || [];
           console.log(`Found cached download link: ${downloadLink}`);
         } catch (cacheError) {
           console.error(`Error reading cached download data: ${cacheError}`);
@@ -1134,6 +1277,10 @@ function registerDownloadHandlers() {
       if (settings.notifications) {
         spawnCommand = spawnCommand.concat(["--withNotification", settings.theme]);
       }
+      if (settings.progressStream) {
+        spawnCommand = spawnCommand.concat(["--progressStream"]);
+      }
+      spawnCommand = spawnCommand.concat(mirrorArgs(settings, downloadLink, mirrors));
 
       // Clear the stopped state from JSON
       gameInfo.downloadingData = {
@@ -1148,12 +1295,28 @@ function registerDownloadHandlers() {
       fs.writeFileSync(jsonFile, JSON.stringify(gameInfo, null, 2));
       console.log(`Cleared stopped state from JSON: ${jsonFile}`);
 
+      if (
+        await submitToDaemon(
+          settings,
+          downloadLink,
+          executablePath,
+          spawnCommand,
+          sanitizedGame
+        )
+      ) {
+        console.log(`Successfully resumed download for: ${sanitizedGame}`);
+        return { success: true };
+      }
+
       // Start the download process
       const downloadProcess = spawn(executablePath, spawnCommand, {
         detached: true,
-        stdio: "ignore",
+        stdio: settings.progressStream ? ["ignore", "pipe", "ignore"] : "ignore",
         windowsHide: false,
       });
+      if (settings.progressStream) {
+        attachProgressStream(downloadProcess, sanitizedGame);
+      }
 
       downloadProcess.on("error", err => {
         console.error(`Failed to start resume process: ${err}`);
@@ -40,6 +40,21 @@ class SettingsManager {
       threadCount: 12,
       singleStream: true,
       downloadLimit: 0,
+      downloadBufferMB: 64,
+      downloadZeroCopy: true,
+      pageCacheFriendly: false,
+      progressWriteIntervalMs: 500,
+      progressStream: false,
+      downloadDaemon: false,
+      maxConcurrentDownloads: 2,
+      maxTotalConnections: 32,
+      stallRateFloorKBps: 32,
+      stallWindowSeconds: 20,
+      streamExtract: false,
+      keepArchive: false,
+      extractionThreads: 0,
+      archiveConcurrency: 2,
+      zipPrevalidate: false,
       sideScrollBar: false,
       excludeFolders: false,
       prioritizeTorboxOverSeamless: false,
@@ -286,7 +286,8 @@ contextBridge.exposeInMainWorld("electron", {
     imgID,
     size,
     additionalDirIndex,
-    gameID
+    gameID,
+    mirrors
   ) =>
     ipcRenderer.invoke(
       "download-file",
@@ -300,7 +301,8 @@ contextBridge.exposeInMainWorld("electron", {
       imgID,
       size,
       additionalDirIndex,
-      gameID
+      gameID,
+      mirrors
     ),
   stopDownload: (game, deleteContents) =>
     ipcRenderer.invoke("stop-download", game, deleteContents),
@@ -4977,6 +4977,8 @@ const BigPictureDownloadCard = ({
                     </p>
                     <span className="text-xs text-muted-foreground">
                       {data.extractionProgress.extractionSpeed}
+                      {data.extractionProgress.timeUntilComplete &&
+                        ` · ${data.extractionProgress.timeUntilComplete}`}
                     </span>
                   </div>
                   <p
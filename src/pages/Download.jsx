@@ -873,6 +873,21 @@ export default function DownloadPage() {
 
     try {
       const isVrGame = gameData.category?.includes("Virtual Reality");
+      // The same release on the other direct hosts; the downloader pulls ranges from all of them.
+      // Only hosts the downloader can resolve to a file URL itself are passed: DataNodes and
+      // VikingFile pages need the browser or TorBox, so they can't be mirrors yet
+      const mirrorProviders = ["buzzheavier", "pixeldrain"];
+      const mirrors = mirrorProviders.includes(selectedProvider)
+        ? mirrorProviders
+            .filter(provider => provider !== selectedProvider)
+            .map(provider =>
+              [].concat(gameData.download_links?.[provider] || []).find(
+                link => link && typeof link === "string"
+              )
+            )
+            .filter(Boolean)
+            .map(link => link.replace(/^(?:https?:)?\/\//, "https://"))
+        : [];
 
       await window.electron.downloadFile(
         urlToUse,
@@ -885,7 +900,8 @@ export default function DownloadPage() {
         gameData.imgID,
         gameData.size || "",
         dir,
-        gameData.gameID || ""
+        gameData.gameID || "",
+        mirrors
       );
 
       // Notify webapp that download started immediately
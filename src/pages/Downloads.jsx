@@ -1929,6 +1929,8 @@ const DownloadCard = ({
                         </p>
                         <span className="text-xs text-muted-foreground">
                           {downloadingData.extractionProgress.extractionSpeed}
+                          {downloadingData.extractionProgress.timeUntilComplete &&
+                            ` · ${downloadingData.extractionProgress.timeUntilComplete}`}
                         </span>
                       </div>
                       <p